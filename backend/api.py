@@ -1,11 +1,16 @@
-from fastapi import FastAPI
+import json
+import os
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Import your awesome agents!
-from market_agent import get_market_requirements, analyze_skill_gaps
-from roadmap_agent import generate_30_day_roadmap
+from market_agent import get_market_requirements_async, analyze_skill_gaps_async, warmup, skill_extraction_metrics, llm_cache_metrics, coalescing_metrics
+from roadmap_agent import generate_30_day_roadmap_async, stream_30_day_roadmap, profile_skills, llm as roadmap_llm
+from jobs import create_job_queue, resolve_input_paths
+import concurrency
 
 app = FastAPI(title="Career Co-Pilot API")
 
@@ -24,18 +29,67 @@ class ProfileRequest(BaseModel):
     time_commitment: str
     user_profile: Dict[str, Any] # This is the JSON your friend parsed from the resume/github
 
+# A background job: "roadmap" takes the ProfileRequest fields, "analysis" runs
+# the full career_navigator pipeline on resume / GitHub / LinkedIn inputs first
+# (resume_path and linkedin_path are relative to JOB_INPUT_DIR)
+class JobRequest(BaseModel):
+    kind: str = "roadmap"
+    priority: int = 0 # Higher runs first
+    dream_role: Optional[str] = None
+    time_commitment: Optional[str] = None
+    user_profile: Optional[Dict[str, Any]] = None
+    resume_path: Optional[str] = None
+    github_username: Optional[str] = None
+    linkedin_path: Optional[str] = None
+    dream_job: Optional[str] = None
+    candidate_id: Optional[str] = None
+
+# Load the skill extractor when the server starts instead of on the first request
+# (set WARMUP_MODELS=false to keep startup fast, e.g. with --reload)
+@app.on_event("startup")
+def warmup_models():
+    if os.getenv("WARMUP_MODELS", "true").lower() == "true":
+        warmup()
+
+# Background jobs for analyses too long for one HTTP request (JOB_WORKERS threads)
+job_queue = create_job_queue()
+
+@app.on_event("startup")
+def start_job_workers():
+    job_queue.start()
+
+@app.on_event("shutdown")
+def shutdown_executors():
+    job_queue.stop()
+    concurrency.shutdown()
+
+@app.get("/metrics/skill-extraction")
+def skill_extraction_metrics_endpoint():
+    return skill_extraction_metrics()
+
+@app.get("/metrics/llm-cache")
+def llm_cache_metrics_endpoint():
+    return llm_cache_metrics()
+
+@app.get("/metrics/coalescing")
+def coalescing_metrics_endpoint():
+    return {**coalescing_metrics(), "roadmap_llm": roadmap_llm.single_flight.metrics()}
+
 @app.post("/generate-roadmap")
 async def create_roadmap_endpoint(request: ProfileRequest):
     print(f"🚀 Received request for: {request.dream_role}")
     
-    # 1. Market Intelligence
-    market_data = get_market_requirements(request.dream_role)
+    # Every stage is awaited, so the event loop keeps serving other requests
+    # while this one waits on the model or Gemini
+    
+    # 1. Market Intelligence (model inference on the executor)
+    market_data = await get_market_requirements_async(request.dream_role)
     
     # 2. Gap Analysis
-    gaps = analyze_skill_gaps(request.user_profile, market_data)
+    gaps = await analyze_skill_gaps_async(request.user_profile, market_data)
     
     # 3. Roadmap Generation
-    roadmap_json = generate_30_day_roadmap(gaps, request.time_commitment)
+    roadmap_json = await generate_30_day_roadmap_async(gaps, request.time_commitment, profile_skills(request.user_profile))
     
     # Send the whole package back to React!
     return {
@@ -45,4 +99,75 @@ async def create_roadmap_endpoint(request: ProfileRequest):
         "roadmap_plan": roadmap_json
     }
 
+def sse_event(event, data):
+    """One server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post("/generate-roadmap/stream")
+async def stream_roadmap_endpoint(request: ProfileRequest):
+    """Same pipeline as /generate-roadmap, sent as server-sent events while it runs:
+    market_requirements, gap_analysis, one roadmap_week per week as the LLM writes
+    it, then complete with the exact /generate-roadmap response (or error)."""
+    print(f"🚀 Received streaming request for: {request.dream_role}")
+    
+    async def events():
+        try:
+            market_data = await get_market_requirements_async(request.dream_role)
+            yield sse_event("market_requirements", market_data)
+            
+            gaps = await analyze_skill_gaps_async(request.user_profile, market_data)
+            yield sse_event("gap_analysis", gaps)
+            
+            roadmap_json = None
+            async for kind, data in stream_30_day_roadmap(gaps, request.time_commitment, profile_skills(request.user_profile)):
+                if kind == "week":
+                    yield sse_event("roadmap_week", data)
+                else:
+                    roadmap_json = data
+            
+            yield sse_event("complete", {
+                "status": "success",
+                "market_requirements": market_data,
+                "gap_analysis": gaps,
+                "roadmap_plan": roadmap_json
+            })
+        except Exception as e:
+            yield sse_event("error", {"status": "error", "message": f"{type(e).__name__}: {e}"})
+    
+    # Tell proxies (e.g. nginx) not to buffer, or the events arrive all at once
+    return StreamingResponse(events(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    })
+
+@app.post("/jobs", status_code=202)
+def create_job_endpoint(request: JobRequest):
+    payload = {name: value for name, value in request.__dict__.items() if name not in ("kind", "priority") and value is not None}
+    if request.kind == "roadmap" and not (request.dream_role and request.user_profile):
+        raise HTTPException(status_code=422, detail="roadmap jobs need dream_role and user_profile")
+    try:
+        resolve_input_paths(payload)
+        job_id = job_queue.submit(request.kind, payload, priority=request.priority)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"job_id": job_id, "status": "queued", "status_url": f"/jobs/{job_id}"}
+
+@app.get("/jobs/{job_id}")
+def get_job_endpoint(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/jobs")
+def list_jobs_endpoint(status: Optional[str] = None, limit: int = 50):
+    return {"jobs": job_queue.list(status, limit), "metrics": job_queue.metrics()}
+
+@app.delete("/jobs/{job_id}")
+def cancel_job_endpoint(job_id: str):
+    job = job_queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
 # Run the server with: uvicorn api:app --reload
\ No newline at end of file
@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from skill_engines import ENGINES, build_skill_extractor
+
+# Compare the skill extractor's inference engines on the local job descriptions
+# in data/job_descriptions.json: load time, latency, memory, and how closely
+# each engine reproduces the fp32 pipeline's skills.
+#
+# Run with: python benchmark_skill_extractor.py [--engines int8 onnx] [--repeats 5]
+
+MODEL = os.getenv("SKILL_MODEL", "jjzha/jobbert_skill_extraction")
+REVISION = os.getenv("SKILL_MODEL_REVISION", "main")
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "job_descriptions.json")
+
+def rss_mb():
+    """Resident memory of this process (Linux /proc), in MB."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def run_engine(engine, repeats):
+    """Benchmark one engine in this process and return its numbers and skills."""
+    with open(FIXTURES, "r") as file:
+        descriptions = json.load(file)
+
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    extractor = build_skill_extractor(MODEL, revision=REVISION, engine=engine)
+    load_seconds = time.perf_counter() - start
+    extractor(descriptions[0])  # warm up
+
+    latencies, skills = [], []
+    for description in descriptions:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            entities = extractor(description)
+            latencies.append((time.perf_counter() - start) * 1000)
+        skills.append(sorted({ent['word'].strip().lower() for ent in entities}))
+
+    rss_after = rss_mb()
+    return {
+        "engine": engine,
+        "load_seconds": round(load_seconds, 2),
+        "mean_ms": round(statistics.mean(latencies), 2),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(sorted(latencies)[int(len(latencies) * 0.95) - 1], 2),
+        "model_memory_mb": round(rss_after - rss_before, 1) if rss_before and rss_after else None,
+        "skills": skills,
+    }
+
+def agreement(reference, candidate):
+    """Micro precision / recall / F1 of candidate skills against the fp32 skills."""
+    true_positives = predicted = expected = exact = 0
+    for ref, cand in zip(reference, candidate):
+        ref, cand = set(ref), set(cand)
+        true_positives += len(ref & cand)
+        predicted += len(cand)
+        expected += len(ref)
+        exact += ref == cand
+    precision = true_positives / predicted if predicted else 1.0
+    recall = true_positives / expected if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "precision": round(precision, 3),
+        "recall": round(recall, 3),
+        "f1": round(f1, 3),
+        "identical_descriptions": f"{exact}/{len(reference)}",
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill extractor inference engines against fp32")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--single", choices=ENGINES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_engine(args.single, args.repeats)))
+        return
+
+    # Each engine runs in a fresh process, so load time and memory are not
+    # skewed by models loaded earlier
+    engines = ["pytorch"] + [engine for engine in args.engines if engine != "pytorch"]
+    results = {}
+    for engine in engines:
+        print(f"Benchmarking {engine}...")
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--single", engine, "--repeats", str(args.repeats)],
+            capture_output=True, text=True
+        )
+        if output.returncode != 0:
+            print(f"  ❌ {engine} failed: {output.stderr.strip().splitlines()[-1] if output.stderr.strip() else 'no output'}")
+            continue
+        results[engine] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    reference = results.get("pytorch")
+    print(f"\n{'engine':<10} {'load s':>7} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7} {'mem MB':>7} {'speedup':>8} {'F1 vs fp32':>11}")
+    for engine, result in results.items():
+        speedup = f"{reference['mean_ms'] / result['mean_ms']:.2f}x" if reference else "-"
+        scores = agreement(reference["skills"], result["skills"]) if reference else {"f1": "-"}
+        result["agreement"] = scores
+        print(f"{engine:<10} {result['load_seconds']:>7} {result['mean_ms']:>8} {result['p50_ms']:>7} "
+              f"{result['p95_ms']:>7} {str(result['model_memory_mb']):>7} {speedup:>8} {str(scores['f1']):>11}")
+
+    for engine, result in results.items():
+        if engine != "pytorch" and reference:
+            print(f"\n{engine}: {json.dumps(result['agreement'])}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import json
+import os
+
+from roadmap_planner import parse_weekly_hours, plan_roadmap
+
+# Table-driven checks of the local roadmap planner (no model or API key needed).
+#
+#   python check_roadmap_planner.py
+
+PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "mock_profile.json")
+
+# time_commitment -> hours/week (10.0 is the default when no amount of time is given)
+WEEKLY_HOURS = [
+    ("10 hours/week", 10.0),
+    ("15 hours/week", 15.0),
+    ("8-12 hrs per week", 10.0),
+    ("10 h / week", 10.0),
+    ("about 6 hours weekly", 6.0),
+    ("2h a day", 14.0),
+    ("1.5 hrs every day", 10.5),
+    ("30 min a day", 3.5),
+    ("30 minutes daily", 3.5),
+    ("40 hours a month", 9.2),
+    # Day counts multiply the hours per day, and are never hours themselves
+    ("5 days a week, 2 hours each", 10.0),
+    ("2 hours a day, 5 days a week", 10.0),
+    ("3-4 days a week, 1 hour per day", 3.5),
+    ("3 days a week", 10.0),
+    ("2 months", 10.0),
+    ("", 10.0),
+    ("whenever I can", 10.0),
+]
+
+def check_weekly_hours():
+    failures = [(text, expected, parse_weekly_hours(text)) for text, expected in WEEKLY_HOURS
+                if parse_weekly_hours(text) != expected]
+    for text, expected, actual in failures:
+        print(f"❌ parse_weekly_hours({text!r}) = {actual}, expected {expected}")
+    return not failures
+
+def check_known_skills():
+    """The mock profile knows React, Node.js and SQL, so JavaScript and SQL are never scheduled."""
+    with open(PROFILE_PATH, "r") as file:
+        known = json.load(file)["skills"]["technical_skills"]
+    plan = plan_roadmap(["Kubernetes", "TypeScript", "PostgreSQL"], ["Docker"], "10 hours/week", known_skills=known)
+    scheduled = {skill for week in plan["roadmap"] for skill in week["focus_skills"]}
+    ok = True
+    for skill in ("JavaScript", "SQL", "Linux"):
+        if skill in scheduled:
+            print(f"❌ {skill} is scheduled although the profile already covers it")
+            ok = False
+    for skill in ("Kubernetes", "TypeScript", "PostgreSQL"):
+        if skill not in scheduled:
+            print(f"❌ critical skill {skill} is missing from the plan")
+            ok = False
+    if "Not enough time" in plan["adaptability_note"]:
+        print(f"❌ skills deferred: {plan['adaptability_note']}")
+        ok = False
+    return ok
+
+if __name__ == "__main__":
+    results = {"weekly hours": check_weekly_hours(), "known skills": check_known_skills()}
+    for name, ok in results.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    raise SystemExit(0 if all(results.values()) else 1)
@@ -0,0 +1,47 @@
+import asyncio
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+# Blocking model inference runs on this bounded thread pool, never on the
+# event loop (PyTorch / ONNX Runtime release the GIL while they compute)
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", 2))
+
+# How many requests may be inside each pipeline stage at once; the rest wait
+# their turn without blocking the event loop
+STAGE_LIMITS = {
+    "market": int(os.getenv("MARKET_CONCURRENCY", INFERENCE_WORKERS)),
+    "gap_analysis": int(os.getenv("GAP_ANALYSIS_CONCURRENCY", 8)),
+    "roadmap": int(os.getenv("ROADMAP_CONCURRENCY", 8)),
+}
+
+_inference_executor = None
+_stage_semaphores = weakref.WeakKeyDictionary()  # event loop -> {stage: semaphore}
+
+
+def inference_executor():
+    global _inference_executor
+    if _inference_executor is None:
+        _inference_executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="inference")
+    return _inference_executor
+
+
+def stage_limit(stage):
+    """Semaphore bounding concurrent requests in a pipeline stage (one per event loop)."""
+    semaphores = _stage_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if stage not in semaphores:
+        semaphores[stage] = asyncio.Semaphore(STAGE_LIMITS[stage])
+    return semaphores[stage]
+
+
+async def run_blocking(function, *args):
+    """Run a blocking call on the inference pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(inference_executor(), function, *args)
+
+
+def shutdown():
+    global _inference_executor
+    if _inference_executor is not None:
+        _inference_executor.shutdown(wait=False, cancel_futures=True)
+        _inference_executor = None
@@ -0,0 +1,295 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", os.path.join(CACHE_DIR, "jobs.sqlite3"))
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+# Running jobs are stamped by their process every JOB_HEARTBEAT_SECONDS; one
+# without a stamp for JOB_STALE_SECONDS lost its process and is queued again
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", 5))
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", 30))
+
+STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when it has been cancelled."""
+
+
+class JobContext:
+    """Handed to a running job: report stage progress and check for cancellation."""
+
+    def __init__(self, queue, job_id):
+        self.queue = queue
+        self.job_id = job_id
+        self.partial = {}
+
+    def report(self, stage, result=None):
+        """Mark the start of stage (result=None) or store its result as a partial result."""
+        if result is not None:
+            self.partial[stage] = result
+        self.queue._update(self.job_id, stage=stage, partial=json.dumps(self.partial))
+        self.check_cancelled()
+
+    def check_cancelled(self):
+        if self.queue.cancel_requested(self.job_id):
+            raise JobCancelled(self.job_id)
+
+
+class JobQueue:
+    """SQLite-backed priority job queue with a local worker thread pool.
+
+    Jobs are rows in a SQLite table, so they survive restarts and need no
+    broker, and several processes (uvicorn --workers N) can share one
+    database. Each running job records its owner queue and a heartbeat;
+    only jobs whose heartbeat went stale (their process died) are queued
+    again, never the live jobs of another process. Workers take the highest
+    priority job first (FIFO within a priority). Handlers are plain functions handler(payload, context)
+    registered per job kind; they report stages through the context, which
+    is also where cancellation is noticed -- a queued job is cancelled at
+    once, a running one at its next stage boundary.
+    """
+
+    def __init__(self, path=JOB_DB_PATH, workers=JOB_WORKERS,
+                 heartbeat_seconds=JOB_HEARTBEAT_SECONDS, stale_seconds=JOB_STALE_SECONDS):
+        self.path = path
+        self.workers = workers
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_seconds = stale_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._active = set()  # ids of the jobs this queue's workers are running
+        self._heartbeat = None
+        self.handlers = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._threads = []
+        self._stopping = False
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                payload TEXT,
+                stage TEXT,
+                partial TEXT,
+                result TEXT,
+                error TEXT,
+                cancel_requested INTEGER NOT NULL DEFAULT 0,
+                created_at REAL,
+                started_at REAL,
+                finished_at REAL,
+                owner TEXT,
+                heartbeat_at REAL
+            )
+        """)
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("owner", "TEXT"), ("heartbeat_at", "REAL")):
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, priority DESC, created_at)")
+        self._db.commit()
+        with self._lock:
+            self._reclaim_stale()
+
+    def register(self, kind, handler):
+        self.handlers[kind] = handler
+
+    def submit(self, kind, payload, priority=0):
+        """Queue a job and return its id."""
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind '{kind}', use one of: {', '.join(sorted(self.handlers))}")
+        job_id = uuid.uuid4().hex
+        with self._wakeup:
+            self._db.execute(
+                "INSERT INTO jobs (id, kind, status, priority, payload, partial, created_at) "
+                "VALUES (?, ?, 'queued', ?, ?, '{}', ?)",
+                (job_id, kind, priority, json.dumps(payload), time.time())
+            )
+            self._db.commit()
+            self._wakeup.notify()
+        return job_id
+
+    def get(self, job_id):
+        """Status, stage, partial results and final output of a job (None if unknown)."""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            position = None
+            if row["status"] == "queued":
+                position = self._db.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND "
+                    "(priority > ? OR (priority = ? AND created_at < ?))",
+                    (row["priority"], row["priority"], row["created_at"])
+                ).fetchone()[0]
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "priority": row["priority"],
+            "queue_position": position,
+            "stage": row["stage"],
+            "partial_results": json.loads(row["partial"] or "{}"),
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "cancel_requested": bool(row["cancel_requested"]),
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+        }
+
+    def list(self, status=None, limit=50):
+        with self._lock:
+            if status:
+                rows = self._db.execute(
+                    "SELECT id FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?", (status, limit)
+                ).fetchall()
+            else:
+                rows = self._db.execute("SELECT id FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [self.get(row["id"]) for row in rows]
+
+    def cancel(self, job_id):
+        """Cancel a job: queued jobs stop at once, running ones at their next stage.
+
+        Returns the job's new state, or None if there is no such job.
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id)
+            )
+            self._db.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+            self._db.commit()
+        return self.get(job_id)
+
+    def cancel_requested(self, job_id):
+        with self._lock:
+            row = self._db.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def _update(self, job_id, **fields):
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+            self._db.commit()
+
+    def _finish(self, job_id, **fields):
+        """Store a job's outcome, unless it was reclaimed from this queue in the meantime."""
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._db.execute(
+                f"UPDATE jobs SET {columns} WHERE id = ? AND owner = ?", (*fields.values(), job_id, self.owner)
+            )
+            self._db.commit()
+            self._active.discard(job_id)
+
+    def _claim(self):
+        """Atomically move the next queued job to running (caller holds the lock)."""
+        row = self._db.execute(
+            "SELECT id, kind, payload FROM jobs WHERE status = 'queued' "
+            "ORDER BY priority DESC, created_at LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        claimed = self._db.execute(
+            "UPDATE jobs SET status = 'running', started_at = ?, owner = ?, heartbeat_at = ? "
+            "WHERE id = ? AND status = 'queued'",
+            (now, self.owner, now, row["id"])
+        ).rowcount
+        self._db.commit()
+        if not claimed:
+            return None
+        self._active.add(row["id"])
+        return row
+
+    def _reclaim_stale(self):
+        """Queue again the running jobs whose owner stopped heartbeating (caller holds the lock)."""
+        reclaimed = self._db.execute(
+            "UPDATE jobs SET status = 'queued', stage = NULL, started_at = NULL, owner = NULL, heartbeat_at = NULL "
+            "WHERE status = 'running' AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+            (time.time() - self.stale_seconds,)
+        ).rowcount
+        self._db.commit()
+        return reclaimed
+
+    def _beat(self):
+        """Stamp this queue's running jobs and reclaim other processes' stale ones."""
+        while True:
+            with self._wakeup:
+                if self._stopping and not self._active:
+                    self._heartbeat = None
+                    return
+                self._db.execute(
+                    "UPDATE jobs SET heartbeat_at = ? WHERE status = 'running' AND owner = ?",
+                    (time.time(), self.owner)
+                )
+                self._db.commit()
+                if self._reclaim_stale():
+                    self._wakeup.notify_all()
+            time.sleep(self.heartbeat_seconds)
+
+    def _worker(self):
+        while True:
+            with self._wakeup:
+                job = None
+                while not self._stopping:
+                    job = self._claim()
+                    if job is not None:
+                        break
+                    # Timeout also picks up jobs queued by other processes
+                    self._wakeup.wait(timeout=1.0)
+                if self._stopping:
+                    return
+            self._run(job)
+
+    def _run(self, job):
+        job_id = job["id"]
+        context = JobContext(self, job_id)
+        try:
+            result = self.handlers[job["kind"]](json.loads(job["payload"]), context)
+            self._finish(job_id, status="succeeded", stage="done", result=json.dumps(result), finished_at=time.time())
+        except JobCancelled:
+            self._finish(job_id, status="cancelled", finished_at=time.time())
+        except Exception as e:
+            traceback.print_exc()
+            self._finish(job_id, status="failed", error=f"{type(e).__name__}: {e}", finished_at=time.time())
+
+    def start(self):
+        """Start the worker threads."""
+        with self._lock:
+            self._stopping = False
+            if self._heartbeat is None:
+                self._heartbeat = threading.Thread(target=self._beat, name="job-heartbeat", daemon=True)
+                self._heartbeat.start()
+        for index in range(self.workers - len(self._threads)):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, wait=False):
+        """Stop taking new jobs; running jobs finish in the background (or are awaited)."""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+    def metrics(self):
+        with self._lock:
+            counts = dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return {"workers": self.workers, **{status: counts.get(status, 0) for status in STATUSES}}
@@ -0,0 +1,109 @@
+import os
+import sys
+import threading
+from job_queue import JobQueue, JOB_DB_PATH, JOB_WORKERS
+from market_agent import get_market_requirements, analyze_skill_gaps
+from roadmap_agent import generate_30_day_roadmap, profile_skills
+
+# Job kinds served by POST /jobs:
+#   roadmap  - the three agents for a ready-made profile
+#              payload: dream_role, time_commitment, user_profile
+#   analysis - a full CareerNavigator analysis (resume / GitHub / LinkedIn /
+#              dream job), followed by the agents when dream_role is given
+#              payload: resume_path, github_username, linkedin_path, dream_job,
+#                       dream_role, time_commitment
+#              resume_path / linkedin_path name files inside JOB_INPUT_DIR
+
+CAREER_NAVIGATOR_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "career_navigator")
+
+# Jobs come from unauthenticated clients, so they may only read input files
+# from this directory (copy or upload resumes and LinkedIn PDFs into it)
+JOB_INPUT_DIR = os.getenv("JOB_INPUT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "inputs"))
+INPUT_PATH_FIELDS = ("resume_path", "linkedin_path")
+
+# One CareerNavigator per worker thread (built on its first analysis job)
+_navigators = threading.local()
+
+def _career_navigator():
+    if getattr(_navigators, "navigator", None) is None:
+        if CAREER_NAVIGATOR_DIR not in sys.path:
+            sys.path.append(CAREER_NAVIGATOR_DIR)
+        from main import CareerNavigator
+
+        _navigators.navigator = CareerNavigator()
+    return _navigators.navigator
+
+def resolve_input_path(path, input_dir=None):
+    """Absolute path of an input file under JOB_INPUT_DIR; ValueError if it points anywhere else."""
+    root = os.path.realpath(input_dir or JOB_INPUT_DIR)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root or resolved == root:
+        raise ValueError(f"Input files must be inside the job input directory, got '{path}'")
+    return resolved
+
+def resolve_input_paths(payload):
+    """The payload with its input file paths resolved by resolve_input_path."""
+    return {
+        name: resolve_input_path(value) if name in INPUT_PATH_FIELDS and value else value
+        for name, value in payload.items()
+    }
+
+def _run_agents(user_profile, dream_role, time_commitment, context):
+    context.report("market_requirements")
+    market_data = get_market_requirements(dream_role)
+    context.report("market_requirements", market_data)
+
+    context.report("gap_analysis")
+    gaps = analyze_skill_gaps(user_profile, market_data)
+    context.report("gap_analysis", gaps)
+
+    context.report("roadmap")
+    roadmap_json = generate_30_day_roadmap(gaps, time_commitment, profile_skills(user_profile))
+    context.report("roadmap", roadmap_json)
+
+    # Same shape as the /generate-roadmap response
+    return {
+        "status": "success",
+        "market_requirements": market_data,
+        "gap_analysis": gaps,
+        "roadmap_plan": roadmap_json
+    }
+
+def run_roadmap_job(payload, context):
+    return _run_agents(
+        payload["user_profile"],
+        payload["dream_role"],
+        payload.get("time_commitment") or "10 hours/week",
+        context
+    )
+
+def run_analysis_job(payload, context):
+    # Checked again here, for jobs queued before the check or by other callers
+    payload = resolve_input_paths(payload)
+    context.report("career_analysis")
+    analysis = _career_navigator().run(
+        resume_path=payload.get("resume_path"),
+        github_username=payload.get("github_username"),
+        linkedin_path=payload.get("linkedin_path"),
+        dream_job=payload.get("dream_job"),
+        save_outputs=False,
+        candidate_id=payload.get("candidate_id")
+    )
+    context.report("career_analysis", analysis)
+
+    result = {"career_analysis": analysis}
+    if payload.get("dream_role"):
+        result.update(_run_agents(
+            analysis["profile"],
+            payload["dream_role"],
+            payload.get("time_commitment") or "10 hours/week",
+            context
+        ))
+    return result
+
+def create_job_queue(path=None, workers=None):
+    """JobQueue with the roadmap and analysis handlers registered (not started)."""
+    queue = JobQueue(path or JOB_DB_PATH, workers or JOB_WORKERS)
+    queue.register("roadmap", run_roadmap_job)
+    queue.register("analysis", run_analysis_job)
+    return queue
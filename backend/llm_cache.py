@@ -0,0 +1,261 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from single_flight import SingleFlight
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(CACHE_DIR, "llm_responses.sqlite3"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 5000))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+
+
+def canonical_skills(skills):
+    """De-duplicated, case-insensitively sorted skill list (order in the profile doesn't matter)."""
+    unique = {skill.strip(): None for skill in skills if skill and skill.strip()}
+    return sorted(unique, key=lambda skill: (skill.lower(), skill))
+
+
+class LLMResponseCache:
+    """SQLite cache of LLM responses keyed by the canonicalized request.
+
+    The key is a hash of the model name, the prompt template name + version
+    and the (already canonicalized) template parameters, so bumping a
+    template version invalidates its entries. Only responses that parse as
+    JSON are stored, entries expire after ttl seconds, and the least recently
+    used entries are dropped beyond max_entries.
+    """
+
+    def __init__(self, path=LLM_CACHE_PATH, ttl=LLM_CACHE_TTL, max_entries=LLM_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "stored": 0, "rejected": 0, "evicted": 0}
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                template TEXT,
+                response TEXT,
+                created_at REAL,
+                last_access REAL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(model, template, version, params):
+        payload = json.dumps(
+            {"model": model, "template": template, "version": version, "params": params},
+            sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return a fresh cached response text, or None."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            if now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.stats["hits"] += 1
+            return row[0]
+
+    def put(self, key, text, model=None, template=None):
+        """Store a response if it is valid JSON; returns whether it was stored."""
+        try:
+            json.loads(text.strip())
+        except (TypeError, ValueError):
+            with self._lock:
+                self.stats["rejected"] += 1
+            return False
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, template, response, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, template, text, now, now)
+            )
+            self.stats["stored"] += 1
+
+            count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            if count > self.max_entries:
+                evicted = self._db.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_access LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+                self.stats["evicted"] += evicted
+            self._db.commit()
+        return True
+
+    def purge_expired(self):
+        with self._lock:
+            removed = self._db.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            self._db.commit()
+        return removed
+
+    def metrics(self):
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": entries,
+                "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+
+class CachedLLM:
+    """A GenAI client (anything with .models.generate_content) behind an LLMResponseCache."""
+
+    def __init__(self, client, cache=None):
+        self.client = client
+        self.cache = cache
+        # Identical async requests in flight at the same time share one LLM call
+        self.single_flight = SingleFlight("llm")
+
+    def generate_text(self, model, prompt, template, version, params):
+        """Response text for prompt, which must be fully determined by (template, version, params)."""
+        if self.cache is None:
+            return self.client.models.generate_content(model=model, contents=prompt).text
+
+        key = LLMResponseCache.make_key(model, template, version, params)
+        text = self.cache.get(key)
+        if text is None:
+            text = self.client.models.generate_content(model=model, contents=prompt).text
+            self.cache.put(key, text, model=model, template=f"{template}@{version}")
+        return text
+
+    async def _cache_get_async(self, key):
+        # SQLite reads, writes and commits go to a worker thread (not the
+        # inference pool), so cache I/O never blocks the event loop
+        return await asyncio.to_thread(self.cache.get, key) if self.cache is not None else None
+
+    async def _cache_put_async(self, key, text, model, template, version):
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put, key, text, model=model, template=f"{template}@{version}")
+
+    async def generate_text_async(self, model, prompt, template, version, params, limit=None):
+        """generate_text with the async GenAI client (client.aio), for use on an event loop.
+
+        Concurrent calls for the same request are coalesced into one LLM call.
+        limit (e.g. an asyncio.Semaphore) is held only around that call, so
+        coalesced callers don't take up a slot.
+        """
+        key = LLMResponseCache.make_key(model, template, version, params)
+        text = await self._cache_get_async(key)
+        if text is None:
+            text = await self.single_flight.do(key, self._generate_async, key, model, prompt, template, version, limit)
+        return text
+
+    async def _generate_async(self, key, model, prompt, template, version, limit):
+        if limit is None:
+            text = (await self.client.aio.models.generate_content(model=model, contents=prompt)).text
+        else:
+            async with limit:
+                text = (await self.client.aio.models.generate_content(model=model, contents=prompt)).text
+        await self._cache_put_async(key, text, model, template, version)
+        return text
+
+    async def stream_text_async(self, model, prompt, template, version, params):
+        """Yield the response text as it streams in (all at once on a cache hit)."""
+        key = LLMResponseCache.make_key(model, template, version, params)
+        text = await self._cache_get_async(key)
+        if text is not None:
+            yield text
+            return
+
+        pieces = []
+        async for chunk in await self.client.aio.models.generate_content_stream(model=model, contents=prompt):
+            if chunk.text:
+                pieces.append(chunk.text)
+                yield chunk.text
+        await self._cache_put_async(key, "".join(pieces), model, template, version)
+
+
+class StandInClient:
+    """Local stand-in for genai.Client: answers from a function of the prompt.
+
+    Use it to run the agents offline or in tests, e.g.
+    CachedLLM(StandInClient(lambda prompt: '{"roadmap": []}')). delay
+    simulates model latency (slept on sync calls, awaited on client.aio).
+    """
+
+    class _Response:
+        def __init__(self, text):
+            self.text = text
+
+    class _Models:
+        def __init__(self, respond, delay):
+            self.respond = respond
+            self.delay = delay
+            self.calls = 0
+
+        def generate_content(self, model, contents):
+            self.calls += 1
+            time.sleep(self.delay)
+            return StandInClient._Response(self.respond(contents))
+
+    class _AsyncModels(_Models):
+        async def generate_content(self, model, contents):
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            return StandInClient._Response(self.respond(contents))
+
+        async def generate_content_stream(self, model, contents, chunk_chars=40):
+            self.calls += 1
+            text = self.respond(contents)
+            pieces = [text[i:i + chunk_chars] for i in range(0, len(text), chunk_chars)] or [""]
+
+            async def stream():
+                for piece in pieces:
+                    await asyncio.sleep(self.delay / len(pieces))
+                    yield StandInClient._Response(piece)
+            return stream()
+
+    class _Aio:
+        def __init__(self, models):
+            self.models = models
+
+    def __init__(self, respond, delay=0.0):
+        self.models = StandInClient._Models(respond, delay)
+        self.aio = StandInClient._Aio(StandInClient._AsyncModels(respond, delay))
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_cache():
+    """The process-wide response cache (None when LLM_CACHE_ENABLED=false)."""
+    global _shared_cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache()
+        return _shared_cache
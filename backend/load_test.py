@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+import urllib.request
+
+# Fire concurrent /generate-roadmap requests and show whether they overlap.
+#
+#   python load_test.py --url http://localhost:8000 --requests 8
+#       against a running server (uvicorn api:app)
+#   python load_test.py --local --requests 8
+#       in process, with stand-ins for the skill model and Gemini that only
+#       sleep, so the pipeline's concurrency is measured without any model
+#
+# If requests serialize, wall time ~= the sum of request latencies; when they
+# overlap, wall time approaches a single request's latency.
+
+PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "mock_profile.json")
+
+def build_request(index):
+    with open(PROFILE_PATH, "r") as file:
+        user_profile = json.load(file)
+    return {
+        # Distinct roles and commitments, so no request is answered from a cache
+        "dream_role": f"Load Test Role {index}",
+        "time_commitment": f"{10 + index} hours/week",
+        "user_profile": user_profile,
+    }
+
+def run_http(url, count):
+    timings = [None] * count
+
+    def send(index):
+        body = json.dumps(build_request(index)).encode("utf-8")
+        request = urllib.request.Request(f"{url}/generate-roadmap", data=body, headers={"Content-Type": "application/json"})
+        start = time.perf_counter()
+        with urllib.request.urlopen(request) as response:
+            response.read()
+        timings[index] = (start, time.perf_counter())
+
+    threads = [threading.Thread(target=send, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return timings
+
+def run_local(count, model_seconds, llm_seconds):
+    import market_agent
+    import roadmap_agent
+    from llm_cache import StandInClient
+
+    def fake_extract(job_description):
+        time.sleep(model_seconds)  # blocking, like real inference
+        return ["React", "Node.js", "SQL", "Docker", "AWS"]
+
+    market_agent.extract_skills = fake_extract
+    gap_json = json.dumps({"validated_strengths": ["React"], "critical_missing_skills": ["Docker", "AWS"], "skills_to_upgrade": ["SQL"]})
+    market_agent.llm.client = StandInClient(lambda prompt: gap_json, delay=llm_seconds)
+    market_agent.llm.cache = None
+    roadmap_agent.llm.client = StandInClient(lambda prompt: json.dumps({"roadmap": [], "adaptability_note": ""}), delay=llm_seconds)
+    roadmap_agent.llm.cache = None
+
+    async def one(index):
+        request = build_request(index)
+        start = time.perf_counter()
+        market_data = await market_agent.get_market_requirements_async(request["dream_role"])
+        gaps = await market_agent.analyze_skill_gaps_async(request["user_profile"], market_data)
+        await roadmap_agent.generate_30_day_roadmap_async(gaps, request["time_commitment"], roadmap_agent.profile_skills(request["user_profile"]))
+        return start, time.perf_counter()
+
+    async def all_requests():
+        return await asyncio.gather(*(one(i) for i in range(count)))
+
+    return asyncio.run(all_requests())
+
+def report(timings):
+    first = min(start for start, _ in timings)
+    wall = max(end for _, end in timings) - first
+    latencies = [end - start for start, end in timings]
+
+    # Most requests in flight at the same moment
+    events = sorted([(start, 1) for start, _ in timings] + [(end, -1) for _, end in timings])
+    in_flight = peak = 0
+    for _, change in events:
+        in_flight += change
+        peak = max(peak, in_flight)
+
+    print("\nrequest   start s   end s   latency s")
+    for index, (start, end) in enumerate(timings):
+        print(f"{index:>7} {start - first:>9.2f} {end - first:>7.2f} {end - start:>11.2f}")
+    print(f"\nwall time: {wall:.2f}s, sum of latencies: {sum(latencies):.2f}s")
+    print(f"overlap factor: {sum(latencies) / wall:.2f}x (1.0x = fully serialized), peak in flight: {peak}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for /generate-roadmap")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=8)
+    parser.add_argument("--local", action="store_true", help="run the async pipeline in process with stand-in models")
+    parser.add_argument("--model-seconds", type=float, default=0.3, help="stand-in skill model latency (--local)")
+    parser.add_argument("--llm-seconds", type=float, default=1.0, help="stand-in Gemini latency (--local)")
+    args = parser.parse_args()
+
+    if args.local:
+        timings = run_local(args.requests, args.model_seconds, args.llm_seconds)
+    else:
+        timings = run_http(args.url.rstrip("/"), args.requests)
+    report(timings)
+
+if __name__ == "__main__":
+    main()
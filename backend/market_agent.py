@@ -1,20 +1,170 @@
 import json
-import pandas as pd
-from transformers import pipeline
-from google import genai
 import os
+import threading
+import time
+from google import genai
 from dotenv import load_dotenv
+from skill_cache import SkillExtractionCache
+from skill_engines import build_skill_extractor
+from skill_batching import chunk_spans, merge_entities, length_buckets
+from llm_cache import CachedLLM, canonical_skills, shared_cache
+from concurrency import run_blocking, stage_limit
+from single_flight import SingleFlight
 
 # 1. Setup API Keys and Models using the NEW Google GenAI SDK
 load_dotenv()
 client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
 
-print("Loading Hugging Face skill extractor... (This takes a few seconds)")
-skill_extractor = pipeline(
-    "token-classification", 
-    model="jjzha/jobbert_skill_extraction", 
-    aggregation_strategy="simple"
-)
+# LLM calls go through the shared response cache. Bump a *_PROMPT_VERSION
+# whenever its prompt text changes so old cached answers are not reused.
+llm = CachedLLM(client, shared_cache())
+GAP_PROMPT_VERSION = "gap-analysis-v1"
+
+# Skill extractor settings. Pin SKILL_MODEL_REVISION to a commit hash so the
+# cache key changes whenever the model weights do.
+SKILL_MODEL = os.getenv("SKILL_MODEL", "jjzha/jobbert_skill_extraction")
+SKILL_MODEL_REVISION = os.getenv("SKILL_MODEL_REVISION", "main")
+# pytorch (fp32), int8, onnx or onnx-int8 -- see skill_engines.py
+SKILL_INFERENCE_ENGINE = os.getenv("SKILL_INFERENCE_ENGINE", "pytorch")
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+SKILL_CACHE_DIR = os.getenv("SKILL_CACHE_DIR", os.path.join(CACHE_DIR, "skills"))
+SKILL_CACHE_SIZE = int(os.getenv("SKILL_CACHE_SIZE", 1024))
+SKILL_CACHE_DISK_ENTRIES = int(os.getenv("SKILL_CACHE_DISK_ENTRIES", 50000))
+SKILL_ONNX_DIR = os.getenv("SKILL_ONNX_DIR", os.path.join(CACHE_DIR, "onnx", SKILL_MODEL.replace("/", "--"), SKILL_MODEL_REVISION))
+# Batch extraction: inputs per forward pass, window size in tokens (the
+# model takes 512 with special tokens), window overlap, and how many
+# descriptions are buffered and length-sorted at a time
+SKILL_BATCH_SIZE = int(os.getenv("SKILL_BATCH_SIZE", 16))
+SKILL_CHUNK_TOKENS = int(os.getenv("SKILL_CHUNK_TOKENS", 400))
+SKILL_CHUNK_STRIDE = int(os.getenv("SKILL_CHUNK_STRIDE", 64))
+SKILL_BATCH_WINDOW = int(os.getenv("SKILL_BATCH_WINDOW", 512))
+
+skill_cache = SkillExtractionCache(SKILL_CACHE_DIR, max_entries=SKILL_CACHE_SIZE,
+                                   max_disk_entries=SKILL_CACHE_DISK_ENTRIES)
+
+# The pipeline is built on first use (or by warmup()), not at import time
+_skill_extractor = None
+_skill_extractor_lock = threading.Lock()
+extractor_metrics = {"loaded": False, "load_seconds": None, "inference_calls": 0, "inference_seconds": 0.0}
+# Extraction runs on executor and job queue threads; guards extractor_metrics
+_metrics_lock = threading.Lock()
+
+def get_skill_extractor():
+    """Return the Hugging Face skill extractor, loading it once on first call."""
+    global _skill_extractor
+    if _skill_extractor is None:
+        with _skill_extractor_lock:
+            if _skill_extractor is None:
+                print(f"Loading Hugging Face skill extractor ({SKILL_INFERENCE_ENGINE})... (This takes a few seconds)")
+                start = time.perf_counter()
+                _skill_extractor = build_skill_extractor(
+                    SKILL_MODEL,
+                    revision=SKILL_MODEL_REVISION,
+                    engine=SKILL_INFERENCE_ENGINE,
+                    export_dir=SKILL_ONNX_DIR
+                )
+                with _metrics_lock:
+                    extractor_metrics["loaded"] = True
+                    extractor_metrics["load_seconds"] = round(time.perf_counter() - start, 3)
+    return _skill_extractor
+
+def warmup():
+    """Load the skill extractor ahead of the first request (e.g. at API startup)."""
+    get_skill_extractor()
+
+def _skill_cache_key(job_description):
+    # Quantized engines can extract slightly different skills, so they get their own entries
+    return SkillExtractionCache.make_key(job_description, SKILL_MODEL, f"{SKILL_MODEL_REVISION}+{SKILL_INFERENCE_ENGINE}")
+
+def extract_skills(job_description):
+    """Skills mentioned in a job description, served from cache when seen before."""
+    return _extract_window([job_description], batch_size=1)[0]
+
+def _extract_window(descriptions, batch_size):
+    """Skills of a list of descriptions, running the model only on cache misses."""
+    results = [None] * len(descriptions)
+    pending = {}  # cache key -> indexes of descriptions with that key
+    for index, description in enumerate(descriptions):
+        key = _skill_cache_key(description)
+        if key in pending:
+            pending[key].append(index)
+            continue
+        results[index] = skill_cache.get(key)
+        if results[index] is None:
+            pending[key] = [index]
+    if not pending:
+        return results
+    
+    # Cut long descriptions into overlapping token windows
+    extractor = get_skill_extractor()
+    chunks = []  # (key, chunk start offset, chunk text)
+    for key, indexes in pending.items():
+        text = descriptions[indexes[0]]
+        for start, end in chunk_spans(extractor.tokenizer, text, SKILL_CHUNK_TOKENS, SKILL_CHUNK_STRIDE):
+            chunks.append((key, start, text[start:end]))
+    
+    # Run similar-length chunks together so batches carry little padding
+    found = {key: [] for key in pending}
+    start_time = time.perf_counter()
+    for bucket in length_buckets(chunks, batch_size, length=lambda chunk: len(chunk[2])):
+        outputs = extractor([chunk[2] for chunk in bucket], batch_size=batch_size)
+        for (key, chunk_start, _), entities in zip(bucket, outputs):
+            found[key].append((chunk_start, entities))
+    with _metrics_lock:
+        extractor_metrics["inference_calls"] += len(chunks)
+        extractor_metrics["inference_seconds"] += time.perf_counter() - start_time
+    
+    for key, indexes in pending.items():
+        # De-duplicate, keeping first-seen order so results are stable
+        skills = list(dict.fromkeys(merge_entities(found[key])))
+        skill_cache.put(key, skills, SKILL_MODEL, f"{SKILL_MODEL_REVISION}+{SKILL_INFERENCE_ENGINE}")
+        for index in indexes:
+            results[index] = list(skills)
+    return results
+
+def extract_skills_batch(job_descriptions, batch_size=None, window=None):
+    """Skills of many job descriptions, yielded in input order.
+    
+    Descriptions are read window at a time, so any iterable (e.g. a file of
+    postings) can be streamed. Within a window, cached descriptions are
+    answered directly and the rest are chunked on token boundaries, sorted
+    into length buckets and run through the pipeline batch_size at a time.
+    Skills straddling a chunk edge are merged back into one.
+    """
+    batch_size = batch_size or SKILL_BATCH_SIZE
+    window = window or SKILL_BATCH_WINDOW
+    
+    buffer = []
+    for description in job_descriptions:
+        buffer.append(description)
+        if len(buffer) >= window:
+            yield from _extract_window(buffer, batch_size)
+            buffer = []
+    if buffer:
+        yield from _extract_window(buffer, batch_size)
+
+def skill_extraction_metrics():
+    """Cache hit rates and model load / inference timings."""
+    with _metrics_lock:
+        extractor = dict(extractor_metrics)
+    return {
+        "model": SKILL_MODEL,
+        "revision": SKILL_MODEL_REVISION,
+        "engine": SKILL_INFERENCE_ENGINE,
+        "cache": skill_cache.metrics(),
+        "extractor": {**extractor, "inference_seconds": round(extractor["inference_seconds"], 3)},
+    }
+
+def coalescing_metrics():
+    """How many concurrent calls were served by another call's in-flight work."""
+    return {
+        "market_requirements": market_single_flight.metrics(),
+        "gap_analysis_llm": llm.single_flight.metrics(),
+    }
+
+def llm_cache_metrics():
+    """Hit rate and size of the LLM response cache."""
+    return llm.cache.metrics() if llm.cache is not None else {"enabled": False}
 
 def get_market_requirements(dream_role):
     """MARKET INTELLIGENCE AGENT: Extracts required skills from job postings."""
@@ -28,27 +178,24 @@ def get_market_requirements(dream_role):
     and System Design is strictly required. Agile methodology is a plus.
     """
     
-    # Extract entities using NLP
-    extracted_entities = skill_extractor(mock_job_description)
-    market_skills = list(set([ent['word'].strip() for ent in extracted_entities]))
+    market_skills = extract_skills(mock_job_description)
     
     return {
         "dream_role": dream_role,
         "market_required_skills": market_skills
     }
 
-def analyze_skill_gaps(user_profile_json, market_requirements_dict):
-    """GAP ANALYSIS CRITIC: Compares user JSON against Market Intelligence."""
-    print("[Agent 2] Running Gap Analysis Critic...")
-    
-    # Extract data from the local JSON file
-    user_tech_skills = user_profile_json.get("skills", {}).get("technical_skills", [])
-    user_soft_skills = user_profile_json.get("skills", {}).get("soft_skills", [])
+def _gap_analysis_request(user_profile_json, market_requirements_dict):
+    """Prompt and cache parameters of the gap analysis LLM call."""
+    # Extract data from the local JSON file (skills sorted, so the same
+    # skills in any order make the same prompt and cache key)
+    user_tech_skills = canonical_skills(user_profile_json.get("skills", {}).get("technical_skills", []))
+    user_soft_skills = canonical_skills(user_profile_json.get("skills", {}).get("soft_skills", []))
     current_role = user_profile_json.get("personal_info", {}).get("current_role", "Unknown")
     
     # Extract data from your Market Agent
     dream_role = market_requirements_dict.get("dream_role", "Target Role")
-    market_skills = market_requirements_dict.get("market_required_skills", [])
+    market_skills = canonical_skills(market_requirements_dict.get("market_required_skills", []))
     
     # Prompt the LLM to find the gaps
     prompt = f"""
@@ -70,16 +217,62 @@ def analyze_skill_gaps(user_profile_json, market_requirements_dict):
     Do not include markdown blocks like ```json.
     """
     
-    # Use the new client generation method
-    response = client.models.generate_content(
+    params = {
+        "current_role": current_role,
+        "dream_role": dream_role,
+        "technical_skills": user_tech_skills,
+        "soft_skills": user_soft_skills,
+        "market_skills": market_skills,
+    }
+    return prompt, params
+
+def _parse_gap_analysis(response_text):
+    try:
+        return json.loads(response_text.strip())
+    except json.JSONDecodeError:
+        return {"error": "Failed to parse JSON. Check LLM output.", "raw_output": response_text}
+
+def analyze_skill_gaps(user_profile_json, market_requirements_dict):
+    """GAP ANALYSIS CRITIC: Compares user JSON against Market Intelligence."""
+    print("[Agent 2] Running Gap Analysis Critic...")
+    prompt, params = _gap_analysis_request(user_profile_json, market_requirements_dict)
+    
+    # Use the new client generation method (answered from cache for identical inputs)
+    response_text = llm.generate_text(
         model='gemini-2.5-flash',
-        contents=prompt
+        prompt=prompt,
+        template="gap_analysis",
+        version=GAP_PROMPT_VERSION,
+        params=params
     )
+    return _parse_gap_analysis(response_text)
+
+# Concurrent requests for the same dream role share one market lookup
+market_single_flight = SingleFlight("market")
+
+async def _market_requirements_on_executor(dream_role):
+    async with stage_limit("market"):
+        return await run_blocking(get_market_requirements, dream_role)
+
+async def get_market_requirements_async(dream_role):
+    """get_market_requirements without blocking the event loop (inference runs on the executor)."""
+    key = " ".join(dream_role.split())
+    return await market_single_flight.do(key, _market_requirements_on_executor, dream_role)
+
+async def analyze_skill_gaps_async(user_profile_json, market_requirements_dict):
+    """analyze_skill_gaps with the async GenAI client."""
+    print("[Agent 2] Running Gap Analysis Critic...")
+    prompt, params = _gap_analysis_request(user_profile_json, market_requirements_dict)
     
-    try:
-        return json.loads(response.text.strip())
-    except json.JSONDecodeError:
-        return {"error": "Failed to parse JSON. Check LLM output.", "raw_output": response.text}
+    response_text = await llm.generate_text_async(
+        model='gemini-2.5-flash',
+        prompt=prompt,
+        template="gap_analysis",
+        version=GAP_PROMPT_VERSION,
+        params=params,
+        limit=stage_limit("gap_analysis")
+    )
+    return _parse_gap_analysis(response_text)
 
 # --- TEST EXECUTION ---
 if __name__ == "__main__":
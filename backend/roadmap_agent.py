@@ -1,30 +1,41 @@
 import json
+import re
 from google import genai
 import os
 from dotenv import load_dotenv
 from market_agent import get_market_requirements, analyze_skill_gaps
+from llm_cache import CachedLLM, canonical_skills, shared_cache
+from concurrency import stage_limit
+from roadmap_planner import plan_roadmap
 
 # Load API Key
 load_dotenv()
 client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
 
-def generate_30_day_roadmap(gap_analysis_json, time_commitment="10 hours/week"):
-    """
-    ROADMAP PLANNER AGENT
-    Takes the gap analysis JSON and generates a 30-day learning path as JSON.
-    """
-    print("\n[Agent 3] Generating 30-Day Vibe-Check Roadmap...")
-    
-    critical_skills = gap_analysis_json.get("critical_missing_skills", [])
-    upgrade_skills = gap_analysis_json.get("skills_to_upgrade", [])
+# Shares the response cache with the gap analysis agent
+llm = CachedLLM(client, shared_cache())
+ROADMAP_PROMPT_VERSION = "roadmap-v1"
+ROADMAP_ENRICH_PROMPT_VERSION = "roadmap-enrich-v1"
+
+# "local": plan deterministically from the skill prerequisite graph (the LLM
+# only rewrites the wording, if ROADMAP_LLM_ENRICH is on); "llm": let Gemini
+# write the whole plan
+ROADMAP_ENGINE = os.getenv("ROADMAP_ENGINE", "local")
+ROADMAP_LLM_ENRICH = os.getenv("ROADMAP_LLM_ENRICH", "false").lower() == "true"
+ENRICHED_FIELDS = ("theme", "actionable_task", "resource_suggestion", "vibe_check")
+
+def _roadmap_request(gap_analysis_json, time_commitment):
+    """Prompt and cache parameters of the roadmap LLM call (None if nothing is missing)."""
+    critical_skills = canonical_skills(gap_analysis_json.get("critical_missing_skills", []))
+    upgrade_skills = canonical_skills(gap_analysis_json.get("skills_to_upgrade", []))
     target_skills = critical_skills + upgrade_skills
     
     if not target_skills:
-        return {"message": "You already have all the required skills for this role!"}
+        return None
 
     prompt = f"""
     You are an expert Career AI Co-pilot. The user needs to learn these skills: {', '.join(target_skills)}.
-    They can commit {time_commitment}.
+    They can commit {time_commitment.strip()}.
     
     Create a highly actionable 30-day learning roadmap. 
     
@@ -46,15 +57,255 @@ def generate_30_day_roadmap(gap_analysis_json, time_commitment="10 hours/week"):
     }}
     """
     
-    response = client.models.generate_content(
-        model='gemini-2.5-flash',
-        contents=prompt
+    params = {
+        "critical_skills": critical_skills,
+        "upgrade_skills": upgrade_skills,
+        "time_commitment": time_commitment.strip(),
+    }
+    return prompt, params
+
+def profile_skills(user_profile_json):
+    """The profile's technical skills, which the local planner treats as known."""
+    return canonical_skills((user_profile_json or {}).get("skills", {}).get("technical_skills", []))
+
+def _local_roadmap(gap_analysis_json, time_commitment, known_skills=()):
+    """The prerequisite graph planner's roadmap (None if nothing is missing)."""
+    critical_skills = canonical_skills(gap_analysis_json.get("critical_missing_skills", []))
+    upgrade_skills = canonical_skills(gap_analysis_json.get("skills_to_upgrade", []))
+    if not critical_skills and not upgrade_skills:
+        return None
+    return plan_roadmap(
+        critical_skills,
+        upgrade_skills,
+        time_commitment,
+        known_skills=list(gap_analysis_json.get("validated_strengths", [])) + list(known_skills)
     )
+
+def _enrich_request(plan):
+    """Prompt and cache parameters asking the LLM to reword a planned roadmap."""
+    prompt = f"""
+    You are an expert Career AI Co-pilot. Here is a 30-day learning roadmap as JSON:
+    {json.dumps(plan)}
     
+    Rewrite the "theme", "actionable_task", "resource_suggestion" and "vibe_check" of
+    every week, and the "adaptability_note", to be more specific and motivating.
+    Keep the same weeks in the same order and do NOT change "week" or "focus_skills".
+    
+    Output ONLY the raw JSON object in the same structure (do not include markdown blocks like ```json).
+    """
+    return prompt, {"plan": plan}
+
+def _merge_enrichment(plan, response_text):
+    """The plan with the LLM's rewritten text fields; anything unusable keeps the planner's text."""
+    try:
+        enriched = json.loads(response_text.strip())
+    except json.JSONDecodeError:
+        enriched = None
+    if not isinstance(enriched, dict) or not isinstance(enriched.get("roadmap"), list):
+        print("⚠️ Could not parse the roadmap enrichment, keeping the planned text")
+        return plan
+    
+    roadmap = []
+    for index, week in enumerate(plan["roadmap"]):
+        week = dict(week)
+        enriched_week = enriched["roadmap"][index] if index < len(enriched["roadmap"]) else None
+        if isinstance(enriched_week, dict):
+            for field in ENRICHED_FIELDS:
+                if isinstance(enriched_week.get(field), str) and enriched_week[field].strip():
+                    week[field] = enriched_week[field].strip()
+        roadmap.append(week)
+    note = enriched.get("adaptability_note")
+    return {
+        "roadmap": roadmap,
+        "adaptability_note": note.strip() if isinstance(note, str) and note.strip() else plan["adaptability_note"]
+    }
+
+def _enrich_roadmap(plan):
+    prompt, params = _enrich_request(plan)
     try:
-        return json.loads(response.text.strip())
+        response_text = llm.generate_text(
+            model='gemini-2.5-flash',
+            prompt=prompt,
+            template="roadmap-enrich",
+            version=ROADMAP_ENRICH_PROMPT_VERSION,
+            params=params
+        )
+    except Exception as e:
+        print(f"⚠️ Roadmap enrichment failed, keeping the planned text: {e}")
+        return plan
+    return _merge_enrichment(plan, response_text)
+
+async def _enrich_roadmap_async(plan):
+    prompt, params = _enrich_request(plan)
+    try:
+        response_text = await llm.generate_text_async(
+            model='gemini-2.5-flash',
+            prompt=prompt,
+            template="roadmap-enrich",
+            version=ROADMAP_ENRICH_PROMPT_VERSION,
+            params=params,
+            limit=stage_limit("roadmap")
+        )
+    except Exception as e:
+        print(f"⚠️ Roadmap enrichment failed, keeping the planned text: {e}")
+        return plan
+    return _merge_enrichment(plan, response_text)
+
+def _parse_roadmap(response_text):
+    try:
+        return json.loads(response_text.strip())
     except json.JSONDecodeError:
-        return {"error": "Failed to parse Roadmap JSON", "raw": response.text}
+        return {"error": "Failed to parse Roadmap JSON", "raw": response_text}
+
+def generate_30_day_roadmap(gap_analysis_json, time_commitment="10 hours/week", known_skills=()):
+    """
+    ROADMAP PLANNER AGENT
+    Takes the gap analysis JSON and generates a 30-day learning path as JSON.
+    known_skills (usually profile_skills(user_profile)) are never scheduled,
+    nor are their prerequisites.
+    """
+    print("\n[Agent 3] Generating 30-Day Vibe-Check Roadmap...")
+    
+    if ROADMAP_ENGINE == "local":
+        plan = _local_roadmap(gap_analysis_json, time_commitment, known_skills)
+        if plan is None:
+            return {"message": "You already have all the required skills for this role!"}
+        return _enrich_roadmap(plan) if ROADMAP_LLM_ENRICH else plan
+    
+    request = _roadmap_request(gap_analysis_json, time_commitment)
+    if request is None:
+        return {"message": "You already have all the required skills for this role!"}
+    prompt, params = request
+    
+    response_text = llm.generate_text(
+        model='gemini-2.5-flash',
+        prompt=prompt,
+        template="roadmap",
+        version=ROADMAP_PROMPT_VERSION,
+        params=params
+    )
+    return _parse_roadmap(response_text)
+
+async def generate_30_day_roadmap_async(gap_analysis_json, time_commitment="10 hours/week", known_skills=()):
+    """generate_30_day_roadmap with the async GenAI client."""
+    print("\n[Agent 3] Generating 30-Day Vibe-Check Roadmap...")
+    
+    if ROADMAP_ENGINE == "local":
+        plan = _local_roadmap(gap_analysis_json, time_commitment, known_skills)
+        if plan is None:
+            return {"message": "You already have all the required skills for this role!"}
+        return await _enrich_roadmap_async(plan) if ROADMAP_LLM_ENRICH else plan
+    
+    request = _roadmap_request(gap_analysis_json, time_commitment)
+    if request is None:
+        return {"message": "You already have all the required skills for this role!"}
+    prompt, params = request
+    
+    response_text = await llm.generate_text_async(
+        model='gemini-2.5-flash',
+        prompt=prompt,
+        template="roadmap",
+        version=ROADMAP_PROMPT_VERSION,
+        params=params,
+        limit=stage_limit("roadmap")
+    )
+    return _parse_roadmap(response_text)
+class RoadmapWeekParser:
+    """Pull each finished week object out of the roadmap JSON while it streams in.
+
+    feed() takes the next piece of LLM text and returns the week dicts that
+    were completed by it. Only brace depth and string state are tracked,
+    so a week is emitted as soon as its closing brace arrives.
+    """
+
+    ARRAY_START = re.compile(r'"roadmap"\s*:\s*\[')
+
+    def __init__(self):
+        self.buffer = ""
+        self.position = None   # next character to scan, once the array is found
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.item_start = None
+        self.done = False
+
+    def feed(self, text):
+        self.buffer += text
+        if self.position is None:
+            match = self.ARRAY_START.search(self.buffer)
+            if not match:
+                return []
+            self.position = match.end()
+
+        weeks = []
+        while self.position < len(self.buffer) and not self.done:
+            char = self.buffer[self.position]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                if self.depth == 0 and char == "{":
+                    self.item_start = self.position
+                self.depth += 1
+            elif char in "}]":
+                if self.depth == 0:
+                    self.done = True   # end of the roadmap array
+                else:
+                    self.depth -= 1
+                    if self.depth == 0 and self.item_start is not None:
+                        try:
+                            weeks.append(json.loads(self.buffer[self.item_start:self.position + 1]))
+                        except json.JSONDecodeError:
+                            pass
+                        self.item_start = None
+            self.position += 1
+        return weeks
+
+async def stream_30_day_roadmap(gap_analysis_json, time_commitment="10 hours/week", known_skills=()):
+    """generate_30_day_roadmap as an async stream of ("week", week) events as the LLM
+    writes them, ending with ("roadmap", result) where result is exactly what
+    generate_30_day_roadmap would return. The local planner's weeks all arrive at once."""
+    print("\n[Agent 3] Streaming 30-Day Vibe-Check Roadmap...")
+    
+    if ROADMAP_ENGINE == "local":
+        plan = _local_roadmap(gap_analysis_json, time_commitment, known_skills)
+        if plan is None:
+            yield "roadmap", {"message": "You already have all the required skills for this role!"}
+            return
+        if ROADMAP_LLM_ENRICH:
+            plan = await _enrich_roadmap_async(plan)
+        for week in plan["roadmap"]:
+            yield "week", week
+        yield "roadmap", plan
+        return
+    
+    request = _roadmap_request(gap_analysis_json, time_commitment)
+    if request is None:
+        yield "roadmap", {"message": "You already have all the required skills for this role!"}
+        return
+    prompt, params = request
+    
+    parser = RoadmapWeekParser()
+    pieces = []
+    async with stage_limit("roadmap"):
+        async for text in llm.stream_text_async(
+            model='gemini-2.5-flash',
+            prompt=prompt,
+            template="roadmap",
+            version=ROADMAP_PROMPT_VERSION,
+            params=params
+        ):
+            pieces.append(text)
+            for week in parser.feed(text):
+                yield "week", week
+    yield "roadmap", _parse_roadmap("".join(pieces))
+
 # --- FULL PIPELINE EXECUTION ---
 if __name__ == "__main__":
     
@@ -71,7 +322,7 @@ if __name__ == "__main__":
     gaps = analyze_skill_gaps(user_profile, market_data)
     
     # 4. Run the Roadmap Planner
-    final_roadmap = generate_30_day_roadmap(gaps, time_commitment="15 hours/week")
+    final_roadmap = generate_30_day_roadmap(gaps, time_commitment="15 hours/week", known_skills=profile_skills(user_profile))
     
     print("\n=======================================================")
     print("🚀 FINAL 30-DAY ADAPTIVE ROADMAP GENERATED")
@@ -0,0 +1,289 @@
+import heapq
+import json
+import os
+import re
+
+# Prerequisite DAG over the Config.TECH_SKILLS names: per skill its category,
+# estimated hours to a working level, prerequisites and a learning resource
+PREREQUISITES_PATH = os.getenv(
+    "SKILL_PREREQUISITES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skill_prerequisites.json")
+)
+
+WEEKS = 4
+DEFAULT_WEEKLY_HOURS = 10.0
+DEFAULT_SKILL_HOURS = 10      # skills missing from the graph
+UPGRADE_HOURS_FACTOR = 0.5    # a skill to upgrade is already partly known
+
+# Per category: what to do with a skill, and how to prove it was learned
+TASKS = {
+    "language": "work through the core syntax and write three small programs that use it",
+    "fundamentals": "solve 10-15 practice problems and write down the pattern behind each",
+    "frontend": "build a small responsive page or component and deploy it",
+    "backend": "build a small CRUD API with validation and error handling",
+    "database": "design a schema for a sample dataset and write the queries an app would need",
+    "data science": "analyze a public Kaggle dataset end to end in a notebook",
+    "machine learning": "train and evaluate a model on a public dataset, comparing it with a baseline",
+    "mlops": "package a trained model behind an API and automate its build",
+    "data engineering": "build a small pipeline that ingests, transforms and stores a public dataset",
+    "devops": "automate the build and run of a demo app with it",
+    "cloud": "deploy a demo app on the free tier and tear it down with a script",
+    "testing": "add tests to one of your existing projects and run them in CI",
+    "tool": "use it in your daily workflow on a real project",
+    "process": "run a one-week mini sprint for a personal project with it",
+    "general": "complete a guided tutorial and build a small demo with it",
+}
+VIBE_CHECKS = {
+    "language": "Push the programs to GitHub with a README explaining one language feature you found tricky.",
+    "fundamentals": "Explain your solutions out loud in a 5-minute mock interview without notes.",
+    "frontend": "Share a live link; it has to work on both mobile and desktop.",
+    "backend": "Hit every endpoint from Postman or curl and show the error responses too.",
+    "database": "Explain your schema choices and show the query plan of your slowest query.",
+    "data science": "Publish the notebook with three findings a non-technical reader can follow.",
+    "machine learning": "Report your metrics against the baseline and explain one failure case.",
+    "mlops": "Anyone can rebuild and call your model from a clean checkout with one command.",
+    "data engineering": "Re-run the pipeline from scratch and show it produces the same output.",
+    "devops": "Tear everything down and bring it back up with a single command.",
+    "cloud": "Show the running app and a screenshot of your (near-zero) bill.",
+    "testing": "Show a green CI run and a test that caught a real bug.",
+    "tool": "Demo your workflow with it to a friend in 5 minutes.",
+    "process": "Write a short retro: what went well, what you would change.",
+    "general": "Push the demo to GitHub with a README a recruiter can skim in a minute.",
+}
+
+# An amount of time needs an hour or minute unit; a bare number next to
+# "week" or "months" is a count, not hours
+_HOURS = re.compile(
+    r"(\d+(?:\.\d+)?)(?:\s*(?:-|to)\s*(\d+(?:\.\d+)?))?\s*(hours?|hrs?|h|minutes?|mins?|m)\b"
+    r"(?:\s*(?:/|(?:per|an?|each|every)\b))?\s*(?:(day|daily|week|weekly|month|monthly)\b)?",
+    re.IGNORECASE
+)
+# "5 days a week": multiplies hours given per day (or per "each")
+_DAYS = re.compile(
+    r"(\d+(?:\.\d+)?)(?:\s*(?:-|to)\s*(\d+(?:\.\d+)?))?\s*days?\s*(?:/|(?:per|an?|each|every)\b)?\s*week",
+    re.IGNORECASE
+)
+
+_graph = None
+
+
+class SkillGraph:
+    """The prerequisite DAG with case-insensitive and alias lookup of skill names."""
+
+    def __init__(self, skills, aliases=None):
+        self.skills = skills
+        self._names = {name.lower(): name for name in skills}
+        self._names.update({alias.lower(): name for alias, name in (aliases or {}).items() if name in skills})
+
+    @classmethod
+    def load(cls, path=PREREQUISITES_PATH):
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(data["skills"], data.get("aliases"))
+
+    def resolve(self, skill):
+        """Canonical graph name of a skill, or the stripped input if it isn't in the graph."""
+        skill = skill.strip()
+        return self._names.get(skill.lower(), skill)
+
+    def info(self, skill):
+        return self.skills.get(skill) or {
+            "category": "general",
+            "hours": DEFAULT_SKILL_HOURS,
+            "prerequisites": [],
+            "resource": f"The official {skill} documentation and getting-started guide",
+        }
+
+
+def skill_graph():
+    global _graph
+    if _graph is None:
+        _graph = SkillGraph.load()
+    return _graph
+
+
+def _range_mean(low, high):
+    return (float(low) + float(high)) / 2 if high else float(low)
+
+
+def parse_weekly_hours(time_commitment, default=DEFAULT_WEEKLY_HOURS):
+    """Hours per week from text like '10 hours/week', '2h a day', '8-12 hrs per week',
+    '40 hours a month' or '5 days a week, 2 hours each'."""
+    text = time_commitment or ""
+    days = _DAYS.search(text)
+    days_per_week = min(_range_mean(*days.groups()), 7) if days else None
+    for match in _HOURS.finditer(text):
+        low, high, unit, period = match.groups()
+        amount = _range_mean(low, high)
+        if unit.lower().startswith("m"):
+            amount /= 60
+        period = (period or "").lower()
+        if period.startswith("da"):
+            amount *= days_per_week or 7
+        elif period.startswith("month"):
+            amount = amount * 12 / 52
+        elif not period.startswith("week") and days_per_week:
+            amount *= days_per_week   # "2 hours each" of the days
+        if amount > 0:
+            return round(amount, 1)
+    return default
+
+
+def _with_prerequisites(graph, skills):
+    """The skills plus all of their transitive prerequisites."""
+    closure = set()
+    stack = list(skills)
+    while stack:
+        skill = stack.pop()
+        if skill not in closure:
+            closure.add(skill)
+            stack.extend(graph.info(skill)["prerequisites"])
+    return closure
+
+
+def _schedule_order(graph, skills, priority):
+    """Kahn's topological sort; ties go to the lower priority value, then the name."""
+    dependents = {skill: [] for skill in skills}
+    pending = {}
+    for skill in skills:
+        prerequisites = [p for p in graph.info(skill)["prerequisites"] if p in skills]
+        pending[skill] = len(prerequisites)
+        for prerequisite in prerequisites:
+            dependents[prerequisite].append(skill)
+
+    ready = [(priority[skill], skill.lower(), skill) for skill, count in pending.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, _, skill = heapq.heappop(ready)
+        order.append(skill)
+        for dependent in dependents[skill]:
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                heapq.heappush(ready, (priority[dependent], dependent.lower(), dependent))
+    if len(order) != len(skills):
+        stuck = sorted(skill for skill in skills if skill not in order)
+        raise ValueError(f"Prerequisite cycle between: {', '.join(stuck)}")
+    return order
+
+
+def _week_plan(week, items, graph):
+    """One roadmap week from its (skill, hours, kind, continued) items."""
+    skills = [skill for skill, _, _, _ in items]
+    primary_skill, _, primary_kind, primary_continued = max(items, key=lambda item: item[1])
+    if primary_continued:
+        theme = f"{primary_skill} (continued)"
+    elif primary_kind == "upgrade":
+        theme = f"Leveling up {primary_skill}"
+    else:
+        theme = f"Foundations of {primary_skill}"
+    others = [skill for skill in skills if skill != primary_skill]
+    if others:
+        theme += f" + {' & '.join(others)}"
+
+    tasks = []
+    for skill, hours, kind, continued in items:
+        category = graph.info(skill)["category"]
+        task = TASKS.get(category, TASKS["general"])
+        if kind == "upgrade":
+            task = f"go past the basics: {task}"
+        if continued:
+            task = f"finish what you started: {task}"
+        tasks.append(f"~{hours:g}h on {skill}: {task}.")
+
+    primary_category = graph.info(primary_skill)["category"]
+    return {
+        "week": week,
+        "theme": theme,
+        "focus_skills": skills,
+        "actionable_task": " ".join(tasks),
+        "resource_suggestion": "; ".join(dict.fromkeys(graph.info(skill)["resource"] for skill in skills)),
+        "vibe_check": VIBE_CHECKS.get(primary_category, VIBE_CHECKS["general"]),
+    }
+
+
+def _project_week(week, learned):
+    highlight = learned[-3:] or ["your new skills"]
+    return {
+        "week": week,
+        "theme": "Portfolio project",
+        "focus_skills": highlight,
+        "actionable_task": f"Build one small end-to-end project that combines {', '.join(highlight)}, "
+                           "then polish the README and write down what you would do next.",
+        "resource_suggestion": "Your notes from the previous weeks; roadmap.sh project ideas",
+        "vibe_check": "Demo the project to a friend or mentor in 5 minutes and answer their questions.",
+    }
+
+
+def plan_roadmap(critical_skills, upgrade_skills, time_commitment="10 hours/week", known_skills=(), graph=None):
+    """Deterministic 30-day roadmap for the gap analysis' skills, in the roadmap agent's JSON schema.
+
+    Missing skills pull in their prerequisites from the skill graph (unless
+    already known), everything is ordered so prerequisites come first, and
+    the estimated hours are laid out over four weeks of the parsed weekly
+    budget. Critical skills and their prerequisites come before upgrades.
+    Weeks left over become a portfolio project; skills that do not fit are
+    named in the adaptability note.
+
+    Knowing a skill (or having one to upgrade) implies knowing everything
+    it builds on, so their prerequisites are never scheduled.
+    """
+    graph = graph or skill_graph()
+    weekly_hours = parse_weekly_hours(time_commitment)
+    upgrades = {graph.resolve(skill) for skill in upgrade_skills}
+    critical = {graph.resolve(skill) for skill in critical_skills}
+    upgrades -= critical
+    known = _with_prerequisites(graph, {graph.resolve(skill) for skill in known_skills} | upgrades)
+
+    # Missing skills plus the prerequisites the user doesn't have yet
+    kind = {skill: "upgrade" for skill in upgrades}
+    stack = sorted(critical)
+    while stack:
+        skill = stack.pop()
+        if skill in kind:
+            continue
+        kind[skill] = "critical" if skill in critical else "prerequisite"
+        stack.extend(p for p in graph.info(skill)["prerequisites"]
+                     if p not in known and p not in upgrades and p not in kind)
+
+    # Prerequisites inherit the most urgent priority of what needs them
+    rank = {"critical": 0, "prerequisite": 0, "upgrade": 1}
+    priority = {skill: rank[kind[skill]] for skill in kind}
+    for skill in reversed(_schedule_order(graph, kind, priority)):
+        for prerequisite in graph.info(skill)["prerequisites"]:
+            if prerequisite in priority:
+                priority[prerequisite] = min(priority[prerequisite], priority[skill])
+    order = _schedule_order(graph, kind, priority)
+
+    # Lay the hours out on a timeline, splitting a skill across weeks when needed
+    weeks = [[] for _ in range(WEEKS)]
+    deferred = []
+    elapsed = 0.0
+    for skill in order:
+        hours = graph.info(skill)["hours"]
+        if kind[skill] == "upgrade":
+            hours = max(2, round(hours * UPGRADE_HOURS_FACTOR))
+        if elapsed >= WEEKS * weekly_hours - 1e-9:
+            deferred.append(skill)
+            continue
+        continued = False
+        while hours > 1e-9 and elapsed < WEEKS * weekly_hours - 1e-9:
+            week = int(elapsed // weekly_hours + 1e-9)
+            share = min(hours, (week + 1) * weekly_hours - elapsed)
+            weeks[week].append((skill, round(share, 1), kind[skill], continued))
+            elapsed += share
+            hours -= share
+            continued = True
+
+    learned = [skill for skill in order if skill not in deferred]
+    roadmap = [
+        _week_plan(number, items, graph) if items else _project_week(number, learned)
+        for number, items in enumerate(weeks, start=1)
+    ]
+
+    note = (f"Planned for {weekly_hours:g} hours/week. If week 1 slips, repeat it instead of moving on: "
+            "each week only builds on the skills scheduled before it, so the plan shifts back a week "
+            "without reordering.")
+    if deferred:
+        note += f" Not enough time this month for: {', '.join(deferred)} -- pick them up next month."
+    return {"roadmap": roadmap, "adaptability_note": note}
@@ -0,0 +1,73 @@
+import asyncio
+import copy
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into one execution.
+
+    The first caller for a key starts the work as a task; callers arriving
+    with the same key while it runs await that same task instead of starting
+    their own. Everyone gets the result or the same exception: the task
+    takes a pristine deep copy as soon as the function returns, the first
+    caller gets the original and every other caller its own copy of the
+    pristine one, so no caller sees another's changes. The key is forgotten
+    as soon as the task finishes, so later calls run fresh -- results are
+    not cached here.
+
+    A caller that is cancelled only stops waiting; the shared task keeps
+    running for the others and is cancelled only when no caller is left.
+    The key is dropped before that cancellation, so a caller arriving
+    meanwhile starts a new execution instead of joining the dying one.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}  # key -> [task, number of waiting callers]
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0, "cancelled": 0}
+
+    async def do(self, key, function, *args):
+        """Await function(*args), sharing one execution per key among concurrent callers."""
+        self.stats["calls"] += 1
+        call = self._calls.get(key)
+        if call is None:
+            self.stats["executions"] += 1
+            task = asyncio.ensure_future(self._run(function, *args))
+            call = self._calls[key] = [task, 0]
+            task.add_done_callback(lambda _, key=key, call=call: self._finished(key, call))
+            leader = True
+        else:
+            self.stats["coalesced"] += 1
+            leader = False
+
+        task = call[0]
+        call[1] += 1
+        try:
+            result, pristine = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                call[1] -= 1
+                if call[1] == 0 and not task.done():
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+                    task.cancel()
+                    self.stats["cancelled"] += 1
+            raise
+        else:
+            call[1] -= 1
+        return result if leader else copy.deepcopy(pristine)
+
+    @staticmethod
+    async def _run(function, *args):
+        """function's result plus a copy taken before any caller can change it."""
+        result = await function(*args)
+        return result, copy.deepcopy(result)
+
+    def _finished(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        task = call[0]
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["errors"] += 1
+
+    def metrics(self):
+        return {**self.stats, "in_flight": len(self._calls)}
@@ -0,0 +1,51 @@
+def chunk_spans(tokenizer, text, max_tokens=400, stride=64):
+    """Character spans of text cut into windows of at most max_tokens tokens.
+
+    Windows start and end on token boundaries and overlap by stride tokens, so
+    a skill cut in half by one window boundary is whole in the next window.
+    Text that fits in one window comes back as a single span covering it all.
+    """
+    offsets = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+    if len(offsets) <= max_tokens:
+        return [(0, len(text))]
+
+    spans = []
+    step = max(1, max_tokens - stride)
+    for first in range(0, len(offsets), step):
+        last = min(first + max_tokens, len(offsets)) - 1
+        spans.append((offsets[first][0], offsets[last][1]))
+        if last == len(offsets) - 1:
+            break
+    return spans
+
+
+def merge_entities(chunk_results):
+    """Merge the entities found in the chunks of one text.
+
+    chunk_results holds (chunk start offset, entities) pairs. Entity offsets
+    are moved to text coordinates and overlapping entities -- the same skill
+    seen in two overlapping windows, or a skill truncated at a window edge
+    next to its whole copy -- collapse into one, keeping the widest entity's
+    word. Returns the words in text order.
+    """
+    spans = []
+    for chunk_start, entities in chunk_results:
+        for ent in entities:
+            spans.append((chunk_start + ent["start"], chunk_start + ent["end"], ent["word"].strip()))
+    spans.sort(key=lambda span: (span[0], -span[1]))
+
+    merged = []
+    for start, end, word in spans:
+        if merged and start < merged[-1][1]:
+            last_start, last_end, last_word = merged[-1]
+            widest = word if end - start > last_end - last_start else last_word
+            merged[-1] = (last_start, max(last_end, end), widest)
+        else:
+            merged.append((start, end, word))
+    return [word for _, _, word in merged]
+
+
+def length_buckets(items, batch_size, length=len):
+    """Group items into batches of similar length (shortest first) to keep padding low."""
+    ordered = sorted(items, key=length)
+    return [ordered[i:i + batch_size] for i in range(0, len(ordered), batch_size)]
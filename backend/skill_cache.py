@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    """Collapse whitespace so re-indented copies of a description share a cache entry."""
+    return " ".join(text.split())
+
+
+class SkillExtractionCache:
+    """LRU (in memory) + JSON files (on disk) cache of extracted skills.
+
+    Entries are keyed by the hash of the normalized job description and the
+    model name + revision, so a model upgrade never serves stale skills.
+
+    The disk tier is LRU too, by file modification time (refreshed on every
+    disk hit). New files are counted as they are written; once the count
+    passes max_disk_entries the directory is scanned and the oldest files
+    are removed down to 90% of it, so a scan happens only every few
+    thousand writes, not on each one.
+    """
+
+    def __init__(self, cache_dir, max_entries=1024, max_disk_entries=50000):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_entries = None  # unknown until the first scan
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "disk_evictions": 0}
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(text, model_name, model_revision):
+        payload = f"{model_name}@{model_revision}\n{normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remember(self, key, skills):
+        self._memory[key] = skills
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached skill list, or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return list(self._memory[key])
+
+        if self.cache_dir:
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as file:
+                    skills = json.load(file)["skills"]
+                os.utime(self._path(key))  # mark as recently used
+            except (OSError, ValueError, KeyError):
+                skills = None
+            if skills is not None:
+                with self._lock:
+                    self._remember(key, skills)
+                    self.stats["disk_hits"] += 1
+                return list(skills)
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key, skills, model_name=None, model_revision=None):
+        with self._lock:
+            self._remember(key, list(skills))
+            self.stats["writes"] += 1
+
+        if self.cache_dir:
+            # Write to a temp file and rename, so concurrent readers never see half a file
+            tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            is_new = not os.path.exists(self._path(key))
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as file:
+                    json.dump({"model": model_name, "revision": model_revision, "skills": list(skills)}, file)
+                os.replace(tmp_path, self._path(key))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._count_disk_entry(is_new)
+
+    def _count_disk_entry(self, is_new):
+        """Track the number of files written and evict once it passes max_disk_entries."""
+        with self._disk_lock:
+            if self._disk_entries is not None:
+                self._disk_entries += is_new
+                if self._disk_entries <= self.max_disk_entries:
+                    return
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Scan the directory and remove the least recently used files (disk lock held)."""
+        entries = []
+        with os.scandir(self.cache_dir) as scan:
+            for entry in scan:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+
+        evicted = 0
+        if len(entries) > self.max_disk_entries:
+            entries.sort()
+            for _, path in entries[:len(entries) - int(self.max_disk_entries * 0.9)]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                evicted += 1
+
+        # Other processes sharing the directory are caught up with here
+        self._disk_entries = len(entries) - evicted
+        with self._lock:
+            self.stats["disk_evictions"] += evicted
+
+    def metrics(self):
+        with self._lock:
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            lookups = hits + self.stats["misses"]
+            return {
+                **self.stats,
+                "lookups": lookups,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_entries": self._disk_entries,
+                "max_disk_entries": self.max_disk_entries,
+            }
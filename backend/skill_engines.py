@@ -0,0 +1,72 @@
+import os
+
+# Inference engines for the skill extractor:
+#   pytorch   - fp32 transformers pipeline (reference)
+#   int8      - PyTorch dynamic int8 quantization of the Linear layers
+#   onnx      - ONNX Runtime export of the model
+#   onnx-int8 - ONNX Runtime export with dynamic int8 quantization
+# Every engine is wrapped in the same token-classification pipeline with
+# aggregation_strategy="simple", so callers get identical entity dicts.
+ENGINES = ("pytorch", "int8", "onnx", "onnx-int8")
+
+
+def _pipeline(model, tokenizer):
+    from transformers import pipeline
+
+    return pipeline(
+        "token-classification",
+        model=model,
+        tokenizer=tokenizer,
+        aggregation_strategy="simple"
+    )
+
+
+def _onnx_model(model_name, revision, export_dir, quantize):
+    """Load an exported ONNX model, exporting (and quantizing) it on first use."""
+    from optimum.onnxruntime import ORTModelForTokenClassification
+
+    model_dir = os.path.join(export_dir, "int8" if quantize else "fp32")
+    if os.path.exists(os.path.join(model_dir, "config.json")):
+        return ORTModelForTokenClassification.from_pretrained(model_dir)
+
+    print(f"Exporting {model_name} to ONNX (one time)...")
+    model = ORTModelForTokenClassification.from_pretrained(model_name, revision=revision, export=True)
+    if not quantize:
+        model.save_pretrained(model_dir)
+        return model
+
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    fp32_dir = os.path.join(export_dir, "fp32")
+    model.save_pretrained(fp32_dir)
+    quantizer = ORTQuantizer.from_pretrained(fp32_dir)
+    quantizer.quantize(save_dir=model_dir, quantization_config=AutoQuantizationConfig.avx2(is_static=False))
+    model.config.save_pretrained(model_dir)
+    return ORTModelForTokenClassification.from_pretrained(model_dir)
+
+
+def build_skill_extractor(model_name, revision="main", engine="pytorch", export_dir=None):
+    """Token-classification pipeline for model_name running on the given engine."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown inference engine '{engine}', use one of: {', '.join(ENGINES)}")
+
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+
+    if engine in ("onnx", "onnx-int8"):
+        export_dir = export_dir or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "cache", "onnx", model_name.replace("/", "--"), revision
+        )
+        return _pipeline(_onnx_model(model_name, revision, export_dir, engine == "onnx-int8"), tokenizer)
+
+    from transformers import AutoModelForTokenClassification
+
+    model = AutoModelForTokenClassification.from_pretrained(model_name, revision=revision)
+    model.eval()
+    if engine == "int8":
+        import torch
+
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return _pipeline(model, tokenizer)
@@ -0,0 +1,319 @@
+"""
+Candidate Index - Rank stored unified profiles against one job (reverse job matching)
+
+Build the index from the result store (run from the career_navigator directory):
+    python analyzers/candidate_index.py
+"""
+
+import bisect
+import heapq
+import json
+import os
+import shutil
+import time
+from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+
+import numpy as np
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+from skills.registry import SkillRegistry
+from storage.result_store import ResultStore
+
+
+class CandidateIndex:
+    """Latest unified profile of every stored candidate, searchable by skill
+    
+    Per candidate the index keeps its skill IDs (CSR arrays) and years of
+    experience; per skill, the sorted rows of the candidates that have it.
+    Years are also kept sorted (with the matching rows), so the candidates
+    meeting an experience requirement are one binary search away.
+    
+    top_k scores a job against the candidates with WAND: each required skill
+    is a term whose weight is what it adds to calculate_match_score, so a
+    candidate's score is bounded by the weights of the skill lists it
+    appears in plus the experience bonus. Candidates whose bound cannot beat
+    the current k-th best are skipped without being scored, and whole runs
+    of rows are jumped over in the skill lists. Scores of the returned
+    candidates are computed with calculate_match_score's arithmetic, so
+    results equal a brute-force ranking.
+    """
+    
+    VERSION = 1
+    
+    # Bounds are sums of term weights and can be off from the exact score by
+    # rounding; distinct scores are at least ~1e-4 apart, so a bound within
+    # BOUND_EPSILON of the k-th best can at most tie it
+    BOUND_EPSILON = 1e-9
+    
+    def __init__(self, index_dir: Path = None):
+        self.index_dir = Path(index_dir or Config.CANDIDATE_INDEX_DIR)
+        meta = json.loads((self.index_dir / "meta.json").read_text(encoding='utf-8'))
+        if meta.get("version") != self.VERSION:
+            raise ValueError(f"Candidate index version {meta.get('version')} is not supported, rebuild it")
+        
+        self.meta = meta
+        self.candidates: List[Dict[str, Any]] = meta["candidates"]
+        self.skills: List[str] = meta["skills"]
+        self.skill_lookup = {name.lower(): skill_id for skill_id, name in enumerate(self.skills)}
+        self.registry = SkillRegistry.for_tech_skills()
+        
+        load = lambda name: np.load(self.index_dir / f"{name}.npy")
+        self.years = load("years")
+        self.years_sorted, self.rows_by_years = load("years_sorted"), load("rows_by_years")
+        self.skill_indptr, self.skill_ids = load("skill_indptr"), load("skill_ids")
+        self.inv_indptr, self.inv_rows = load("inv_indptr"), load("inv_rows")
+    
+    @classmethod
+    def load(cls, index_dir: Path = None) -> Optional['CandidateIndex']:
+        """Open a built index, or return None if there is none"""
+        index_dir = Path(index_dir or Config.CANDIDATE_INDEX_DIR)
+        if not (index_dir / "meta.json").exists():
+            return None
+        return cls(index_dir)
+    
+    def __len__(self) -> int:
+        return len(self.candidates)
+    
+    @classmethod
+    def build(cls, store: ResultStore = None, index_dir: Path = None) -> 'CandidateIndex':
+        """Index the most recent stored profile of every candidate"""
+        store = store or ResultStore()
+        index_dir = Path(index_dir or Config.CANDIDATE_INDEX_DIR)
+        registry = SkillRegistry.for_tech_skills()
+        
+        print("🔧 Building candidate index from the result store...")
+        start = time.perf_counter()
+        
+        latest: Dict[str, Dict[str, Any]] = {}
+        for run in store.iter_runs():
+            candidate = run.get("candidate")
+            if not candidate or not run.get("profile"):
+                continue
+            if candidate not in latest or run["created_at"] > latest[candidate]["created_at"]:
+                latest[candidate] = run
+        
+        skills: List[str] = []
+        skill_lookup: Dict[str, int] = {}
+        candidates, years, skill_indptr, skill_ids = [], [], [0], []
+        for candidate in sorted(latest):
+            run = latest[candidate]
+            profile = run["profile"]
+            
+            ids = set()
+            for name in profile.get("skills", {}).get("technical_skills", []):
+                canonical = registry.canonical(name)
+                if canonical.lower() not in skill_lookup:
+                    skill_lookup[canonical.lower()] = len(skills)
+                    skills.append(canonical)
+                ids.add(skill_lookup[canonical.lower()])
+            
+            candidates.append({
+                "candidate": candidate,
+                "run_id": run["run_id"],
+                "name": profile.get("personal_info", {}).get("name", ""),
+            })
+            years.append(float(profile.get("experience", {}).get("years", 0) or 0))
+            skill_ids.extend(sorted(ids))
+            skill_indptr.append(len(skill_ids))
+        
+        arrays = {
+            "years": np.array(years, dtype=np.float64),
+            "skill_indptr": np.array(skill_indptr, dtype=np.int64),
+            "skill_ids": np.array(skill_ids, dtype=np.int32),
+        }
+        rows = np.repeat(np.arange(len(candidates), dtype=np.int32), np.diff(arrays["skill_indptr"]))
+        order = np.argsort(arrays["skill_ids"], kind='stable')
+        arrays["inv_rows"] = rows[order]
+        arrays["inv_indptr"] = np.zeros(len(skills) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(arrays["skill_ids"], minlength=len(skills)), out=arrays["inv_indptr"][1:])
+        arrays["rows_by_years"] = np.argsort(arrays["years"], kind='stable').astype(np.int32)
+        arrays["years_sorted"] = arrays["years"][arrays["rows_by_years"]]
+        
+        build_dir = index_dir.with_name(f"{index_dir.name}.build-{os.getpid()}")
+        shutil.rmtree(build_dir, ignore_errors=True)
+        build_dir.mkdir(parents=True)
+        for name, values in arrays.items():
+            np.save(build_dir / f"{name}.npy", values)
+        (build_dir / "meta.json").write_text(json.dumps({
+            "version": cls.VERSION,
+            "candidates": candidates,
+            "skills": skills,
+            "built_at": time.time(),
+        }), encoding='utf-8')
+        
+        old_dir = index_dir.with_name(f"{index_dir.name}.old-{os.getpid()}")
+        if index_dir.exists():
+            os.replace(index_dir, old_dir)
+        os.replace(build_dir, index_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+        
+        print(f"✅ Indexed {len(candidates)} candidates, {len(skills)} skills "
+              f"in {time.perf_counter() - start:.1f}s\n")
+        return cls(index_dir)
+    
+    def skill_id(self, name: str) -> Optional[int]:
+        """Index-local ID of a skill or alias (None if no candidate has it)"""
+        return self.skill_lookup.get(self.registry.canonical(name).lower())
+    
+    def candidate_skills(self, row: int) -> List[str]:
+        ids = self.skill_ids[self.skill_indptr[row]:self.skill_indptr[row + 1]]
+        return [self.skills[skill_id] for skill_id in ids]
+    
+    def meets_experience(self, required_years: float) -> np.ndarray:
+        """Rows of the candidates with at least required_years, ascending"""
+        first = np.searchsorted(self.years_sorted, required_years, side='left')
+        return np.sort(self.rows_by_years[first:])
+    
+    @staticmethod
+    def exact_score(matched: int, required: int, matched_critical: int, critical: int,
+                    experience_match: bool) -> float:
+        """calculate_match_score's overall score, with the same operations in the same order"""
+        skills_match_percentage = (matched / required * 100) if required else 0
+        critical_match_percentage = (matched_critical / critical * 100) if critical else 0
+        return (
+            skills_match_percentage * 0.5 +
+            critical_match_percentage * 0.3 +
+            (100 if experience_match else 0) * 0.2
+        )
+    
+    def _terms(self, job_requirements: Dict) -> Tuple[List[List[Any]], int, int]:
+        """WAND cursors [weight, rows, position, is_critical] for the job's skills"""
+        required = {self.registry.canonical(s).lower() for s in job_requirements.get('required_skills', [])}
+        critical = {self.registry.canonical(s).lower() for s in job_requirements.get('critical_skills', [])}
+        
+        terms = []
+        for name in required | critical:
+            skill_id = self.skill_lookup.get(name)
+            if skill_id is None:
+                continue
+            weight = 0.0
+            if name in required:
+                weight += 50 / len(required)
+            if name in critical:
+                weight += 30 / len(critical)
+            # Plain lists: the WAND loop reads them one element at a time
+            rows = self.inv_rows[self.inv_indptr[skill_id]:self.inv_indptr[skill_id + 1]].tolist()
+            terms.append([weight, rows, 0, name in required, name in critical])
+        return terms, len(required), len(critical)
+    
+    def top_k(self, job_requirements: Dict, k: int = 10) -> Tuple[List[Tuple[int, float]], Dict[str, int]]:
+        """(row, score) of the k best candidates, best first, ties broken by row
+        
+        Also returns counters: how many candidates were scored and how many
+        of them could be skipped.
+        """
+        if k <= 0 or not len(self):
+            return [], {"scored": 0, "candidates": len(self)}
+        
+        terms, num_required, num_critical = self._terms(job_requirements)
+        required_years = job_requirements.get('years_experience_required', 0)
+        experience_bound = 20.0 if self.years_sorted[-1] >= required_years else 0.0
+        
+        # Min-heap of the best k as (score, -row): the root is the current
+        # k-th best, and among equal scores the largest row is evicted first
+        heap: List[Tuple[float, int]] = []
+        scored = 0
+        
+        def threshold() -> float:
+            return heap[0][0] if len(heap) == k else float('-inf')
+        
+        terms = [term for term in terms if len(term[1])]
+        while terms:
+            terms.sort(key=lambda term: term[1][term[2]])
+            
+            # Pivot: first term at which the summed bounds could beat the
+            # k-th best. Rows are visited in ascending order, so a candidate
+            # that only ties the k-th best can never replace it.
+            bound = experience_bound
+            pivot = None
+            for i, (weight, rows, position, _, _) in enumerate(terms):
+                bound += weight
+                if bound > threshold() + self.BOUND_EPSILON:
+                    pivot = i
+                    break
+            if pivot is None:
+                break
+            pivot_row = terms[pivot][1][terms[pivot][2]]
+            
+            if terms[0][1][terms[0][2]] == pivot_row:
+                # Every term up to the pivot sits on this row: score it
+                matched = matched_critical = 0
+                for term in terms:
+                    weight, rows, position, is_required, is_critical = term
+                    if rows[position] == pivot_row:
+                        matched += is_required
+                        matched_critical += is_critical
+                        term[2] += 1
+                score = self.exact_score(matched, num_required, matched_critical, num_critical,
+                                         self.years[pivot_row] >= required_years)
+                scored += 1
+                
+                entry = (score, -pivot_row)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+            else:
+                # No row before pivot_row can reach the threshold: jump the
+                # lagging lists forward
+                for term in terms[:pivot]:
+                    term[2] = bisect.bisect_left(term[1], pivot_row, term[2])
+            
+            terms = [term for term in terms if term[2] < len(term[1])]
+        
+        # Candidates with none of the skills score 20 (experience met) or 0
+        if len(heap) < k or heap[0][0] <= 20.0:
+            self._add_skill_free(heap, k, num_required, num_critical, required_years, job_requirements)
+        
+        results = sorted(heap, key=lambda entry: (-entry[0], -entry[1]))
+        return [(-row, score) for score, row in results], {"scored": scored, "candidates": len(self)}
+    
+    def _add_skill_free(self, heap: List[Tuple[float, int]], k: int, num_required: int,
+                        num_critical: int, required_years: float, job_requirements: Dict):
+        """Offer candidates sharing no job skill to the heap, lowest rows first"""
+        matched_any = np.zeros(len(self), dtype=bool)
+        for name in job_requirements.get('required_skills', []) + job_requirements.get('critical_skills', []):
+            skill_id = self.skill_id(name)
+            if skill_id is not None:
+                matched_any[self.inv_rows[self.inv_indptr[skill_id]:self.inv_indptr[skill_id + 1]]] = True
+        
+        experienced = np.zeros(len(self), dtype=bool)
+        experienced[self.meets_experience(required_years)] = True
+        
+        for experience_match in (True, False):
+            rows = np.flatnonzero((experienced == experience_match) & ~matched_any)[:k]
+            score = self.exact_score(0, num_required, 0, num_critical, experience_match)
+            for row in rows:
+                entry = (score, -int(row))
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+    
+    def brute_force(self, job_requirements: Dict, k: int = 10) -> List[Tuple[int, float]]:
+        """Score every candidate (reference for top_k)"""
+        required = {self.registry.canonical(s).lower() for s in job_requirements.get('required_skills', [])}
+        critical = {self.registry.canonical(s).lower() for s in job_requirements.get('critical_skills', [])}
+        required_years = job_requirements.get('years_experience_required', 0)
+        
+        scores = []
+        for row in range(len(self)):
+            skills = {name.lower() for name in self.candidate_skills(row)}
+            scores.append((self.exact_score(
+                len(skills & required), len(required), len(skills & critical), len(critical),
+                self.years[row] >= required_years,
+            ), row))
+        scores.sort(key=lambda item: (-item[0], item[1]))
+        return [(row, score) for score, row in scores[:k]]
+
+
+def main():
+    CandidateIndex.build()
+
+
+if __name__ == "__main__":
+    main()
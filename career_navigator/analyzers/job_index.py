@@ -0,0 +1,410 @@
+"""
+Job Posting Index - Columnar store of parsed job postings with an inverted skill index
+
+Build the index from the postings CSV (run from the career_navigator directory):
+    python analyzers/job_index.py [datasets/job_postings.csv] [--workers 4]
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Iterable, Iterator, Tuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+
+
+# Per-process JobMatcher used by _extract_chunk
+_matcher = None
+
+
+def _extract_chunk(descriptions: List[str]) -> List[Tuple[List[str], List[str], int]]:
+    """(required skills, critical skills, years) for each description in a chunk"""
+    global _matcher
+    if _matcher is None:
+        from analyzers.job_matcher import JobMatcher
+        with redirect_stdout(io.StringIO()):
+            _matcher = JobMatcher()
+    
+    parsed = []
+    for description in descriptions:
+        requirements = _matcher.extract_job_requirements(description, verbose=False)
+        parsed.append((
+            requirements["required_skills"],
+            requirements["critical_skills"],
+            requirements["years_experience_required"],
+        ))
+    return parsed
+
+
+class JobPostingIndex:
+    """Parsed job postings stored column by column, plus skill -> postings lists
+    
+    Skill extraction (JobMatcher.extract_job_requirements) runs once per
+    posting at build time. Per posting the index keeps the required and
+    critical skill IDs (CSR arrays), the required years and the display
+    columns. For each skill it keeps the rows of the postings that require
+    it (and that list it as critical), so scoring a profile only touches
+    postings that share at least one skill with it.
+    
+    Skill IDs are local to the index (its own skill list is stored with it),
+    so an index stays valid when the skill dictionary changes. Arrays are
+    .npy files opened memory-mapped.
+    """
+    
+    VERSION = 1
+    
+    # Display columns, first matching CSV header wins
+    COLUMNS = {
+        "posting_id": ("job_id", "posting_id", "id"),
+        "title": ("title", "job_title"),
+        "company": ("company", "company_name"),
+        "location": ("location", "job_location"),
+    }
+    DESCRIPTION_COLUMNS = ("description", "job_description")
+    
+    def __init__(self, index_dir: Path = None):
+        self.index_dir = Path(index_dir or Config.JOB_INDEX_DIR)
+        meta = json.loads((self.index_dir / "meta.json").read_text(encoding='utf-8'))
+        if meta.get("version") != self.VERSION:
+            raise ValueError(f"Job index version {meta.get('version')} is not supported, rebuild it")
+        
+        self.meta = meta
+        self.skills: List[str] = meta["skills"]
+        self.skill_lookup = {name.lower(): skill_id for skill_id, name in enumerate(self.skills)}
+        
+        load = lambda name: np.load(self.index_dir / f"{name}.npy", mmap_mode='r')
+        self.req_indptr, self.req_ids = load("req_indptr"), load("req_ids")
+        self.crit_indptr, self.crit_ids = load("crit_indptr"), load("crit_ids")
+        self.inv_req_indptr, self.inv_req_rows = load("inv_req_indptr"), load("inv_req_rows")
+        self.inv_crit_indptr, self.inv_crit_rows = load("inv_crit_indptr"), load("inv_crit_rows")
+        
+        # Per-posting columns read by every query are kept in memory: years
+        # and skill counts (the denominators of the match percentages)
+        self.years = np.array(load("years"))
+        self.req_counts = np.asarray(np.diff(self.req_indptr))
+        self.crit_counts = np.asarray(np.diff(self.crit_indptr))
+        
+        self._text_offsets = {column: load(f"{column}_offsets") for column in self.COLUMNS}
+        self._text_data = {
+            column: np.memmap(self.index_dir / f"{column}.bin", dtype=np.uint8, mode='r')
+            if (self.index_dir / f"{column}.bin").stat().st_size else np.zeros(0, dtype=np.uint8)
+            for column in self.COLUMNS
+        }
+    
+    @classmethod
+    def load(cls, index_dir: Path = None) -> Optional['JobPostingIndex']:
+        """Open a built index, or return None if there is none"""
+        index_dir = Path(index_dir or Config.JOB_INDEX_DIR)
+        if not (index_dir / "meta.json").exists():
+            return None
+        return cls(index_dir)
+    
+    def __len__(self) -> int:
+        return len(self.years)
+    
+    @classmethod
+    def _read_chunks(cls, csv_path: Path, chunk_rows: int) -> Iterator[Dict[str, List[str]]]:
+        """Stream the CSV as {column: values} chunks with the columns the index needs"""
+        try:
+            reader = pd.read_csv(csv_path, chunksize=chunk_rows, dtype=str,
+                                 keep_default_na=False, on_bad_lines='skip')
+            first_row = 0
+            for chunk in reader:
+                headers = {header.strip().lower(): header for header in chunk.columns}
+                pick = lambda names: next((headers[n] for n in names if n in headers), None)
+                
+                columns = {}
+                for column, names in cls.COLUMNS.items():
+                    header = pick(names)
+                    columns[column] = chunk[header].tolist() if header else [""] * len(chunk)
+                if not pick(cls.COLUMNS["posting_id"]):
+                    columns["posting_id"] = [str(first_row + i) for i in range(len(chunk))]
+                
+                header = pick(cls.DESCRIPTION_COLUMNS)
+                descriptions = chunk[header].tolist() if header else [""] * len(chunk)
+                # Postings without a description are matched on their title
+                columns["description"] = [
+                    description or title
+                    for description, title in zip(descriptions, columns["title"])
+                ]
+                
+                first_row += len(chunk)
+                yield columns
+        except pd.errors.EmptyDataError:
+            return
+    
+    @classmethod
+    def build(cls, csv_path: Path = None, index_dir: Path = None, chunk_rows: int = None,
+              workers: int = None) -> 'JobPostingIndex':
+        """Parse every posting in the CSV once and write the index"""
+        csv_path = Path(csv_path or Config.JOB_POSTINGS_CSV)
+        index_dir = Path(index_dir or Config.JOB_INDEX_DIR)
+        chunk_rows = chunk_rows or Config.JOB_INDEX_CHUNK_ROWS
+        workers = max(1, workers or Config.JOB_INDEX_WORKERS)
+        
+        print(f"🔧 Building job index from {csv_path} ({workers} worker(s))...")
+        start = time.perf_counter()
+        
+        # Write into a scratch directory and swap it in at the end, so
+        # readers never see a half-built index
+        build_dir = index_dir.with_name(f"{index_dir.name}.build-{os.getpid()}")
+        shutil.rmtree(build_dir, ignore_errors=True)
+        build_dir.mkdir(parents=True)
+        
+        skill_ids: Dict[str, int] = {}
+        skills: List[str] = []
+        years = array('i')
+        req_indptr, req_ids = array('q', [0]), array('i')
+        crit_indptr, crit_ids = array('q', [0]), array('i')
+        text_offsets = {column: array('q', [0]) for column in cls.COLUMNS}
+        text_files = {column: open(build_dir / f"{column}.bin", 'wb') for column in cls.COLUMNS}
+        
+        def intern(name: str) -> int:
+            skill_id = skill_ids.get(name.lower())
+            if skill_id is None:
+                skill_id = skill_ids[name.lower()] = len(skills)
+                skills.append(name)
+            return skill_id
+        
+        def add_chunk(columns: Dict[str, List[str]], parsed: List[Tuple[List[str], List[str], int]]):
+            for column in cls.COLUMNS:
+                data = text_files[column]
+                offsets = text_offsets[column]
+                for value in columns[column]:
+                    encoded = value.encode('utf-8')
+                    data.write(encoded)
+                    offsets.append(offsets[-1] + len(encoded))
+            
+            for required, critical, years_required in parsed:
+                req_ids.extend(intern(name) for name in required)
+                req_indptr.append(len(req_ids))
+                crit_ids.extend(intern(name) for name in critical)
+                crit_indptr.append(len(crit_ids))
+                years.append(years_required)
+            
+            print(f"   {len(years)} postings indexed")
+        
+        try:
+            if workers == 1:
+                for columns in cls._read_chunks(csv_path, chunk_rows):
+                    add_chunk(columns, _extract_chunk(columns["description"]))
+            else:
+                # Chunks are parsed in parallel but added in CSV order; a
+                # bounded queue keeps memory flat for very large files
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    pending = deque()
+                    for columns in cls._read_chunks(csv_path, chunk_rows):
+                        pending.append((columns, pool.submit(_extract_chunk, columns["description"])))
+                        if len(pending) >= workers * 2:
+                            columns, future = pending.popleft()
+                            add_chunk(columns, future.result())
+                    while pending:
+                        columns, future = pending.popleft()
+                        add_chunk(columns, future.result())
+        finally:
+            for data in text_files.values():
+                data.close()
+        
+        cls._write_arrays(build_dir, len(skills), {
+            "years": np.frombuffer(years, dtype=np.int32),
+            "req_indptr": np.frombuffer(req_indptr, dtype=np.int64),
+            "req_ids": np.frombuffer(req_ids, dtype=np.int32),
+            "crit_indptr": np.frombuffer(crit_indptr, dtype=np.int64),
+            "crit_ids": np.frombuffer(crit_ids, dtype=np.int32),
+            **{
+                f"{column}_offsets": np.frombuffer(offsets, dtype=np.int64)
+                for column, offsets in text_offsets.items()
+            },
+        })
+        (build_dir / "meta.json").write_text(json.dumps({
+            "version": cls.VERSION,
+            "source": str(csv_path),
+            "postings": len(years),
+            "skills": skills,
+            "built_at": time.time(),
+        }), encoding='utf-8')
+        
+        # Swap the new index in
+        old_dir = index_dir.with_name(f"{index_dir.name}.old-{os.getpid()}")
+        if index_dir.exists():
+            os.replace(index_dir, old_dir)
+        os.replace(build_dir, index_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+        
+        print(f"✅ Indexed {len(years)} postings, {len(skills)} skills "
+              f"in {time.perf_counter() - start:.1f}s\n")
+        return cls(index_dir)
+    
+    @staticmethod
+    def _invert(indptr: np.ndarray, ids: np.ndarray, num_skills: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Turn posting -> skills CSR arrays into skill -> posting rows"""
+        rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int32), np.diff(indptr))
+        order = np.argsort(ids, kind='stable')
+        inv_indptr = np.zeros(num_skills + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ids, minlength=num_skills), out=inv_indptr[1:])
+        return inv_indptr, rows[order]
+    
+    @classmethod
+    def _write_arrays(cls, build_dir: Path, num_skills: int, arrays: Dict[str, np.ndarray]):
+        arrays["inv_req_indptr"], arrays["inv_req_rows"] = cls._invert(
+            arrays["req_indptr"], arrays["req_ids"], num_skills)
+        arrays["inv_crit_indptr"], arrays["inv_crit_rows"] = cls._invert(
+            arrays["crit_indptr"], arrays["crit_ids"], num_skills)
+        for name, values in arrays.items():
+            np.save(build_dir / f"{name}.npy", values)
+    
+    def text(self, column: str, row: int) -> str:
+        offsets = self._text_offsets[column]
+        return bytes(self._text_data[column][offsets[row]:offsets[row + 1]]).decode('utf-8')
+    
+    def posting(self, row: int) -> Dict[str, str]:
+        """Display columns of one posting"""
+        return {column: self.text(column, row) for column in self.COLUMNS}
+    
+    def skill_ids_of(self, names: Iterable[str]) -> np.ndarray:
+        """Index-local IDs of the given skills (skills no posting mentions are dropped)"""
+        ids = {self.skill_lookup[name.lower()] for name in names if name.lower() in self.skill_lookup}
+        return np.array(sorted(ids), dtype=np.int64)
+    
+    def required_skills(self, row: int) -> List[str]:
+        ids = self.req_ids[self.req_indptr[row]:self.req_indptr[row + 1]]
+        return [self.skills[skill_id] for skill_id in ids]
+    
+    def critical_skills(self, row: int) -> List[str]:
+        ids = self.crit_ids[self.crit_indptr[row]:self.crit_indptr[row + 1]]
+        return [self.skills[skill_id] for skill_id in ids]
+    
+    def _postings_of(self, indptr: np.ndarray, rows: np.ndarray, skill_ids: np.ndarray) -> np.ndarray:
+        """Concatenated posting lists of the given skills"""
+        if not len(skill_ids):
+            return np.zeros(0, dtype=np.intp)
+        return np.concatenate([rows[indptr[s]:indptr[s + 1]] for s in skill_ids], dtype=np.intp)
+    
+    def _hit_counts(self, postings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct rows in concatenated posting lists (ascending) and how often each occurs
+        
+        Sorting the hits only touches the overlapping postings, but once the
+        hits reach about half the index a linear bincount over every row is
+        cheaper than the sort.
+        """
+        if len(postings) < len(self) // 2:
+            return np.unique(postings, return_counts=True)
+        counts = np.bincount(postings, minlength=len(self))
+        rows = np.flatnonzero(counts)
+        return rows, counts[rows]
+    
+    def _hits_at(self, postings: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """How often each of rows (ascending, covering every hit) occurs in posting lists
+        
+        Same trade-off as _hit_counts, but the rows are already known, so the
+        bincount pays off from about a twentieth of the index.
+        """
+        if len(rows) < len(self) // 20:
+            hit_rows, hits = np.unique(postings, return_counts=True)
+            counts = np.zeros(len(rows), dtype=np.int64)
+            counts[np.searchsorted(rows, hit_rows)] = hits
+            return counts
+        return np.bincount(postings, minlength=len(self))[rows]
+    
+    def score_rows(self, rows: np.ndarray, matched_required: np.ndarray,
+                   matched_critical: np.ndarray, user_years: float) -> np.ndarray:
+        """Overall match score of postings, computed exactly like calculate_match_score"""
+        # In place and without masks, but the same float operations in the
+        # same order: m / n * 100 * 0.5 + m / n * 100 * 0.3 + 100 * 0.2.
+        # A posting without skills of a kind has no hits of it either, so
+        # m / max(n, 1) is the 0 that calculate_match_score uses
+        scores = matched_required / np.maximum(self.req_counts[rows], 1)
+        scores *= 100
+        scores *= 0.5
+        critical_pct = matched_critical / np.maximum(self.crit_counts[rows], 1)
+        critical_pct *= 100
+        critical_pct *= 0.3
+        scores += critical_pct
+        scores += (user_years >= self.years[rows]) * (100 * 0.2)
+        return scores
+    
+    def _first_rows_without(self, candidates: np.ndarray, experience_met: bool,
+                            user_years: float, k: int) -> np.ndarray:
+        """Lowest k rows outside candidates whose experience test gives experience_met
+        
+        Scans the years column in blocks and stops once k rows are found.
+        """
+        found, count = [], 0
+        block = max(4 * k, 1 << 16)
+        for start in range(0, len(self), block):
+            rows = start + np.flatnonzero((user_years >= self.years[start:start + block]) == experience_met)
+            rows = rows[~np.isin(rows, candidates, assume_unique=True)]
+            found.append(rows)
+            count += len(rows)
+            if count >= k:
+                break
+        return np.concatenate(found)[:k] if found else np.zeros(0, dtype=np.intp)
+    
+    def top_k(self, user_skills: Iterable[str], user_years: float = 0,
+              k: int = 10) -> List[Tuple[int, float]]:
+        """(row, score) of the k best postings, best first, ties broken by row
+        
+        Only postings sharing a skill with the user are scored individually.
+        Every other posting scores either 20 (experience met) or 0, and is only
+        looked at when fewer than k overlapping postings beat that.
+        """
+        if k <= 0 or not len(self):
+            return []
+        
+        skill_ids = self.skill_ids_of(user_skills)
+        candidates, matched_required = self._hit_counts(
+            self._postings_of(self.inv_req_indptr, self.inv_req_rows, skill_ids))
+        
+        # Critical skills are a subset of required ones, so every critical hit
+        # is already a candidate
+        matched_critical = self._hits_at(
+            self._postings_of(self.inv_crit_indptr, self.inv_crit_rows, skill_ids), candidates)
+        
+        rows = candidates
+        scores = self.score_rows(candidates, matched_required, matched_critical, user_years)
+        
+        # Non-overlapping postings can only enter the top k at 20 or 0
+        kth_best = np.partition(scores, -k)[-k] if len(scores) >= k else -1.0
+        for experience_met, floor_score in ((True, 20.0), (False, 0.0)):
+            if kth_best > floor_score:
+                break
+            extra = self._first_rows_without(candidates, experience_met, user_years, k)
+            rows = np.concatenate([rows, extra])
+            scores = np.concatenate([scores, np.full(len(extra), floor_score)])
+            kth_best = np.partition(scores, -k)[-k] if len(scores) >= k else -1.0
+        
+        # Sort only the postings that can make the cut
+        if len(scores) > k:
+            keep = scores >= kth_best
+            rows, scores = rows[keep], scores[keep]
+        order = np.lexsort((rows, -scores))[:k]
+        return [(int(rows[i]), float(scores[i])) for i in order]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the job postings index")
+    parser.add_argument("csv", nargs="?", default=str(Config.JOB_POSTINGS_CSV))
+    parser.add_argument("--index-dir", default=str(Config.JOB_INDEX_DIR))
+    parser.add_argument("--chunk-rows", type=int, default=Config.JOB_INDEX_CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, default=Config.JOB_INDEX_WORKERS)
+    args = parser.parse_args()
+    
+    JobPostingIndex.build(args.csv, args.index_dir, args.chunk_rows, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,12 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from config import Config
+from skills.registry import SkillRegistry
+from skills.skill_index import SkillIndex
+from skills.skill_vectors import SkillVectorIndex
+from analyzers.job_index import JobPostingIndex
+from analyzers.candidate_index import CandidateIndex
+from analyzers.match_engine import MatchScoringEngine
 
 
 class JobMatcher:
@@ -19,7 +25,8 @@ class JobMatcher:
     
     def __init__(self):
         print("🔧 Initializing Job Matcher...")
-        self.tech_skills_lower = {skill.lower() for skill in Config.TECH_SKILLS}
+        self.registry = SkillRegistry.for_tech_skills()
+        self.tech_index = SkillIndex.for_tech_skills()
         self.job_skill_templates = {
             "data scientist": {
                 "Python", "Pandas", "NumPy", "Matplotlib",
@@ -37,29 +44,35 @@ class JobMatcher:
                 "Angular", "React", "Bootstrap"
             }
         }
+        self._job_index = None
+        self._candidate_index = None
+        self._skill_vectors = None
         print("✅ Job Matcher initialized\n")
     
-    def extract_job_requirements(self, job_description: str) -> Dict[str, Any]:
+    def extract_job_requirements(self, job_description: str, verbose: bool = True) -> Dict[str, Any]:
         """Extract requirements from job description text"""
-        print(f"📋 Analyzing dream job: {job_description[:50]}...")
+        if verbose:
+            print(f"📋 Analyzing dream job: {job_description[:50]}...")
         
         # Extract required skills
         required_skills = set()
         description_lower = job_description.lower()
-
+        
         # If input is very short, treat as job title only
         if len(job_description.split()) <= 5:
             for title, skills in self.job_skill_templates.items():
                 if title in description_lower:
-                    required_skills = skills
-                    print("ℹ Using predefined skill template for job title")
+                    required_skills = set(skills)
+                    if verbose:
+                        print("ℹ Using predefined skill template for job title")
                     break
-
-        for skill in Config.TECH_SKILLS:
-            if skill.lower() in description_lower:
-                required_skills.add(skill)
-        print(f"Required Skills Extracted: {required_skills}")
-
+        
+        # One scan gives both the skill set and the mention counts
+        skill_mentions = self.tech_index.count(job_description)
+        required_skills.update(skill_mentions)
+        if verbose:
+            print(f"Required Skills Extracted: {required_skills}")
+        
         # Fallback if required_skills is empty and job is data scientist
         DATA_SCIENTIST_SKILLS = {
             "Python", "Pandas", "NumPy", "Matplotlib",
@@ -98,14 +111,13 @@ class JobMatcher:
                 })
         
         # Categorize skills by importance (appears multiple times = more important)
-        skill_frequency = {}
-        for skill in required_skills:
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            count = len(re.findall(pattern, description_lower))
-            skill_frequency[skill] = count
+        skill_frequency = {
+            skill: skill_mentions.get(skill, 0) for skill in required_skills
+        }
         
-        # Sort by frequency (most mentioned = most important)
-        critical_skills = sorted(skill_frequency.items(), key=lambda x: x[1], reverse=True)
+        # Sort by frequency (most mentioned = most important), ties by name
+        # so the same description always yields the same critical skills
+        critical_skills = sorted(skill_frequency.items(), key=lambda x: (-x[1], x[0]))
         
         requirements = {
             "job_title": self.extract_job_title(job_description),
@@ -116,9 +128,10 @@ class JobMatcher:
             "total_skills_required": len(required_skills)
         }
         
-        print(f"✅ Extracted {len(required_skills)} required skills")
-        print(f"✅ Experience required: {years_required} years")
-        print(f"✅ Top critical skills: {', '.join(requirements['critical_skills'][:5])}\n")
+        if verbose:
+            print(f"✅ Extracted {len(required_skills)} required skills")
+            print(f"✅ Experience required: {years_required} years")
+            print(f"✅ Top critical skills: {', '.join(requirements['critical_skills'][:5])}\n")
         
         return requirements
     
@@ -141,23 +154,74 @@ class JobMatcher:
         
         return "Unknown Position"
     
-    def calculate_match_score(self, user_profile: Dict, job_requirements: Dict) -> Dict[str, Any]:
-        """Calculate how well user matches the job"""
+    @property
+    def skill_vectors(self) -> SkillVectorIndex:
+        """Skill embeddings for soft matching, opened on first use (None if not built)"""
+        if self._skill_vectors is None:
+            self._skill_vectors = SkillVectorIndex.load(registry=self.registry)
+        return self._skill_vectors
+    
+    def _soft_vectors(self, soft: bool = None) -> SkillVectorIndex:
+        """Skill vectors if soft matching is requested (soft, else Config.SOFT_MATCH) and built"""
+        if not (Config.SOFT_MATCH if soft is None else soft):
+            return None
+        if self.skill_vectors is None:
+            print("⚠️  Skill vectors not built, using exact matching (run: python skills/skill_vectors.py)")
+        return self.skill_vectors
+    
+    def calculate_match_score(self, user_profile: Dict, job_requirements: Dict,
+                              soft: bool = None) -> Dict[str, Any]:
+        """Calculate how well user matches the job
+        
+        With soft matching, missing skills earn partial credit for similar
+        skills the user has (see SkillVectorIndex) and the percentages and
+        overall score use those credits.
+        """
         print("🎯 Calculating job match score...")
         
-        user_skills = set(user_profile.get('skills', {}).get('technical_skills', []))
-        required_skills = set(job_requirements.get('required_skills', []))
-        critical_skills = set(job_requirements.get('critical_skills', []))
+        # Skill sets as registry bitsets
+        registry = self.registry
+        user_skills = registry.to_bits(user_profile.get('skills', {}).get('technical_skills', []))
+        required_skills = registry.to_bits(job_requirements.get('required_skills', []))
+        critical_skills = registry.to_bits(job_requirements.get('critical_skills', []))
         
         # Skills match
         matching_skills = user_skills & required_skills
-        missing_skills = required_skills - user_skills
+        missing_skills = required_skills & ~user_skills
         matching_critical = user_skills & critical_skills
-        missing_critical = critical_skills - user_skills
+        missing_critical = critical_skills & ~user_skills
         
         # Calculate percentages
-        skills_match_percentage = (len(matching_skills) / len(required_skills) * 100) if required_skills else 0
-        critical_match_percentage = (len(matching_critical) / len(critical_skills) * 100) if critical_skills else 0
+        skills_match_percentage = (registry.count(matching_skills) / registry.count(required_skills) * 100) if required_skills else 0
+        critical_match_percentage = (registry.count(matching_critical) / registry.count(critical_skills) * 100) if critical_skills else 0
+        exact_skills_match_percentage = skills_match_percentage
+        
+        # Soft match: partial credit through similar skills
+        vectors = self._soft_vectors(soft)
+        partial_matches = []
+        if vectors is not None:
+            # One credits call for required and critical skills together
+            user_ids = registry.ids_of(user_skills)
+            scored_ids = registry.ids_of(required_skills | critical_skills)
+            credit, via = vectors.credits(user_ids, scored_ids)
+            required_ids = [skill_id for skill_id in scored_ids if required_skills >> skill_id & 1]
+            credit_of = dict(zip(scored_ids, zip(credit, via)))
+            
+            if required_ids:
+                skills_match_percentage = sum(credit_of[i][0] for i in required_ids) / len(required_ids) * 100
+            if critical_skills:
+                critical_credit = [credit_of[i][0] for i in scored_ids if critical_skills >> i & 1]
+                critical_match_percentage = sum(critical_credit) / len(critical_credit) * 100
+            
+            partial_matches = [
+                {
+                    "skill": registry.names[skill_id],
+                    "closest_skill": registry.names[credit_of[skill_id][1]],
+                    "similarity": round(credit_of[skill_id][0], 3)
+                }
+                for skill_id in required_ids
+                if 0 < credit_of[skill_id][0] < 1
+            ]
         
         # Experience match
         user_experience = user_profile.get('experience', {}).get('years', 0)
@@ -175,22 +239,131 @@ class JobMatcher:
             "overall_match_score": round(overall_score, 2),
             "skills_match_percentage": round(skills_match_percentage, 2),
             "critical_skills_match_percentage": round(critical_match_percentage, 2),
-            "matching_skills": sorted(list(matching_skills)),
-            "missing_skills": sorted(list(missing_skills)),
-            "missing_critical_skills": sorted(list(missing_critical)),
+            "matching_skills": registry.from_bits(matching_skills),
+            "missing_skills": registry.from_bits(missing_skills),
+            "missing_critical_skills": registry.from_bits(missing_critical),
             "experience_match": experience_match,
             "user_experience_years": user_experience,
             "required_experience_years": required_experience,
             "recommendation": self.get_recommendation(overall_score)
         }
+        if vectors is not None:
+            match_analysis["exact_skills_match_percentage"] = round(exact_skills_match_percentage, 2)
+            match_analysis["partial_matches"] = partial_matches
         
         print(f"✅ Overall Match Score: {overall_score:.2f}%")
         print(f"✅ Skills Match: {skills_match_percentage:.2f}%")
-        print(f"✅ Missing Skills: {len(missing_skills)}")
+        print(f"✅ Missing Skills: {registry.count(missing_skills)}")
         print(f"✅ Recommendation: {match_analysis['recommendation']}\n")
         
         return match_analysis
     
+    @property
+    def job_index(self) -> JobPostingIndex:
+        """Indexed postings corpus, opened on first use (None if not built)"""
+        if self._job_index is None:
+            self._job_index = JobPostingIndex.load()
+        return self._job_index
+    
+    def recommend_jobs(self, user_profile: Dict, k: int = 10,
+                       job_index: JobPostingIndex = None) -> List[Dict[str, Any]]:
+        """Top-k postings from the indexed corpus for a unified profile
+        
+        Scores are the overall_match_score calculate_match_score would give
+        each posting's extracted requirements.
+        """
+        index = job_index or self.job_index
+        if index is None:
+            print("⚠️  Job index not built (run: python analyzers/job_index.py)")
+            return []
+        
+        user_skills = user_profile.get('skills', {}).get('technical_skills', [])
+        user_experience = user_profile.get('experience', {}).get('years', 0)
+        user_ids = set(index.skill_ids_of(user_skills).tolist())
+        
+        recommendations = []
+        for row, score in index.top_k(user_skills, user_experience, k):
+            required = index.required_skills(row)
+            critical = index.critical_skills(row)
+            matching = [s for s in required if index.skill_lookup[s.lower()] in user_ids]
+            matching_critical = [s for s in critical if index.skill_lookup[s.lower()] in user_ids]
+            required_experience = int(index.years[row])
+            
+            recommendations.append({
+                **index.posting(row),
+                "overall_match_score": round(score, 2),
+                "skills_match_percentage": round(len(matching) / len(required) * 100, 2) if required else 0,
+                "critical_skills_match_percentage": round(len(matching_critical) / len(critical) * 100, 2) if critical else 0,
+                "matching_skills": sorted(matching),
+                "missing_skills": sorted(set(required) - set(matching)),
+                "missing_critical_skills": sorted(set(critical) - set(matching_critical)),
+                "experience_match": user_experience >= required_experience,
+                "required_experience_years": required_experience,
+                "recommendation": self.get_recommendation(score)
+            })
+        return recommendations
+    
+    @property
+    def candidate_index(self) -> CandidateIndex:
+        """Indexed stored profiles, opened on first use (None if not built)"""
+        if self._candidate_index is None:
+            self._candidate_index = CandidateIndex.load()
+        return self._candidate_index
+    
+    def rank_candidates(self, job_requirements: Dict, k: int = 10,
+                        candidate_index: CandidateIndex = None) -> List[Dict[str, Any]]:
+        """Top-k stored candidates for one job (the reverse of calculate_match_score)
+        
+        Scores equal calculate_match_score of each candidate's latest stored
+        profile against job_requirements.
+        """
+        index = candidate_index or self.candidate_index
+        if index is None:
+            print("⚠️  Candidate index not built (run: python analyzers/candidate_index.py)")
+            return []
+        
+        registry = self.registry
+        required_skills = registry.to_bits(job_requirements.get('required_skills', []))
+        critical_skills = registry.to_bits(job_requirements.get('critical_skills', []))
+        required_experience = job_requirements.get('years_experience_required', 0)
+        
+        top, stats = index.top_k(job_requirements, k)
+        print(f"✅ Ranked {stats['candidates']} candidates, scored {stats['scored']}")
+        
+        ranking = []
+        for row, score in top:
+            user_skills = registry.to_bits(index.candidate_skills(row))
+            user_experience = float(index.years[row])
+            ranking.append({
+                **index.candidates[row],
+                "overall_match_score": round(score, 2),
+                "matching_skills": registry.from_bits(user_skills & required_skills),
+                "missing_skills": registry.from_bits(required_skills & ~user_skills),
+                "missing_critical_skills": registry.from_bits(critical_skills & ~user_skills),
+                "experience_match": user_experience >= required_experience,
+                "user_experience_years": user_experience,
+                "recommendation": self.get_recommendation(score)
+            })
+        return ranking
+    
+    def score_many(self, profiles: List[Dict], jobs: List[Dict], k: int = 10,
+                   soft: bool = None) -> List[List[Dict[str, Any]]]:
+        """Top-k jobs for each of many profiles, scored in one vectorized pass
+        
+        jobs are job requirements dicts as returned by extract_job_requirements;
+        scores agree with calculate_match_score of every (profile, job) pair.
+        """
+        engine = MatchScoringEngine(self.registry, vectors=self._soft_vectors(soft))
+        top = engine.top_k(profiles, jobs, k)
+        print(f"✅ Scored {len(profiles)} profiles x {len(jobs)} jobs")
+        
+        return [[{
+            "job_index": job,
+            "job_title": jobs[job].get('job_title'),
+            "overall_match_score": round(score, 2),
+            "recommendation": self.get_recommendation(score)
+        } for job, score in row] for row in top]
+    
     def get_recommendation(self, score: float) -> str:
         """Get recommendation based on match score"""
         if score >= 80:
@@ -0,0 +1,149 @@
+"""
+Match Scoring Engine - Score many profiles against many jobs with sparse matrix products
+"""
+
+from typing import Dict, List, Iterable, Iterator, Tuple
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+from skills.registry import SkillRegistry
+from skills.skill_vectors import SkillVectorIndex
+
+
+class MatchScoringEngine:
+    """calculate_match_score for N profiles x M jobs in one pass
+    
+    Profiles become a sparse N x S skill matrix U, jobs a required-skill
+    matrix R and a critical-skill matrix C (M x S, skills numbered by the
+    SkillRegistry). The matched-skill counts of every pair are then U @ R.T
+    and U @ C.T, and the weighted score is assembled from them with the same
+    operations, in the same order, as calculate_match_score. Profiles are
+    processed in row blocks sized so each dense N_block x M block stays
+    under block_bytes.
+    
+    Given skill vectors, U is replaced by the soft credit matrix
+    SkillVectorIndex.expand(U), so the same products sum partial credits.
+    """
+    
+    # Dense float64 arrays alive per block cell while a block is scored
+    ARRAYS_PER_BLOCK = 4
+    
+    def __init__(self, registry: SkillRegistry = None, block_bytes: int = None,
+                 vectors: SkillVectorIndex = None):
+        self.registry = registry or SkillRegistry.for_tech_skills()
+        self.block_bytes = block_bytes or Config.MATCH_BLOCK_BYTES
+        self.vectors = vectors
+    
+    def _skill_matrix(self, skill_lists: Iterable[Iterable[str]]) -> sparse.csr_matrix:
+        """Binary rows x skills matrix; aliases and repeats collapse like to_bits"""
+        indptr, indices = [0], []
+        for skills in skill_lists:
+            indices.extend(sorted({self.registry.intern(skill) for skill in skills}))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        return sparse.csr_matrix(
+            (data, np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.registry)),
+        )
+    
+    def encode_profiles(self, profiles: List[Dict]) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Skill matrix and years of experience of unified profiles"""
+        skills = self._skill_matrix(
+            profile.get('skills', {}).get('technical_skills', []) for profile in profiles
+        )
+        years = np.array([
+            profile.get('experience', {}).get('years', 0) for profile in profiles
+        ], dtype=np.float64)
+        return skills, years
+    
+    def encode_jobs(self, jobs: List[Dict]) -> Tuple[sparse.csr_matrix, sparse.csr_matrix, np.ndarray]:
+        """Required and critical skill matrices and required years of job requirements"""
+        required = self._skill_matrix(job.get('required_skills', []) for job in jobs)
+        critical = self._skill_matrix(job.get('critical_skills', []) for job in jobs)
+        years = np.array([
+            job.get('years_experience_required', 0) for job in jobs
+        ], dtype=np.float64)
+        return required, critical, years
+    
+    @staticmethod
+    def _pad(matrix: sparse.csr_matrix, num_skills: int) -> sparse.csr_matrix:
+        """Widen a skill matrix to the registry size reached after encoding everything"""
+        return sparse.csr_matrix((matrix.data, matrix.indices, matrix.indptr),
+                                 shape=(matrix.shape[0], num_skills))
+    
+    def block_rows(self, num_jobs: int) -> int:
+        """Profiles per block so a block's dense arrays fit in block_bytes"""
+        return max(1, self.block_bytes // (max(num_jobs, 1) * 8 * self.ARRAYS_PER_BLOCK))
+    
+    def iter_score_blocks(self, profiles: List[Dict],
+                          jobs: List[Dict]) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (first profile row, block of overall scores) for row blocks of profiles"""
+        user_skills, user_years = self.encode_profiles(profiles)
+        required, critical, required_years = self.encode_jobs(jobs)
+        
+        num_skills = len(self.registry)
+        user_skills = self._pad(user_skills, num_skills)
+        required_t = self._pad(required, num_skills).T.tocsc()
+        critical_t = self._pad(critical, num_skills).T.tocsc()
+        
+        required_counts = np.asarray(required.sum(axis=1)).ravel()
+        critical_counts = np.asarray(critical.sum(axis=1)).ravel()
+        has_required = required_counts > 0
+        has_critical = critical_counts > 0
+        
+        step = self.block_rows(len(jobs))
+        for start in range(0, len(profiles), step):
+            block = user_skills[start:start + step]
+            if self.vectors is not None:
+                block = self.vectors.expand(block)
+            matched = (block @ required_t).toarray()
+            matched_critical = (block @ critical_t).toarray()
+            
+            # Same operations, same order as calculate_match_score
+            skills_match_percentage = np.divide(
+                matched, required_counts, out=np.zeros_like(matched), where=has_required) * 100
+            critical_match_percentage = np.divide(
+                matched_critical, critical_counts, out=np.zeros_like(matched_critical),
+                where=has_critical) * 100
+            experience_match = user_years[start:start + step, None] >= required_years[None, :]
+            
+            yield start, (
+                skills_match_percentage * 0.5 +
+                critical_match_percentage * 0.3 +
+                np.where(experience_match, 100.0, 0.0) * 0.2
+            )
+    
+    def score_matrix(self, profiles: List[Dict], jobs: List[Dict]) -> np.ndarray:
+        """Full N x M overall score matrix (only for sizes that fit in memory)"""
+        scores = np.zeros((len(profiles), len(jobs)))
+        for start, block in self.iter_score_blocks(profiles, jobs):
+            scores[start:start + len(block)] = block
+        return scores
+    
+    def top_k(self, profiles: List[Dict], jobs: List[Dict],
+              k: int = 10) -> List[List[Tuple[int, float]]]:
+        """For every profile, the k best (job index, score), best first, ties by job index"""
+        k = min(k, len(jobs))
+        results: List[List[Tuple[int, float]]] = []
+        if k <= 0:
+            return [[] for _ in profiles]
+        
+        for _, block in self.iter_score_blocks(profiles, jobs):
+            if k < block.shape[1]:
+                # k-th best score per row, then every column reaching it
+                # (so ties at the cut are resolved by job index below)
+                kth = np.partition(block, -k, axis=1)[:, -k]
+            else:
+                kth = block.min(axis=1)
+            
+            for row, cutoff in zip(block, kth):
+                columns = np.flatnonzero(row >= cutoff)
+                order = np.lexsort((columns, -row[columns]))[:k]
+                results.append([(int(columns[i]), float(row[columns[i]])) for i in order])
+        return results
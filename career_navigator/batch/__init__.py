@@ -0,0 +1,7 @@
+"""
+Batch processing for Career Navigator
+"""
+
+from .runner import BatchRunner, load_manifest
+
+__all__ = ['BatchRunner', 'load_manifest']
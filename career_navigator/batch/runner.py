@@ -0,0 +1,195 @@
+"""
+Batch Runner - Run CareerNavigator over a manifest of candidates on a process pool
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import redirect_stdout
+from typing import Dict, List, Set, Any
+from pathlib import Path
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+
+
+# Manifest columns, in CareerNavigator.run argument order
+MANIFEST_FIELDS = ("resume_path", "github_username", "linkedin_path", "dream_job")
+
+
+def load_manifest(manifest_path: str) -> List[Dict[str, Any]]:
+    """Read candidate rows from a .csv (with header) or .jsonl manifest
+    
+    Every row gets an "id": the manifest's own id column when present,
+    otherwise a hash of the row, so ids stay stable across restarts.
+    A dream_job_path column is read into dream_job.
+    """
+    path = Path(manifest_path)
+    
+    if path.suffix.lower() == ".csv":
+        with open(path, newline='', encoding='utf-8') as f:
+            raw_rows = list(csv.DictReader(f))
+    elif path.suffix.lower() in (".jsonl", ".ndjson"):
+        with open(path, encoding='utf-8') as f:
+            raw_rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        raise ValueError(f"Unsupported manifest format: {path.suffix} (use .csv or .jsonl)")
+    
+    rows = []
+    seen: Set[str] = set()
+    for raw in raw_rows:
+        row = {field: (raw.get(field) or "").strip() or None for field in MANIFEST_FIELDS}
+        
+        dream_job_path = (raw.get("dream_job_path") or "").strip()
+        if dream_job_path and not row["dream_job"]:
+            row["dream_job"] = Path(dream_job_path).read_text(encoding='utf-8').strip() or None
+        
+        row_id = str(raw.get("id") or "").strip()
+        if not row_id:
+            row_id = hashlib.sha256(json.dumps(row, sort_keys=True).encode()).hexdigest()[:16]
+        if row_id in seen:
+            raise ValueError(f"Duplicate manifest id: {row_id}")
+        seen.add(row_id)
+        
+        row["id"] = row_id
+        rows.append(row)
+    return rows
+
+
+def read_checkpoint(output_path: Path, retry_failed: bool = False) -> Set[str]:
+    """Ids already written to the results file
+    
+    The results file doubles as the checkpoint: every finished row is one
+    complete JSON line. A line cut short by a crash is dropped from the file
+    so the next append starts on a clean line.
+    """
+    if not output_path.exists():
+        return set()
+    
+    done: Set[str] = set()
+    valid_bytes = 0
+    with open(output_path, 'rb') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b"\n"):
+                break
+            valid_bytes += len(line)
+            if record.get("status") == "ok" or not retry_failed:
+                done.add(record["id"])
+    
+    if valid_bytes < output_path.stat().st_size:
+        with open(output_path, 'r+b') as f:
+            f.truncate(valid_bytes)
+    return done
+
+
+# Per-worker state, created once by _init_worker
+_navigator = None
+_quiet = True
+
+
+def _init_worker(quiet: bool):
+    """Build one CareerNavigator per worker and load its models up front"""
+    global _navigator, _quiet
+    _quiet = quiet
+    
+    from main import CareerNavigator
+    from nlp.model_registry import NLPModelRegistry
+    
+    with redirect_stdout(io.StringIO() if quiet else sys.stdout):
+        _navigator = CareerNavigator()
+        NLPModelRegistry.get(Config.SPACY_MODEL, ner_only=True)
+
+
+def _run_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze one manifest row in a worker; failures become error records"""
+    start = time.perf_counter()
+    record = {"id": row["id"], "worker_pid": os.getpid()}
+    try:
+        with redirect_stdout(io.StringIO() if _quiet else sys.stdout):
+            result = _navigator.run(
+                **{field: row[field] for field in MANIFEST_FIELDS},
+                save_outputs=False,
+                candidate_id=row["id"],
+            )
+        record.update(status="ok", result=result)
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+    record["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+class BatchRunner:
+    """Analyze many candidates in parallel and stream results to JSONL
+    
+    Rows are spread over a process pool (one CareerNavigator and spaCy model
+    per worker, so analyses share nothing and scale with cores). Each result
+    is appended to the output file and flushed as soon as it finishes, and
+    rows already in the file are skipped on restart.
+    """
+    
+    def __init__(self, workers: int = None, quiet: bool = True):
+        self.workers = max(1, workers or Config.BATCH_WORKERS)
+        self.quiet = quiet
+    
+    def run(self, manifest_path: str, output_path: str = None,
+            retry_failed: bool = False) -> Dict[str, Any]:
+        """Process every unfinished manifest row; returns run counters"""
+        rows = load_manifest(manifest_path)
+        output_path = Path(output_path or Config.OUTPUT_DIR / "batch_results.jsonl")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        done = read_checkpoint(output_path, retry_failed)
+        pending = [row for row in rows if row["id"] not in done]
+        total = len(pending)
+        
+        print(f"📦 Batch: {len(rows)} rows, {len(rows) - total} already done, "
+              f"{total} to run on {self.workers} worker(s)")
+        print(f"   Results: {output_path}\n")
+        
+        stats = {"total": len(rows), "skipped": len(rows) - total, "ok": 0, "error": 0}
+        start = time.perf_counter()
+        
+        with open(output_path, 'a', encoding='utf-8') as out, \
+                ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                    initargs=(self.quiet,)) as pool:
+            # Keep a bounded number of rows in flight so huge manifests are
+            # not all submitted (and held in memory) at once
+            in_flight = set()
+            for row in pending:
+                in_flight.add(pool.submit(_run_row, row))
+                if len(in_flight) >= self.workers * 2:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    self._write(out, finished, stats, total)
+            while in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                self._write(out, finished, stats, total)
+        
+        stats["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+        print(f"\n✅ Batch complete: {stats['ok']} ok, {stats['error']} failed, "
+              f"{stats['skipped']} skipped in {stats['elapsed_seconds']}s")
+        return stats
+    
+    def _write(self, out, finished, stats: Dict[str, Any], total: int):
+        """Append finished rows to the results file and report progress"""
+        for future in finished:
+            record = future.result()
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+            
+            stats[record["status"]] += 1
+            count = stats["ok"] + stats["error"]
+            if record["status"] == "ok":
+                print(f"✅ [{count}/{total}] {record['id']} ({record['elapsed_seconds']}s)")
+            else:
+                print(f"❌ [{count}/{total}] {record['id']}: {record['error']}")
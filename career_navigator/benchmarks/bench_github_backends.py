@@ -0,0 +1,121 @@
+"""
+Benchmark - REST and GraphQL backends must produce identical analyze_profile output
+
+Runs against the fake GitHub API, whose repositories include empty repos,
+READMEs outside the root spellings GraphQL looks up (README.markdown, docs/,
+.github/) and a repo with more than 100 languages. Checks:
+
+    full          GITHUB_BACKEND=rest vs graphql, one full fetch each
+    incremental   the same after a push, through list_profile + fetch_details
+    fallback      auto backend with /graphql missing (404), answering HTML,
+                  or unreachable: must fall back to REST
+    not found     an unknown user over GraphQL must not be retried over REST
+
+Exits non-zero if any check fails.
+
+Run from the career_navigator directory:
+    python benchmarks/bench_github_backends.py [--repos 20]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from benchmarks.fake_github import FakeGitHub
+
+
+def make_analyzer(github: FakeGitHub, backend: str, snapshot_dir: str = None):
+    from parsers.github_analyzer import GitHubAnalyzer
+    from parsers.github_snapshot import GitHubSnapshotStore
+
+    analyzer = GitHubAnalyzer(token="fake-token", base_url=github.url, backend=backend)
+    if snapshot_dir is not None:
+        analyzer.snapshots = GitHubSnapshotStore(Path(snapshot_dir))
+    return analyzer
+
+
+def analyze(analyzer, username: str):
+    """analyze_profile output with the (unordered) README skills sorted; returns (profile, seconds)"""
+    start = time.perf_counter()
+    profile = analyzer.analyze_profile(username)
+    elapsed = time.perf_counter() - start
+    profile["skills_from_repos"] = sorted(profile.get("skills_from_repos", []))
+    return profile, elapsed
+
+
+def report(name: str, ok: bool, detail: str = "") -> bool:
+    print(f"{'✅' if ok else '❌'} {name}{f' ({detail})' if detail else ''}")
+    return ok
+
+
+def check_full(args) -> bool:
+    with FakeGitHub(repo_count=args.repos) as github:
+        rest, rest_seconds = analyze(make_analyzer(github, "rest"), github.login)
+        graphql, graphql_seconds = analyze(make_analyzer(github, "graphql"), github.login)
+    if not rest:
+        return report("full fetch", False, "REST analysis returned nothing")
+    return report("full fetch: REST == GraphQL", rest == graphql,
+                  f"REST {rest_seconds:.2f}s, GraphQL {graphql_seconds:.2f}s")
+
+
+def check_incremental(args) -> bool:
+    results = {}
+    for backend in ("rest", "graphql"):
+        with FakeGitHub(repo_count=args.repos) as github, tempfile.TemporaryDirectory() as snapshot_dir:
+            analyzer = make_analyzer(github, backend, snapshot_dir)
+            analyze(analyzer, github.login)
+            # Push to a repo with a docs/ README and to the one with >100 languages
+            for name in sorted(github.repos)[3::3]:
+                github.repos[name]["pushed_at"] = "2024-06-01T12:00:00Z"
+            results[backend], _ = analyze(analyzer, github.login)
+    return report("incremental refresh: REST == GraphQL", bool(results["rest"]) and results["rest"] == results["graphql"])
+
+
+def check_fallback(args, baseline) -> bool:
+    ok = True
+    for mode in ("missing", "broken", "unreachable"):
+        with FakeGitHub(repo_count=args.repos, graphql="broken" if mode == "broken" else
+                        "missing" if mode == "missing" else "on") as github:
+            analyzer = make_analyzer(github, "auto")
+            if mode == "unreachable":
+                # Nothing listens on port 1
+                analyzer.github.graphql_url = lambda: "http://127.0.0.1:1/graphql"
+            profile, _ = analyze(analyzer, github.login)
+        ok &= report(f"fallback when GraphQL is {mode}", profile == baseline)
+    return ok
+
+
+def check_not_found(args) -> bool:
+    with FakeGitHub(repo_count=args.repos) as github:
+        profile, _ = analyze(make_analyzer(github, "auto"), "no-such-user")
+        rest_calls = github.requests_by_path["/users/no-such-user"]
+    return report("unknown user is not retried over REST", profile == {"skills_from_repos": []} and not rest_calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=20)
+    args = parser.parse_args()
+
+    # Read when config is imported; every run fetches from the API
+    os.environ["GITHUB_CACHE_ENABLED"] = "false"
+    os.environ["GITHUB_INCREMENTAL"] = "false"
+
+    print(f"📊 GitHub backend parity ({args.repos} repos)\n")
+    with FakeGitHub(repo_count=args.repos) as github:
+        baseline, _ = analyze(make_analyzer(github, "rest"), github.login)
+
+    results = [check_full(args), check_incremental(args), check_fallback(args, baseline), check_not_found(args)]
+    if not all(results):
+        sys.exit(1)
+    print("\n✅ Both backends produce identical profiles")
+
+
+if __name__ == "__main__":
+    main()
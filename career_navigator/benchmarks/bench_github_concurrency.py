@@ -0,0 +1,72 @@
+"""
+Benchmark - GitHub analysis with per-repo calls on the thread pool vs one at a time
+
+Starts the fake GitHub API with a sleep per request, points GITHUB_API_URL at
+it and analyzes the same profile with max_workers=1 and max_workers=N. Both
+runs must produce identical analyze_profile output; exits non-zero otherwise.
+
+Run from the career_navigator directory:
+    python benchmarks/bench_github_concurrency.py [--repos 20] [--latency 0.05] [--workers 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from benchmarks.fake_github import FakeGitHub
+
+
+def analyze(max_workers: int, username: str):
+    """Analyze the fake profile once; returns (profile, seconds, requests sent)"""
+    from parsers.github_analyzer import GitHubAnalyzer
+
+    analyzer = GitHubAnalyzer(token="fake-token", max_workers=max_workers, backend="rest")
+    start = time.perf_counter()
+    profile = analyzer.analyze_profile(username)
+    elapsed = time.perf_counter() - start
+    requests_sent = analyzer.github.request_count
+    analyzer.github.close()
+
+    # README skills come from a set; their order carries no meaning
+    profile["skills_from_repos"] = sorted(profile.get("skills_from_repos", []))
+    return profile, elapsed, requests_sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds slept per request")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    with FakeGitHub(repo_count=args.repos, latency=args.latency) as github:
+        # Read when config is imported; nothing is cached between the two runs
+        os.environ["GITHUB_API_URL"] = github.url
+        os.environ["GITHUB_CACHE_ENABLED"] = "false"
+        os.environ["GITHUB_INCREMENTAL"] = "false"
+
+        print(f"📊 GitHub fetch benchmark ({args.repos} repos, {args.latency * 1000:.0f} ms per request)\n")
+        serial, serial_seconds, serial_requests = analyze(1, github.login)
+        concurrent, concurrent_seconds, concurrent_requests = analyze(args.workers, github.login)
+
+    print(f"{'max_workers':<14}{'seconds':>10}{'requests':>10}")
+    print(f"{1:<14}{serial_seconds:>10.2f}{serial_requests:>10}")
+    print(f"{args.workers:<14}{concurrent_seconds:>10.2f}{concurrent_requests:>10}")
+    print(f"\nSpeedup: {serial_seconds / concurrent_seconds:.1f}x")
+
+    if not serial:
+        print("❌ The analysis returned nothing")
+        sys.exit(1)
+    if serial != concurrent:
+        print("❌ Concurrent output differs from the serial output")
+        sys.exit(1)
+    print("✅ Concurrent and serial outputs are identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark - GitHub analysis against a fake API that enforces per-token rate limits
+
+The fake GitHub API gives every token of the pool a fixed number of requests
+per window and answers 403 once a token is spent. Two scenarios:
+
+    rotation   enough pooled quota for the analysis, but not on one token:
+               the scheduler must spread requests over all tokens
+    slowdown   less pooled quota than the analysis needs: the scheduler
+               must pace requests and wait for resets instead of failing
+
+Both must produce the same analyze_profile output as an unlimited run;
+exits non-zero otherwise.
+
+Run from the career_navigator directory:
+    python benchmarks/bench_github_rate_limit.py [--repos 20] [--tokens 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from benchmarks.fake_github import FakeGitHub
+
+
+def analyze(github: FakeGitHub):
+    """Analyze the fake profile with the GITHUB_TOKENS pool; returns (profile, seconds, scheduler budget)"""
+    from parsers.github_analyzer import GitHubAnalyzer
+
+    analyzer = GitHubAnalyzer(base_url=github.url, backend="rest")
+    start = time.perf_counter()
+    profile = analyzer.analyze_profile(github.login)
+    elapsed = time.perf_counter() - start
+    budget = analyzer.rate_limit_budget()
+    analyzer.github.close()
+
+    # README skills come from a set; their order carries no meaning
+    profile["skills_from_repos"] = sorted(profile.get("skills_from_repos", []))
+    return profile, elapsed, budget
+
+
+def run_scenario(name: str, args, tokens, limit: int, window: float, baseline):
+    """Analyze under the given limit; returns (passed, scheduler budget)"""
+    with FakeGitHub(repo_count=args.repos, rate_limit=limit, window=window) as github:
+        profile, seconds, budget = analyze(github)
+
+    print(f"\n{name}: {limit} requests per token every {window:g}s, {len(tokens)} token(s)")
+    print(f"{'token':<10}{'requests':>10}{'403s':>8}")
+    for token in tokens:
+        print(f"{token:<10}{github.requests_by_token[token]:>10}{github.rejected_by_token[token]:>8}")
+    print(f"Took {seconds:.2f}s, throttled {budget['throttled_seconds']:.2f}s of it "
+          f"({budget['thread_wait_seconds']:.2f}s summed over threads), "
+          f"{budget['rate_limited_responses']} rate-limited response(s) retried")
+
+    ok = True
+    if profile != baseline:
+        print("❌ Output differs from the unlimited run")
+        ok = False
+    unused = [token for token in tokens if not github.requests_by_token[token]]
+    if unused:
+        print(f"❌ Tokens never used: {', '.join(unused)}")
+        ok = False
+    return ok, budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=20)
+    parser.add_argument("--tokens", type=int, default=3)
+    args = parser.parse_args()
+
+    tokens = [f"token-{i}" for i in range(1, args.tokens + 1)]
+
+    # Read when config is imported; nothing is cached between runs
+    os.environ["GITHUB_TOKENS"] = ",".join(tokens)
+    os.environ["GITHUB_CACHE_ENABLED"] = "false"
+    os.environ["GITHUB_INCREMENTAL"] = "false"
+    # Small quotas, so scale the pacing thresholds down with them
+    os.environ["GITHUB_RATE_LIMIT_SLOWDOWN"] = "10"
+    os.environ["GITHUB_RATE_LIMIT_RESERVE"] = "1"
+    os.environ["GITHUB_RATE_LIMIT_MAX_WAIT"] = "60"
+
+    with FakeGitHub(repo_count=args.repos) as github:
+        baseline, _, _ = analyze(github)
+        needed = sum(github.requests_by_token.values())
+    if not baseline:
+        print("❌ The unlimited analysis returned nothing")
+        sys.exit(1)
+    print(f"📊 GitHub rate limit benchmark ({args.repos} repos, {needed} requests per analysis)")
+
+    # More than one token's worth of requests, less than the pool's quota
+    per_token = needed // len(tokens) + needed // 2
+    rotation_ok, _ = run_scenario("rotation", args, tokens, per_token, 60.0, baseline)
+
+    # A third of the requests fit before the first reset
+    per_token = max(needed // (3 * len(tokens)), 4)
+    slowdown_ok, budget = run_scenario("slowdown", args, tokens, per_token, 2.0, baseline)
+    if budget["throttled_seconds"] <= 0:
+        print("❌ The scheduler never slowed down")
+        slowdown_ok = False
+
+    if not (rotation_ok and slowdown_ok):
+        sys.exit(1)
+    print("\n✅ The pool rotated tokens and slowed down instead of failing")
+
+
+if __name__ == "__main__":
+    main()
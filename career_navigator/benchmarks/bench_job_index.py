@@ -0,0 +1,168 @@
+"""
+Benchmark - JobPostingIndex.top_k latency on a synthetic index of a million postings
+
+Writes the index arrays directly (no CSV parsing, no skill extraction).
+Postings draw 5-12 required skills from --skills skills with Zipf-like
+popularity (skill i is drawn with weight 1 / i ** --skew), and 1-4 of those
+skills are critical. Each query is a profile of 5-15 skills drawn the same
+way. At the default skew the most common skills are in about half of all
+postings, so most queries overlap with most of the index: the worst case
+for top_k. --skew 0 draws skills uniformly, so a profile overlaps with
+about a fifth of the postings.
+
+    top_k      the index path: only postings sharing a skill with the profile
+    full scan  every posting scored with dense per-posting hit counts; also
+               the reference the top_k results are checked against
+
+Exits non-zero if any top_k result differs from the full scan.
+
+Run from the career_navigator directory:
+    python benchmarks/bench_job_index.py [--postings 1000000] [--skills 400] [--skew 0.8] [--queries 200]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from analyzers.job_index import JobPostingIndex
+
+
+def skill_weights(num_skills: int, skew: float) -> np.ndarray:
+    weights = 1.0 / np.arange(1, num_skills + 1) ** skew
+    return weights / weights.sum()
+
+
+def draw_skill_sets(rng: np.random.Generator, count: int, low: int, high: int,
+                    weights: np.ndarray):
+    """count distinct-skill sets of low..high skills each, as CSR (indptr, ids)"""
+    draws = rng.choice(len(weights), size=(count, 2 * high), p=weights).astype(np.int32)
+    draws.sort(axis=1)
+    duplicate = np.zeros(draws.shape, dtype=bool)
+    duplicate[:, 1:] = draws[:, 1:] == draws[:, :-1]
+    # Random order among the distinct draws, duplicates last
+    keys = np.where(duplicate, 2.0, rng.random(draws.shape))
+    draws = np.take_along_axis(draws, np.argsort(keys, axis=1), axis=1)
+    sizes = np.minimum(rng.integers(low, high + 1, size=count), (~duplicate).sum(axis=1))
+    keep = np.arange(2 * high)[None, :] < sizes[:, None]
+    indptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(sizes, out=indptr[1:])
+    return indptr, draws[keep]
+
+
+def build_index(index_dir: Path, postings: int, num_skills: int, skew: float,
+                seed: int = 0) -> JobPostingIndex:
+    rng = np.random.default_rng(seed)
+    weights = skill_weights(num_skills, skew)
+    req_indptr, req_ids = draw_skill_sets(rng, postings, 5, 12, weights)
+
+    # Critical skills: the first 1-4 required skills of each posting
+    req_counts = np.diff(req_indptr)
+    crit_counts = np.minimum(rng.integers(1, 5, size=postings), req_counts)
+    crit_indptr = np.zeros(postings + 1, dtype=np.int64)
+    np.cumsum(crit_counts, out=crit_indptr[1:])
+    position = np.arange(len(req_ids)) - np.repeat(req_indptr[:-1], req_counts)
+    crit_ids = req_ids[position < np.repeat(crit_counts, req_counts)]
+
+    empty_offsets = np.zeros(postings + 1, dtype=np.int64)
+    JobPostingIndex._write_arrays(index_dir, num_skills, {
+        "years": rng.integers(0, 9, size=postings).astype(np.int32),
+        "req_indptr": req_indptr,
+        "req_ids": req_ids,
+        "crit_indptr": crit_indptr,
+        "crit_ids": crit_ids,
+        **{f"{column}_offsets": empty_offsets for column in JobPostingIndex.COLUMNS},
+    })
+    for column in JobPostingIndex.COLUMNS:
+        (index_dir / f"{column}.bin").write_bytes(b"")
+    (index_dir / "meta.json").write_text(json.dumps({
+        "version": JobPostingIndex.VERSION,
+        "source": "synthetic",
+        "postings": postings,
+        "skills": [f"skill{i}" for i in range(num_skills)],
+        "built_at": time.time(),
+    }), encoding='utf-8')
+    return JobPostingIndex(index_dir)
+
+
+def full_scan(index: JobPostingIndex, user_skills, user_years: float, k: int):
+    """Score every posting, then take the k best, best first, ties by row"""
+    skill_ids = index.skill_ids_of(user_skills)
+    required = np.isin(index.req_ids, skill_ids)
+    critical = np.isin(index.crit_ids, skill_ids)
+    matched_required = np.add.reduceat(required, index.req_indptr[:-1]) * (index.req_counts > 0)
+    matched_critical = np.add.reduceat(critical, index.crit_indptr[:-1]) * (index.crit_counts > 0)
+    required, critical = index.req_counts, index.crit_counts
+    skills_pct = np.where(required > 0, matched_required / np.maximum(required, 1) * 100, 0.0)
+    critical_pct = np.where(critical > 0, matched_critical / np.maximum(critical, 1) * 100, 0.0)
+    experience = np.where(user_years >= index.years, 100, 0)
+    scores = skills_pct * 0.5 + critical_pct * 0.3 + experience * 0.2
+    rows = np.arange(len(index))
+    order = np.lexsort((rows, -scores))[:k]
+    return [(int(rows[i]), float(scores[i])) for i in order]
+
+
+def percentile_ms(seconds, q: float) -> float:
+    return float(np.percentile(seconds, q)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=1_000_000)
+    parser.add_argument("--skills", type=int, default=400)
+    parser.add_argument("--skew", type=float, default=0.8)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scans", type=int, default=10, help="queries also run as a full scan")
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        start = time.perf_counter()
+        index = build_index(Path(index_dir), args.postings, args.skills, args.skew)
+        print(f"📊 Job index benchmark ({len(index)} postings, {args.skills} skills, skew {args.skew}, "
+              f"{len(index.req_ids)} skill entries, built in {time.perf_counter() - start:.1f}s)\n")
+
+        rng = np.random.default_rng(1)
+        profile_indptr, profile_ids = draw_skill_sets(rng, args.queries, 5, 15, skill_weights(args.skills, args.skew))
+        queries = [
+            ([index.skills[i] for i in profile_ids[profile_indptr[q]:profile_indptr[q + 1]]],
+             int(rng.integers(0, 11)))
+            for q in range(args.queries)
+        ]
+        # Plus a profile no posting shares a skill with
+        queries.append((["Not A Skill"], 5))
+
+        top_k_seconds, results = [], []
+        for user_skills, user_years in queries:
+            start = time.perf_counter()
+            results.append(index.top_k(user_skills, user_years, args.k))
+            top_k_seconds.append(time.perf_counter() - start)
+
+        scan_seconds, mismatches = [], 0
+        checked = queries[:args.scans] + queries[-1:]
+        for (user_skills, user_years), result in zip(checked, results[:args.scans] + results[-1:]):
+            start = time.perf_counter()
+            expected = full_scan(index, user_skills, user_years, args.k)
+            scan_seconds.append(time.perf_counter() - start)
+            mismatches += result != expected
+
+    print(f"{'path':<12}{'queries':>9}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, seconds in (("top_k", top_k_seconds), ("full scan", scan_seconds)):
+        print(f"{name:<12}{len(seconds):>9}{np.mean(seconds) * 1000:>10.1f}"
+              f"{percentile_ms(seconds, 50):>10.1f}{percentile_ms(seconds, 95):>10.1f}")
+
+    if mismatches:
+        print(f"\n❌ {mismatches}/{len(checked)} top_k results differ from the full scan")
+        sys.exit(1)
+    print(f"\n✅ top_k matches the full scan on {len(checked)} queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark - spaCy startup time and memory, per-parser loads vs shared registry
+
+Run from the career_navigator directory:
+    python benchmarks/bench_nlp_startup.py [--model en_core_web_lg]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+
+# Each scenario runs in a fresh interpreter so peak RSS is not shared
+SCENARIOS = {
+    "per_parser_full_load": """
+import spacy
+nlp_resume = spacy.load(MODEL)
+nlp_linkedin = spacy.load(MODEL)
+nlp_resume(TEXT)
+""",
+    "shared_registry_ner_only": """
+from nlp.model_registry import NLPModelRegistry
+nlp_resume = NLPModelRegistry.get(MODEL, ner_only=True)
+nlp_linkedin = NLPModelRegistry.get(MODEL, ner_only=True)
+nlp_resume(TEXT)
+""",
+}
+
+HARNESS = """
+import json, resource, sys, time
+sys.path.insert(0, {base!r})
+MODEL = {model!r}
+TEXT = "John Doe is a Senior Software Engineer at Google in San Francisco."
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "peak_rss_mb": peak_kb / 1024}}))
+"""
+
+
+def run_scenario(body: str, model: str) -> dict:
+    """Run one scenario in a subprocess and return its measurements"""
+    code = HARNESS.format(base=str(BASE_DIR), model=model, body=body)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="en_core_web_lg")
+    args = parser.parse_args()
+
+    print(f"📊 spaCy startup benchmark ({args.model})\n")
+    for name, body in SCENARIOS.items():
+        result = run_scenario(body, args.model)
+        print(f"   {name:<28} {result['seconds']:7.2f}s   {result['peak_rss_mb']:8.1f} MB peak RSS")
+
+
+if __name__ == "__main__":
+    main()
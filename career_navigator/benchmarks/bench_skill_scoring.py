@@ -0,0 +1,161 @@
+"""
+Benchmark - exact vs soft skill scoring, one pair at a time and with MatchScoringEngine
+
+Soft matching needs skill vectors. So that the benchmark runs without a spaCy
+model that has word vectors, it writes a synthetic SkillVectorIndex for the
+tech skill dictionary. Skills are drawn around a few cluster centres, so each
+skill has neighbours above SKILL_SOFT_MIN_SIMILARITY as with real vectors.
+Profiles and jobs are random draws from the dictionary.
+
+    scalar   JobMatcher.calculate_match_score over --pairs (profile, job) pairs
+    engine   MatchScoringEngine.score_matrix over --profiles x --jobs
+
+Each timing is the best of --repeat runs. Soft engine scores are checked
+against soft calculate_match_score on a sample of pairs; exits non-zero if
+they disagree.
+
+Run from the career_navigator directory:
+    python benchmarks/bench_skill_scoring.py [--profiles 10000] [--jobs 5000] [--pairs 20000] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from config import Config
+from skills.registry import SkillRegistry
+from skills.skill_vectors import SkillVectorIndex
+
+
+def synthetic_vectors(registry: SkillRegistry, index_dir: Path, clusters: int = 12,
+                      dim: int = 64, seed: int = 0) -> SkillVectorIndex:
+    """Write a SkillVectorIndex of clustered random unit vectors and open it"""
+    rng = np.random.default_rng(seed)
+    skills = registry.names[:registry.dictionary_size]
+    centres = rng.normal(size=(clusters, dim))
+    vectors = centres[rng.integers(clusters, size=len(skills))] + rng.normal(scale=0.8, size=(len(skills), dim))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+    knn_ids, knn_sims = SkillVectorIndex._neighbours(vectors, Config.SKILL_KNN_K,
+                                                     Config.SKILL_SOFT_MIN_SIMILARITY)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    for name, values in (("vectors", vectors), ("knn_ids", knn_ids), ("knn_sims", knn_sims)):
+        np.save(index_dir / f"{name}.npy", values)
+    (index_dir / "meta.json").write_text(json.dumps({
+        "version": SkillVectorIndex.VERSION,
+        "skills": skills,
+        "k": Config.SKILL_KNN_K,
+        "min_similarity": Config.SKILL_SOFT_MIN_SIMILARITY,
+        "built_at": time.time(),
+    }), encoding='utf-8')
+    return SkillVectorIndex(index_dir, registry)
+
+
+def make_profiles(skills, count: int, rng: random.Random):
+    return [{
+        "skills": {"technical_skills": rng.sample(skills, rng.randint(5, 15))},
+        "experience": {"years": rng.randint(0, 10)},
+    } for _ in range(count)]
+
+
+def make_jobs(skills, count: int, rng: random.Random):
+    jobs = []
+    for _ in range(count):
+        required = rng.sample(skills, rng.randint(5, 12))
+        jobs.append({
+            "required_skills": required,
+            "critical_skills": required[:rng.randint(1, 4)],
+            "years_experience_required": rng.randint(0, 8),
+        })
+    return jobs
+
+
+def time_scalar(matcher, pairs, soft: bool):
+    """Seconds to score every pair with calculate_match_score, and the scores"""
+    scores = []
+    # calculate_match_score prints a summary per call; keep it off the terminal
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for profile, job in pairs:
+            scores.append(matcher.calculate_match_score(profile, job, soft=soft)["overall_match_score"])
+        elapsed = time.perf_counter() - start
+    return elapsed, scores
+
+
+def best_of(repeat: int, timed, *args):
+    """Fastest of repeat runs of timed(*args) -> (seconds, result)"""
+    runs = [timed(*args) for _ in range(repeat)]
+    return min(seconds for seconds, _ in runs), runs[0][1]
+
+
+def time_engine(registry, vectors, profiles, jobs):
+    """Seconds for the full score matrix, and the matrix"""
+    from analyzers.match_engine import MatchScoringEngine
+
+    engine = MatchScoringEngine(registry, vectors=vectors)
+    start = time.perf_counter()
+    scores = engine.score_matrix(profiles, jobs)
+    return time.perf_counter() - start, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--profiles", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--pairs", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check", type=int, default=500, help="pairs checked engine vs scalar")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from analyzers.job_matcher import JobMatcher
+        matcher = JobMatcher()
+    registry = matcher.registry
+    skills = registry.names[:registry.dictionary_size]
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        vectors = synthetic_vectors(registry, Path(index_dir))
+        matcher._skill_vectors = vectors
+        links = int((np.asarray(vectors.knn_ids) >= 0).sum())
+        print(f"📊 Skill scoring benchmark ({len(skills)} skills, {links} neighbour links)\n")
+
+        profiles = make_profiles(skills, args.profiles, rng)
+        jobs = make_jobs(skills, args.jobs, rng)
+        pairs = [(rng.choice(profiles), rng.choice(jobs)) for _ in range(args.pairs)]
+
+        exact_scalar, _ = best_of(args.repeat, time_scalar, matcher, pairs, False)
+        soft_scalar, _ = best_of(args.repeat, time_scalar, matcher, pairs, True)
+        exact_engine, _ = best_of(args.repeat, time_engine, registry, None, profiles, jobs)
+        soft_engine, soft_scores = best_of(args.repeat, time_engine, registry, vectors, profiles, jobs)
+
+        print(f"{'path':<36}{'exact s':>10}{'soft s':>10}{'soft/exact':>12}")
+        print(f"{f'scalar ({args.pairs} pairs)':<36}{exact_scalar:>10.2f}{soft_scalar:>10.2f}"
+              f"{soft_scalar / exact_scalar:>11.2f}x")
+        print(f"{f'engine ({args.profiles} x {args.jobs})':<36}{exact_engine:>10.2f}{soft_engine:>10.2f}"
+              f"{soft_engine / exact_engine:>11.2f}x")
+
+        sample = [(rng.randrange(args.profiles), rng.randrange(args.jobs)) for _ in range(args.check)]
+        _, expected = time_scalar(matcher, [(profiles[p], jobs[j]) for p, j in sample], soft=True)
+        mismatches = sum(abs(round(soft_scores[p, j], 2) - score) > 0.011
+                         for (p, j), score in zip(sample, expected))
+
+    if mismatches:
+        print(f"\n❌ {mismatches}/{len(sample)} soft engine scores differ from calculate_match_score")
+        sys.exit(1)
+    print(f"\n✅ Soft engine scores match calculate_match_score on {len(sample)} sampled pairs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+Fake GitHub API - A local stand-in for the REST endpoints GitHubAnalyzer uses
+
+Serves a deterministic user with `repo_count` repositories over http.server:
+/user, /rate_limit, /users/{login}, /users/{login}/repos, and per repo
+/languages, /commits (per_page=1 with a rel="last" link) and /readme, plus
+the /graphql queries of GraphQLBackend. The repositories include the cases
+where the backends differ most: empty repos, READMEs that are not one of the
+root spellings GraphQL looks up (README.markdown, docs/, .github/) and a
+repo with more languages than one languages(first: 100) page.
+
+    latency        seconds slept before answering each request
+    rate_limit     requests per token per window (None = unlimited); every
+                   response carries X-RateLimit-Limit / Remaining / Reset,
+                   and a token with nothing left gets 403 until its reset
+    window         seconds until a token's quota is restored
+    graphql        "on"; "missing" to answer 404 on /graphql (GraphQL turned
+                   off); "broken" to answer 200 with an HTML page
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Any, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "HTML", "CSS", "Shell"]
+README_SKILLS = ["Python", "Django", "React", "Docker", "PostgreSQL", "AWS", "Kubernetes", "Redis"]
+# Where repo i keeps its README (None: no README); only the first two are
+# among the root spellings GraphQLBackend asks for
+README_PATHS = ["README.md", "readme.md", "README.markdown", "docs/README.md", ".github/README.md", None]
+MANY_LANGUAGES = 120   # languages of the last repository
+
+_README_OBJECT = re.compile(r'(\w+): object\(expression: "HEAD:([^"]+)"\)')
+_REPOSITORY_FIELD = re.compile(r'(\w+): repository\(owner: \$(\w+), name: \$(\w+)\)')
+
+
+class FakeGitHub:
+    """Fake GitHub REST API on a background thread; use as a context manager"""
+
+    def __init__(self, login: str = "octocat", repo_count: int = 20, latency: float = 0.0,
+                 rate_limit: Optional[int] = None, window: float = 60.0, graphql: str = "on"):
+        self.login = login
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.window = window
+        self.graphql = graphql
+        self.repos = {f"project-{i:02d}": self._repo(i) for i in range(repo_count)}
+        if repo_count:
+            self.repos[f"project-{repo_count - 1:02d}"]["languages"] = {
+                f"Lang{k:03d}": 10_000 - 50 * k for k in range(MANY_LANGUAGES)
+            }
+
+        self._lock = threading.Lock()
+        self._quota: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self.requests_by_token: Counter = Counter()
+        self.rejected_by_token: Counter = Counter()
+        self.requests_by_path: Counter = Counter()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def _repo(self, i: int) -> Dict[str, Any]:
+        empty = i % 9 == 8   # every ninth repo has no commits, languages or README
+        readme_path = None if empty else README_PATHS[i % len(README_PATHS)]
+        return {
+            "description": f"Demo project {i}",
+            "language": None if empty else LANGUAGES[i % len(LANGUAGES)],
+            "stars": (i * 7) % 23,
+            "forks": i % 5,
+            "pushed_at": f"2024-01-{i % 28 + 1:02d}T12:00:00Z",
+            "languages": {} if empty else {
+                LANGUAGES[(i + k) % len(LANGUAGES)]: 1000 * (i + 1) // (k + 1) for k in range(3)
+            },
+            "commits": 0 if empty else 10 + i * 3,
+            "readme_path": readme_path,
+            "readme": None if readme_path is None else (
+                f"# project-{i}\nBuilt with {README_SKILLS[i % len(README_SKILLS)]} "
+                f"and {README_SKILLS[(i + 3) % len(README_SKILLS)]}.\n"
+            ),
+        }
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGitHub":
+        fake = self
+
+        class Handler(FakeGitHubHandler):
+            github = fake
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeGitHub":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def graphql_repo(self, name: str, selection: str) -> Dict[str, Any]:
+        """A repository node with the fields GraphQLBackend selects"""
+        repo = self.repos[name]
+        node = {
+            "name": name,
+            "nameWithOwner": f"{self.login}/{name}",
+            "description": repo["description"],
+            "url": f"https://github.com/{self.login}/{name}",
+            "pushedAt": repo["pushed_at"],
+            "updatedAt": repo["pushed_at"],
+            "stargazerCount": repo["stars"],
+            "forkCount": repo["forks"],
+            "primaryLanguage": {"name": repo["language"]} if repo["language"] else None,
+        }
+        if "languages(first: 100)" in selection:
+            languages = sorted(repo["languages"].items(), key=lambda item: -item[1])
+            node["languages"] = {
+                "totalCount": len(languages),
+                "edges": [{"size": size, "node": {"name": language}} for language, size in languages[:100]],
+            }
+            node["defaultBranchRef"] = (
+                {"target": {"history": {"totalCount": repo["commits"]}}} if repo["commits"] else None
+            )
+        for alias, path in _README_OBJECT.findall(selection):
+            node[alias] = {"text": repo["readme"]} if path == repo["readme_path"] else None
+        return node
+
+    def graphql_query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """The response to one of GraphQLBackend's queries"""
+        fields = list(_REPOSITORY_FIELD.finditer(query))
+        if fields:
+            # fetch_details: aliased repository() lookups
+            data = {}
+            for i, field in enumerate(fields):
+                alias, owner, name = field.group(1), variables[field.group(2)], variables[field.group(3)]
+                selection = query[field.end():fields[i + 1].start() if i + 1 < len(fields) else len(query)]
+                data[alias] = (self.graphql_repo(name, selection)
+                               if owner == self.login and name in self.repos else None)
+            return {"data": data}
+
+        if variables.get("login") != self.login:
+            return {"data": {"user": None}, "errors": [{
+                "type": "NOT_FOUND", "message": f"Could not resolve to a User with the login of '{variables.get('login')}'.",
+            }]}
+        names = sorted(self.repos)
+        start = int(variables.get("cursor") or 0)
+        end = start + int(variables["first"])
+        selection = query[query.index("nodes {"):]
+        return {"data": {"user": {
+            "name": "Fake Octocat", "bio": "Stand-in user", "location": "Localhost",
+            "followers": {"totalCount": 42}, "following": {"totalCount": 7},
+            "repositories": {
+                "totalCount": len(names),
+                "pageInfo": {"hasNextPage": end < len(names), "endCursor": str(end)},
+                "nodes": [self.graphql_repo(name, selection) for name in names[start:end]],
+            },
+        }}}
+
+    def spend(self, token: str, resource: str = "core") -> Dict[str, str]:
+        """Count a request against a token's quota for resource; the headers to answer with
+
+        The headers carry rejected="1" when the token has no quota left.
+        """
+        with self._lock:
+            self.requests_by_token[token] += 1
+            if self.rate_limit is None:
+                return {}
+            now = time.time()
+            quota = self._quota.get((token, resource))
+            if quota is None or quota["reset_at"] <= now:
+                quota = self._quota[token, resource] = {"remaining": self.rate_limit, "reset_at": now + self.window}
+            headers = {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Reset": str(int(quota["reset_at"]) + 1),
+                "X-RateLimit-Resource": resource,
+            }
+            if quota["remaining"] <= 0:
+                self.rejected_by_token[token] += 1
+                headers["X-RateLimit-Remaining"] = "0"
+                return dict(headers, rejected="1")
+            quota["remaining"] -= 1
+            headers["X-RateLimit-Remaining"] = str(int(quota["remaining"]))
+            return headers
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    """Routes one request against the FakeGitHub bound to the subclass"""
+
+    github: FakeGitHub = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Any, headers: Dict[str, str] = None, raw: bool = False):
+        data = body.encode("utf-8") if raw else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain" if raw else "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        github = self.github
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(github.latency)
+        github.requests_by_path[urlsplit(self.path).path] += 1
+        if urlsplit(self.path).path != "/graphql" or github.graphql == "missing":
+            return self._send(404, {"message": "Not Found"})
+        if github.graphql == "broken":
+            return self._send(200, "<html><body>Service unavailable</body></html>", raw=True)
+
+        token = (self.headers.get("Authorization") or "").replace("Bearer ", "") or "anonymous"
+        headers = github.spend(token, "graphql")
+        if headers.pop("rejected", None):
+            return self._send(403, {"message": "API rate limit exceeded"}, headers)
+
+        request = json.loads(body)
+        self._send(200, github.graphql_query(request["query"], request.get("variables") or {}), headers)
+
+    def do_GET(self):
+        github = self.github
+        time.sleep(github.latency)
+        github.requests_by_path[urlsplit(self.path).path] += 1
+
+        token = (self.headers.get("Authorization") or "").replace("Bearer ", "") or "anonymous"
+        headers = github.spend(token)
+        if headers.pop("rejected", None):
+            return self._send(403, {"message": "API rate limit exceeded"}, headers)
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        parts = [part for part in url.path.split("/") if part]
+        base = f"http://{self.headers.get('Host')}"
+
+        if parts == ["user"]:
+            return self._send(200, {"login": github.login}, headers)
+        if parts == ["rate_limit"]:
+            remaining = int(headers.get("X-RateLimit-Remaining", 5000))
+            return self._send(200, {"resources": {"core": {"remaining": remaining}}}, headers)
+        if parts == ["users", github.login]:
+            return self._send(200, {
+                "login": github.login, "name": "Fake Octocat", "bio": "Stand-in user",
+                "location": "Localhost", "public_repos": len(github.repos),
+                "followers": 42, "following": 7,
+            }, headers)
+        if parts == ["users", github.login, "repos"]:
+            return self._list_repos(query, base, headers)
+
+        if len(parts) >= 4 and parts[:2] == ["repos", github.login] and parts[2] in github.repos:
+            repo = github.repos[parts[2]]
+            if parts[3:] == ["languages"]:
+                languages = sorted(repo["languages"].items(), key=lambda item: -item[1])
+                return self._send(200, dict(languages), headers)
+            if parts[3:] == ["commits"]:
+                if not repo["commits"]:
+                    return self._send(409, {"message": "Git Repository is empty."}, headers)
+                link = f'<{base}{url.path}?per_page=1&page={repo["commits"]}>; rel="last"'
+                return self._send(200, [{"sha": "0" * 40}], dict(headers, Link=link))
+            if parts[3:] == ["readme"]:
+                if repo["readme"] is None:
+                    return self._send(404, {"message": "Not Found"}, headers)
+                return self._send(200, repo["readme"], headers, raw=True)
+
+        self._send(404, {"message": "Not Found"}, headers)
+
+    def _list_repos(self, query: Dict[str, list], base: str, headers: Dict[str, str]):
+        github = self.github
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        names = sorted(github.repos)
+        chunk = names[(page - 1) * per_page:page * per_page]
+        body = [
+            {
+                "name": name,
+                "full_name": f"{github.login}/{name}",
+                "description": github.repos[name]["description"],
+                "language": github.repos[name]["language"],
+                "stargazers_count": github.repos[name]["stars"],
+                "forks_count": github.repos[name]["forks"],
+                "html_url": f"https://github.com/{github.login}/{name}",
+                "pushed_at": github.repos[name]["pushed_at"],
+                "updated_at": github.repos[name]["pushed_at"],
+            }
+            for name in chunk
+        ]
+        if page * per_page < len(names):
+            link = f'<{base}/users/{github.login}/repos?type=owner&per_page={per_page}&page={page + 1}>; rel="next"'
+            headers = dict(headers, Link=link)
+        self._send(200, body, headers)
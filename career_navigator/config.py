@@ -14,17 +14,90 @@ class Config:
     
     # API Credentials
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+    # Optional pool of tokens (comma-separated) shared by the rate limit scheduler
+    GITHUB_TOKENS = [t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()]
+    GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+    
+    # Concurrent GitHub fetching (1 = fetch repos one after another)
+    GITHUB_MAX_WORKERS = int(os.getenv("GITHUB_MAX_WORKERS", 8))
+    
+    # GitHub backend: "auto" (GraphQL when a token is set, REST fallback),
+    # "graphql" or "rest"
+    GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "auto")
+    GITHUB_GRAPHQL_PAGE_SIZE = int(os.getenv("GITHUB_GRAPHQL_PAGE_SIZE", 50))
+    
+    # Rate limit scheduling: pace requests once a token drops below SLOWDOWN,
+    # never spend the last RESERVE requests, wait at most MAX_WAIT seconds
+    # for a reset, retry rate-limited responses RETRIES times
+    GITHUB_RATE_LIMIT_SLOWDOWN = int(os.getenv("GITHUB_RATE_LIMIT_SLOWDOWN", 500))
+    GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", 10))
+    GITHUB_RATE_LIMIT_MAX_WAIT = int(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT", 900))
+    GITHUB_RATE_LIMIT_RETRIES = int(os.getenv("GITHUB_RATE_LIMIT_RETRIES", 3))
+    
+    # NLP model (en_core_web_sm / md / lg)
+    SPACY_MODEL_SIZE = os.getenv("SPACY_MODEL_SIZE", "lg")
+    SPACY_MODEL = f"en_core_web_{SPACY_MODEL_SIZE}"
     
     # Directories
     BASE_DIR = Path(__file__).parent
     OUTPUT_DIR = BASE_DIR / "outputs"
     SAMPLE_DATA_DIR = BASE_DIR / "sample_data"
     DATASETS_DIR = BASE_DIR / "datasets"
+    CACHE_DIR = BASE_DIR / "cache"
     
     # Create directories
     OUTPUT_DIR.mkdir(exist_ok=True)
     SAMPLE_DATA_DIR.mkdir(exist_ok=True)
     DATASETS_DIR.mkdir(exist_ok=True)
+    CACHE_DIR.mkdir(exist_ok=True)
+    
+    # Append-only store of every run (segmented JSONL + offset index)
+    RESULT_STORE_DIR = OUTPUT_DIR / "results"
+    RESULT_SEGMENT_MAX_BYTES = int(os.getenv("RESULT_SEGMENT_MAX_BYTES", 64 * 1024 * 1024))
+    
+    # PDF text cache (extracted text keyed by SHA-256 of the file bytes)
+    PDF_CACHE_DIR = CACHE_DIR / "pdf_text"
+    PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    
+    # Page-parallel PDF extraction (documents below the threshold stay serial)
+    PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 20))
+    PDF_PARALLEL_CHUNK_PAGES = int(os.getenv("PDF_PARALLEL_CHUNK_PAGES", 5))
+    PDF_PARALLEL_WORKERS = int(os.getenv("PDF_PARALLEL_WORKERS", os.cpu_count() or 1))
+    
+    # Job postings corpus and its index (built by analyzers/job_index.py)
+    JOB_POSTINGS_CSV = DATASETS_DIR / "job_postings.csv"
+    JOB_INDEX_DIR = CACHE_DIR / "job_index"
+    JOB_INDEX_CHUNK_ROWS = int(os.getenv("JOB_INDEX_CHUNK_ROWS", 10000))
+    JOB_INDEX_WORKERS = int(os.getenv("JOB_INDEX_WORKERS", os.cpu_count() or 1))
+    
+    # Stored candidate profiles, indexed for ranking against a job
+    # (built by analyzers/candidate_index.py)
+    CANDIDATE_INDEX_DIR = CACHE_DIR / "candidate_index"
+    
+    # Many-profiles x many-jobs scoring: memory per block of dense score rows
+    MATCH_BLOCK_BYTES = int(os.getenv("MATCH_BLOCK_BYTES", 256 * 1024 * 1024))
+    
+    # Soft skill matching: partial credit for similar skills through word
+    # vectors of the skill dictionary (built by skills/skill_vectors.py)
+    SOFT_MATCH = os.getenv("SOFT_MATCH", "false").lower() == "true"
+    SKILL_VECTORS_DIR = CACHE_DIR / "skill_vectors"
+    SKILL_KNN_K = int(os.getenv("SKILL_KNN_K", 10))
+    SKILL_SOFT_MIN_SIMILARITY = float(os.getenv("SKILL_SOFT_MIN_SIMILARITY", 0.5))
+    
+    # Batch mode: candidate analyses run in this many worker processes
+    BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", os.cpu_count() or 1))
+    
+    # GitHub API response cache (fresh for TTL seconds, then revalidated
+    # with ETag / Last-Modified)
+    GITHUB_CACHE_ENABLED = os.getenv("GITHUB_CACHE_ENABLED", "true").lower() == "true"
+    GITHUB_CACHE_DIR = CACHE_DIR / "github"
+    GITHUB_CACHE_TTL = int(os.getenv("GITHUB_CACHE_TTL", 600))
+    GITHUB_CACHE_MAX_BYTES = int(os.getenv("GITHUB_CACHE_MAX_BYTES", 128 * 1024 * 1024))
+    
+    # Incremental refresh: per-user snapshots of per-repo results, so repeat
+    # analyses only re-fetch repositories pushed to since the last run
+    GITHUB_INCREMENTAL = os.getenv("GITHUB_INCREMENTAL", "true").lower() == "true"
+    GITHUB_SNAPSHOT_DIR = CACHE_DIR / "github_snapshots"
     
     # Technical Skills (Comprehensive List)
     TECH_SKILLS = {
@@ -78,6 +151,18 @@ class Config:
         "Algorithms", "Design Patterns",
     }
     
+    # Alternative spellings that resolve to a TECH_SKILLS entry
+    SKILL_ALIASES = {
+        "sklearn": "Scikit-learn", "k8s": "Kubernetes", "postgres": "PostgreSQL",
+        "golang": "Go", "nodejs": "Node.js", "reactjs": "React",
+        "react.js": "React", "vuejs": "Vue.js", "nextjs": "Next.js",
+        "expressjs": "Express.js", "amazon web services": "AWS",
+        "google cloud platform": "Google Cloud", "mongo": "MongoDB",
+        "jupyter": "Jupyter Notebook", "spark": "Apache Spark", "pyspark": "Apache Spark",
+        "apache kafka": "Kafka", "apache airflow": "Airflow",
+        "visual studio code": "VS Code",
+    }
+    
     SOFT_SKILLS = {
         "Communication", "Leadership", "Problem Solving", "Problem-Solving",
         "Teamwork", "Team Coordination", "Time Management", "Critical Thinking",
@@ -7,7 +7,7 @@ Complete Profile Analysis with 4 Inputs:
 4. Dream Job Description
 """
 
-import json
+import argparse
 from pathlib import Path
 from typing import Dict, Any
 
@@ -17,6 +17,8 @@ from parsers.linkedin_parser import LinkedInParser
 from parsers.github_analyzer import GitHubAnalyzer
 from analyzers.job_matcher import JobMatcher
 from config import Config
+from skills.registry import SkillRegistry
+from storage.result_store import ResultStore, write_json_atomic
 
 
 class CareerNavigator:
@@ -34,19 +36,20 @@ class CareerNavigator:
         self.linkedin_parser = LinkedInParser()
         self.github_analyzer = GitHubAnalyzer()
         self.job_matcher = JobMatcher()
+        self.skill_registry = SkillRegistry.for_tech_skills()
+        self.result_store = ResultStore()
     
     def merge_profiles(self, resume_data: Dict, github_data: Dict, 
                        linkedin_data: Dict) -> Dict[str, Any]:
         """Merge data from all sources"""
         
-        # Combine all technical skills
-        all_skills = set()
-        if resume_data.get("technical_skills"):
-            all_skills.update(resume_data["technical_skills"])
-        if github_data.get("skills_from_repos"):
-            all_skills.update(github_data["skills_from_repos"])
-        if linkedin_data.get("skills"):
-            all_skills.update(linkedin_data["skills"])
+        # Combine all technical skills (bitset union over the skill registry)
+        registry = self.skill_registry
+        all_skills = (
+            registry.to_bits(resume_data.get("technical_skills") or []) |
+            registry.to_bits(github_data.get("skills_from_repos") or []) |
+            registry.to_bits(linkedin_data.get("skills") or [])
+        )
         
         # Get best name (priority: LinkedIn > Resume > GitHub)
         name = (linkedin_data.get("name") or 
@@ -72,14 +75,14 @@ class CareerNavigator:
                     self._calculate_linkedin_experience(linkedin_data)
                 ),
                 "github_repos": github_data.get("public_repos", 0),
-                "github_commits": github_data.get("activity", {}).get("total_commits", 0),
-                "github_stars": github_data.get("activity", {}).get("total_stars", 0)
+                "github_commits": (github_data.get("activity") or {}).get("total_commits", 0),
+                "github_stars": (github_data.get("activity") or {}).get("total_stars", 0)
             },
             "skills": {
-                "technical_skills": sorted(list(all_skills)),
+                "technical_skills": registry.from_bits(all_skills),
                 "programming_languages": github_data.get("languages", {}),
                 "soft_skills": resume_data.get("soft_skills", []),
-                "total_technical_skills": len(all_skills)
+                "total_technical_skills": registry.count(all_skills)
             },
             "education": (linkedin_data.get("education") or 
                          resume_data.get("education", [])),
@@ -114,7 +117,8 @@ class CareerNavigator:
         return 0
     
     def run(self, resume_path: str = None, github_username: str = None,
-            linkedin_path: str = None, dream_job: str = None) -> Dict[str, Any]:
+            linkedin_path: str = None, dream_job: str = None,
+            save_outputs: bool = True, candidate_id: str = None) -> Dict[str, Any]:
         """
         Run complete Career Navigator analysis
         
@@ -123,6 +127,13 @@ class CareerNavigator:
             github_username: GitHub username
             linkedin_path: Path to LinkedIn PDF export
             dream_job: Dream job description or title
+            save_outputs: Also write the latest-run JSON files under outputs/
+                (batch mode collects results itself)
+            candidate_id: Key the run is stored under in the result store
+                (defaults to the GitHub username, then the candidate's name)
+        
+        Every run is appended to the result store; the returned dict carries
+        its run_id.
         """
         
         print("\n" + "=" * 80)
@@ -169,11 +180,11 @@ class CareerNavigator:
             results["linkedin"]
         )
         
-        # Save unified profile
-        profile_output = Config.OUTPUT_DIR / "extracted_profile.json"
-        with open(profile_output, 'w', encoding='utf-8') as f:
-            json.dump(unified_profile, f, indent=2, ensure_ascii=False)
-        print(f"✅ Unified profile saved: {profile_output}\n")
+        # Save unified profile (latest-run view, replaced atomically)
+        if save_outputs:
+            profile_output = Config.OUTPUT_DIR / "extracted_profile.json"
+            write_json_atomic(profile_output, unified_profile)
+            print(f"✅ Unified profile saved: {profile_output}\n")
         
         # STEP 4: Analyze Dream Job & Match
         print("STEP 4/4: Dream Job Analysis & Matching")
@@ -193,17 +204,33 @@ class CareerNavigator:
             }
             
             # Save job match analysis
-            job_output = Config.OUTPUT_DIR / "job_match_analysis.json"
-            with open(job_output, 'w', encoding='utf-8') as f:
-                json.dump(job_analysis, f, indent=2, ensure_ascii=False)
-            print(f"✅ Job match analysis saved: {job_output}\n")
+            if save_outputs:
+                job_output = Config.OUTPUT_DIR / "job_match_analysis.json"
+                write_json_atomic(job_output, job_analysis)
+                print(f"✅ Job match analysis saved: {job_output}\n")
         else:
             print("⚠️  No dream job description provided\n")
         
+        # Keep this run alongside all earlier ones
+        candidate = (candidate_id or github_username or
+                     unified_profile["personal_info"]["name"])
+        run_id = self.result_store.append({
+            "inputs": {
+                "resume_path": resume_path,
+                "github_username": github_username,
+                "linkedin_path": linkedin_path,
+                "dream_job": dream_job,
+            },
+            "profile": unified_profile,
+            "job_analysis": job_analysis,
+        }, candidate=candidate)
+        print(f"✅ Run stored: {run_id}\n")
+        
         # Print comprehensive summary
         self.print_summary(unified_profile, job_analysis)
         
         return {
+            "run_id": run_id,
             "profile": unified_profile,
             "job_analysis": job_analysis
         }
@@ -284,30 +311,34 @@ class CareerNavigator:
                 for skill in match['missing_critical_skills']:
                     print(f"      • {skill}")
         print("\n" + "=" * 80 + "\n")
-        print("\n" + "=" * 80 + "\n")
-    
-    # Collect inputs
-    print("Please provide the following inputs (press Enter to skip):\n")
-    
-    resume_path = input("1️⃣  Resume PDF path: ").strip()
-    github_username = input("2️⃣  GitHub username: ").strip()
-    linkedin_path = input("3️⃣  LinkedIn PDF path: ").strip()
-    
-    print("\n4️⃣  Dream Job Description (paste full job description or job title):")
-    print("   (Type or paste, then press Enter twice to finish)\n")
-    
-    dream_job_lines = []
-    while True:
-        line = input()
-        if line == "" and dream_job_lines and dream_job_lines[-1] == "":
-            break
-        dream_job_lines.append(line)
-    
-    dream_job = "\n".join(dream_job_lines).strip()
-    
-    # Run analysis
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Personal Career Navigator")
+    parser.add_argument("--batch", metavar="MANIFEST",
+                        help="Analyze every row of a .csv/.jsonl manifest instead of prompting "
+                             "(columns: id, resume_path, github_username, linkedin_path, "
+                             "dream_job or dream_job_path)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="Batch results file (default: outputs/batch_results.jsonl)")
+    parser.add_argument("--workers", type=int, help="Batch worker processes")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Re-run rows recorded as failed in the results file")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show per-candidate output from batch workers")
+    return parser.parse_args()
+
 
 def main():
+    args = parse_args()
+    
+    if args.batch:
+        from batch.runner import BatchRunner
+        
+        runner = BatchRunner(workers=args.workers, quiet=not args.verbose)
+        runner.run(args.batch, args.output, retry_failed=args.retry_failed)
+        return
+    
     navigator = CareerNavigator()
 
     print("Please provide the following inputs (press Enter to skip):\n")
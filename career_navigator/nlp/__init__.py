@@ -0,0 +1,7 @@
+"""
+NLP package for Career Navigator
+"""
+
+from .model_registry import NLPModelRegistry
+
+__all__ = ['NLPModelRegistry']
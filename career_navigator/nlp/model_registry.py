@@ -0,0 +1,75 @@
+"""
+NLP Model Registry - Load each spaCy model once per process, on first use
+"""
+
+import threading
+from typing import Dict, Tuple, Any
+from pathlib import Path
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+
+
+class NLPModelRegistry:
+    """Process-wide cache of loaded spaCy pipelines
+
+    Parsers ask the registry for a model instead of calling spacy.load
+    themselves, so CareerNavigator holds a single copy of the model no matter
+    how many parsers use it. Nothing is loaded until the first call to get().
+    """
+
+    # Pipes that named-entity recognition does not depend on
+    NER_UNUSED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+    _models: Dict[Tuple[str, bool], Any] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, model_name: str = None, ner_only: bool = True):
+        """Return a loaded pipeline, loading it on first request
+
+        Args:
+            model_name: spaCy package name, defaults to Config.SPACY_MODEL
+            ner_only: Leave out the pipes NER does not need
+        """
+        model_name = model_name or Config.SPACY_MODEL
+        key = (model_name, ner_only)
+
+        nlp = cls._models.get(key)
+        if nlp is not None:
+            return nlp
+
+        with cls._lock:
+            if key not in cls._models:
+                cls._models[key] = cls._load(model_name, ner_only)
+            return cls._models[key]
+
+    @classmethod
+    def _load(cls, model_name: str, ner_only: bool):
+        """Load a spaCy model, excluding unused pipes when only NER is needed"""
+        import spacy
+
+        print(f"🔧 Loading spaCy model: {model_name}")
+        exclude = cls.NER_UNUSED_PIPES if ner_only else []
+        try:
+            # exclude (rather than disable) keeps the weights out of memory
+            nlp = spacy.load(model_name, exclude=exclude)
+            print("✅ spaCy model loaded successfully")
+            return nlp
+        except Exception as e:
+            print(f"❌ Error loading spaCy: {e}")
+            print(f"Run: python -m spacy download {model_name}")
+            raise
+
+    @classmethod
+    def is_loaded(cls, model_name: str = None, ner_only: bool = True) -> bool:
+        """Check whether a model has already been loaded"""
+        return (model_name or Config.SPACY_MODEL, ner_only) in cls._models
+
+    @classmethod
+    def clear(cls):
+        """Drop all loaded models"""
+        with cls._lock:
+            cls._models.clear()
@@ -5,5 +5,6 @@ Parsers package for Career Navigator
 from .resume_parser import ResumeParser
 from .linkedin_parser import LinkedInParser
 from .github_analyzer import GitHubAnalyzer
+from .pdf_extractor import PDFTextExtractor, PDFTextCache
 
-__all__ = ['ResumeParser', 'LinkedInParser', 'GitHubAnalyzer']
+__all__ = ['ResumeParser', 'LinkedInParser', 'GitHubAnalyzer', 'PDFTextExtractor', 'PDFTextCache']
@@ -0,0 +1,80 @@
+"""
+Disk LRU - Size bound with least-recently-used eviction for one-file-per-entry caches
+"""
+
+import threading
+from pathlib import Path
+
+
+class DiskLRU:
+    """Keep a cache directory under max_bytes, evicting the oldest entries
+
+    Recency is the file modification time, which the caches refresh on every
+    hit. Writers report each write through record_write(), which keeps a
+    running byte total; the directory is only globbed and stat'ed when that
+    total passes max_bytes (or on the first write, to learn the starting
+    size). Eviction then trims down to low_water * max_bytes, so the next
+    few writes do not trigger another scan straight away.
+
+    The total only sees this process's writes. Other processes writing to
+    the same directory are caught up with at the next scan.
+    """
+
+    def __init__(self, directory: Path, pattern: str, max_bytes: int, low_water: float = 0.9):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self.evictions = 0
+        self._total = None  # unknown until the first scan
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def size_of(path: Path) -> int:
+        """Current size of path, 0 if it does not exist"""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def record_write(self, old_size: int, new_size: int) -> int:
+        """Account for an entry going from old_size to new_size bytes; returns entries evicted"""
+        with self._lock:
+            if self._total is not None:
+                self._total += new_size - old_size
+                if self._total <= self.max_bytes:
+                    return 0
+            return self._evict()
+
+    def _evict(self) -> int:
+        """Scan the directory and remove least recently used entries (lock held)"""
+        entries = []
+        for entry in self.directory.glob(self.pattern):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        if total > self.max_bytes:
+            target = self.max_bytes * self.low_water
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= target:
+                    break
+                try:
+                    entry.unlink()
+                except OSError:
+                    continue
+                total -= size
+                evicted += 1
+
+        self._total = total
+        self.evictions += evicted
+        return evicted
+
+    def forget(self):
+        """Drop the running total, e.g. after the directory was cleared"""
+        with self._lock:
+            self._total = None
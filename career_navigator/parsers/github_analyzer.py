@@ -4,56 +4,76 @@ GitHub Profile Analyzer - Extract skills from GitHub repositories
 
 import os
 from collections import Counter
-from typing import Dict, Set, Any
+from typing import Callable, Dict, List, Set, Any, Tuple
 from pathlib import Path
-from collections import Counter
-
 
-from github import Github, Auth
-from github.GithubException import GithubException
+import requests
 
 # Import config
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from config import Config
+from skills.skill_index import SkillIndex
+from parsers.github_client import GitHubClient, GitHubAPIError
+from parsers.github_cache import GitHubResponseCache
+from parsers.github_backends import GitHubBackend, RESTBackend, GraphQLBackend
+from parsers.github_snapshot import GitHubSnapshotStore, ProfileSnapshot
 
 
 class GitHubAnalyzer:
     """Analyze GitHub profile to extract skills"""
     
-    def __init__(self, token: str = None):
+    # Number of repositories whose README is scanned for skills
+    README_REPO_LIMIT = 10
+    
+    def __init__(self, token: str = None, base_url: str = None, max_workers: int = None,
+                 backend: str = None):
         print("🔧 Initializing GitHub Analyzer...")
         
+        self.tech_index = SkillIndex.for_tech_skills()
+        self.max_workers = max_workers or Config.GITHUB_MAX_WORKERS
+        self.backend_name = backend or Config.GITHUB_BACKEND
+        
         github_token = token or Config.GITHUB_TOKEN
+        github_tokens = [token] if token else (Config.GITHUB_TOKENS or [github_token])
         
-        if not github_token:
+        if not github_token and not Config.GITHUB_TOKENS:
             print("⚠️  WARNING: GITHUB_TOKEN not found")
             print("   GitHub API has rate limits without authentication")
             self.github = None
         else:
             try:
-                auth = Auth.Token(github_token)
-                self.github = Github(auth=auth)
+                cache = GitHubResponseCache() if Config.GITHUB_CACHE_ENABLED else None
+                self.github = GitHubClient(github_tokens[0], base_url, pool_size=self.max_workers,
+                                           cache=cache, tokens=github_tokens)
                 
                 # Test authentication
-                user = self.github.get_user()
-                print(f"✅ Authenticated as: {user.login}")
-                print(f"✅ API Rate Limit: {self.github.get_rate_limit().core.remaining}/5000\n")
+                user = self.github.get_json("/user")
+                rate_limit = self.github.get_json("/rate_limit")
+                print(f"✅ Authenticated as: {user['login']} ({len(github_tokens)} token(s))")
+                print(f"✅ API Rate Limit: {rate_limit['resources']['core']['remaining']}/5000\n")
             except Exception as e:
                 print(f"❌ GitHub authentication failed: {e}")
                 self.github = None
-    
-    def get_language_stats(self, repos) -> Dict[str, float]:
-        """Get programming language statistics"""
-        language_bytes = Counter()
-        
-        for repo in repos:
-            try:
-                languages = repo.get_languages()
-                language_bytes.update(languages)
-            except Exception:
-                continue
         
+        self.rest_backend = RESTBackend(self.github, self.README_REPO_LIMIT, self.max_workers)
+        self.graphql_backend = GraphQLBackend(self.github, self.README_REPO_LIMIT)
+        self.snapshots = GitHubSnapshotStore() if Config.GITHUB_INCREMENTAL else None
+    
+    def rate_limit_budget(self) -> Dict[str, Any]:
+        """Remaining GitHub quota across the token pool"""
+        return self.github.rate_limit_budget() if self.github else {}
+    
+    def get_backends(self) -> List[GitHubBackend]:
+        """Backends to try in order: GraphQL when a token is present, REST as fallback"""
+        if self.backend_name == "rest":
+            return [self.rest_backend]
+        if self.backend_name == "graphql":
+            return [self.graphql_backend]
+        return [self.graphql_backend, self.rest_backend]
+    
+    def _summarize_languages(self, language_bytes: Counter) -> Dict[str, float]:
+        """Turn byte counts per language into top-10 percentages"""
         total_bytes = sum(language_bytes.values())
         if total_bytes == 0:
             return {}
@@ -68,38 +88,37 @@ class GitHubAnalyzer:
             key=lambda x: x[1],
             reverse=True
         )[:10]
-
+        
         return dict(sorted_languages)
     
-    def extract_skills_from_readme(self, repo) -> Set[str]:
-        """Extract technologies from README"""
-        skills = set()
+    def get_language_stats(self, repos: List[Dict]) -> Dict[str, float]:
+        """Get programming language statistics"""
+        language_bytes = Counter()
         
-        try:
-            readme = repo.get_readme()
-            content = readme.decoded_content.decode('utf-8').lower()
-            
-            for skill in Config.TECH_SKILLS:
-                if skill.lower() in content:
-                    skills.add(skill)
-        except Exception:
-            pass
+        for repo in repos:
+            language_bytes.update(repo.get("languages") or {})
         
-        return skills
+        return self._summarize_languages(language_bytes)
     
-    def analyze_commit_patterns(self, repos) -> Dict[str, Any]:
+    def extract_skills_from_readme(self, repo: Dict) -> Set[str]:
+        """Extract technologies from README"""
+        if not repo.get("readme"):
+            return set()
+        return self.tech_index.extract(repo["readme"])
+    
+    def analyze_commit_patterns(self, repos: List[Dict]) -> Dict[str, Any]:
         """Analyze commit activity"""
         total_commits = 0
         total_stars = 0
         total_forks = 0
         
         for repo in repos:
-            try:
-                total_commits += repo.get_commits().totalCount
-                total_stars += repo.stargazers_count
-                total_forks += repo.forks_count
-            except Exception:
+            # Repos whose commits cannot be counted (empty repos) are skipped
+            if repo.get("commits") is None:
                 continue
+            total_commits += repo["commits"]
+            total_stars += repo["stars"]
+            total_forks += repo["forks"]
         
         return {
             "total_commits": total_commits,
@@ -107,6 +126,123 @@ class GitHubAnalyzer:
             "total_forks": total_forks
         }
     
+    def _with_fallback(self, call: Callable[[GitHubBackend], Any]) -> Any:
+        """Run call on each backend in turn until one succeeds
+        
+        Errors, connection failures and unparseable responses move on to the
+        next backend; only a missing user or repository is final.
+        """
+        backends = self.get_backends()
+        for i, backend in enumerate(backends):
+            try:
+                return call(backend)
+            except GitHubAPIError as e:
+                if backend.is_not_found(e) or i == len(backends) - 1:
+                    raise
+                print(f"⚠️  GitHub {backend.name} backend failed ({e}), falling back")
+            except (requests.RequestException, ValueError) as e:
+                if i == len(backends) - 1:
+                    raise
+                print(f"⚠️  GitHub {backend.name} backend failed ({type(e).__name__}: {e}), falling back")
+    
+    def fetch_profile_data(self, username: str) -> Dict[str, Any]:
+        """Fetch user and repository data, falling back to REST if GraphQL fails"""
+        return self._with_fallback(lambda backend: backend.fetch_profile(username))
+    
+    def _snapshot_record(self, repo: Dict[str, Any], include_readme: bool) -> Dict[str, Any]:
+        """Replace a repo's README text by the skills found in it"""
+        record = {key: value for key, value in repo.items() if key != "readme"}
+        record["readme_skills"] = (
+            sorted(self.extract_skills_from_readme(repo)) if include_readme else None
+        )
+        return record
+    
+    def refresh_snapshot(self, username: str) -> Tuple[ProfileSnapshot, int]:
+        """Bring the user's snapshot up to date; returns it with the number of re-fetched repos"""
+        snapshot = self.snapshots.load(self.github.base_url, username)
+        
+        if snapshot is None:
+            # First analysis: one full fetch
+            data = self.fetch_profile_data(username)
+            snapshot = ProfileSnapshot()
+            details = [
+                self._snapshot_record(repo, i < self.README_REPO_LIMIT)
+                for i, repo in enumerate(data["repos"])
+            ]
+            snapshot.merge(data["user"], data["repos"], details)
+            refreshed = len(details)
+        else:
+            # Later analyses: the listing, then only the repos that changed
+            listing = self._with_fallback(lambda backend: backend.list_profile(username))
+            stale = snapshot.needs_details(listing["repos"], self.README_REPO_LIMIT)
+            fetched = self._with_fallback(lambda backend: backend.fetch_details(stale))
+            details = [
+                self._snapshot_record(repo, include_readme)
+                for repo, (_, include_readme) in zip(fetched, stale)
+            ]
+            snapshot.merge(listing["user"], listing["repos"], details)
+            refreshed = len(details)
+        
+        self.snapshots.save(self.github.base_url, username, snapshot)
+        return snapshot, refreshed
+    
+    def profile_from_snapshot(self, username: str, snapshot: ProfileSnapshot) -> Dict[str, Any]:
+        """GitHub profile schema from a snapshot's cached aggregates"""
+        repos = snapshot.ordered_repos()
+        
+        readme_skills = set()
+        for repo in repos[:self.README_REPO_LIMIT]:
+            readme_skills.update(repo.get("readme_skills") or [])
+        
+        return self._assemble_profile(
+            username, snapshot.user, repos,
+            self._summarize_languages(snapshot.language_bytes),
+            readme_skills,
+            dict(snapshot.activity),
+        )
+    
+    def build_profile(self, username: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Aggregate normalized backend data into the GitHub profile schema"""
+        user = data["user"]
+        repos = data["repos"]
+        
+        languages = self.get_language_stats(repos)
+        
+        readme_skills = set()
+        for repo in repos[:self.README_REPO_LIMIT]:
+            readme_skills.update(self.extract_skills_from_readme(repo))
+        
+        activity = self.analyze_commit_patterns(repos)
+        
+        return self._assemble_profile(username, user, repos, languages, readme_skills, activity)
+    
+    def _assemble_profile(self, username: str, user: Dict[str, Any], repos: List[Dict],
+                          languages: Dict[str, float], readme_skills: Set[str],
+                          activity: Dict[str, int]) -> Dict[str, Any]:
+        return {
+            "username": username,
+            "name": user.get("name") or username,
+            "bio": user.get("bio") or "",
+            "location": user.get("location") or "",
+            "public_repos": user.get("public_repos", 0),
+            "followers": user.get("followers", 0),
+            "following": user.get("following", 0),
+            "languages": languages,
+            "skills_from_repos": list(readme_skills),
+            "activity": activity,
+            "profile_url": f"https://github.com/{username}",
+            "top_repositories": [
+                {
+                    "name": repo["name"],
+                    "description": repo["description"],
+                    "language": repo["language"],
+                    "stars": repo["stars"],
+                    "url": repo["url"]
+                }
+                for repo in sorted(repos, key=lambda r: r["stars"], reverse=True)[:5]
+            ]
+        }
+    
     def analyze_profile(self, username: str) -> Dict[str, Any]:
         """Main function to analyze GitHub profile"""
         print(f"🔍 Analyzing GitHub profile: {username}")
@@ -116,48 +252,24 @@ class GitHubAnalyzer:
             return {}
         
         try:
-            user = self.github.get_user(username)
-            repos = list(user.get_repos(type='owner'))
-            
-            languages = self.get_language_stats(repos)
-            
-            readme_skills = set()
-            for repo in repos[:10]:
-                readme_skills.update(self.extract_skills_from_readme(repo))
+            if self.snapshots is not None:
+                snapshot, refreshed = self.refresh_snapshot(username)
+                print(f"✅ Refreshed {refreshed}/{len(snapshot.repos)} repositories")
+                profile = self.profile_from_snapshot(username, snapshot)
+            else:
+                profile = self.build_profile(username, self.fetch_profile_data(username))
             
-            activity = self.analyze_commit_patterns(repos)
-            
-            profile = {
-                "username": username,
-                "name": user.name or username,
-                "bio": user.bio or "",
-                "location": user.location or "",
-                "public_repos": user.public_repos,
-                "followers": user.followers,
-                "following": user.following,
-                "languages": languages,
-                "skills_from_repos": list(readme_skills),
-                "activity": activity,
-                "profile_url": f"https://github.com/{username}",
-                "top_repositories": [
-                    {
-                        "name": repo.name,
-                        "description": repo.description,
-                        "language": repo.language,
-                        "stars": repo.stargazers_count,
-                        "url": repo.html_url
-                    }
-                    for repo in sorted(repos, key=lambda r: r.stargazers_count, reverse=True)[:5]
-                ]
-            }
+            languages = profile["languages"]
+            readme_skills = profile["skills_from_repos"]
+            activity = profile["activity"]
             
             print(f"✅ Found {len(languages)} languages")
             print(f"✅ Extracted {len(readme_skills)} skills")
             print(f"✅ Total commits: {activity['total_commits']}\n")
             
             return profile
-            
-        except GithubException as e:
+        
+        except GitHubAPIError as e:
             print(f"❌ GitHub API Error: {e}")
             return {}
         except Exception as e:
@@ -0,0 +1,344 @@
+"""
+GitHub Backends - Fetch a user's profile and repositories over REST or GraphQL
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+from parsers.github_client import GitHubClient, GitHubAPIError
+
+
+class GitHubBackend:
+    """Fetch everything GitHubAnalyzer needs for one user
+    
+    fetch_profile returns the same normalized shape for every backend:
+        
+        {
+            "user": {"name", "bio", "location", "public_repos",
+                     "followers", "following"},
+            "repos": [{"name", "full_name", "description", "language",
+                       "stars", "forks", "url", "pushed_at", "updated_at",
+                       "languages": {lang: bytes},
+                       "commits": int or None (empty repo),
+                       "readme": str or None}]
+        }
+    
+    Repositories are the user's own public repositories ordered by full name,
+    matching the REST listing order. README text is only required for the
+    first readme_limit repos.
+    
+    For incremental refreshes, list_profile returns the same shape without
+    the per-repo "languages", "commits" and "readme" fields, and
+    fetch_details fills them in for selected repositories only.
+    """
+    
+    name = "base"
+    
+    def __init__(self, client: GitHubClient, readme_limit: int = 10):
+        self.client = client
+        self.readme_limit = readme_limit
+    
+    def fetch_profile(self, username: str) -> Dict[str, Any]:
+        raise NotImplementedError
+    
+    def list_profile(self, username: str) -> Dict[str, Any]:
+        raise NotImplementedError
+    
+    def fetch_details(self, repos: List[Tuple[Dict[str, Any], bool]]) -> List[Dict[str, Any]]:
+        """Detailed records for (repo summary, include_readme) pairs"""
+        raise NotImplementedError
+    
+    def is_not_found(self, error: GitHubAPIError) -> bool:
+        """Whether the error means the user or repository does not exist (no point in another backend)"""
+        return error.status == 404
+    
+    def fetch_languages(self, full_name: str) -> Dict[str, int]:
+        """Bytes per language over REST, every language included"""
+        try:
+            return self.client.get_json(f"/repos/{full_name}/languages")
+        except Exception:
+            return {}
+    
+    def fetch_readme(self, full_name: str) -> Optional[str]:
+        """README GitHub picks for the repository (any spelling, root, docs/ or .github/)"""
+        try:
+            response = self.client.get(
+                f"/repos/{full_name}/readme",
+                headers={"Accept": "application/vnd.github.raw"},
+            )
+            return response.content.decode('utf-8')
+        except Exception:
+            return None
+
+
+class RESTBackend(GitHubBackend):
+    """REST v3 backend: one listing call plus per-repo calls on a thread pool"""
+    
+    name = "rest"
+    
+    def __init__(self, client: GitHubClient, readme_limit: int = 10, max_workers: int = None):
+        super().__init__(client, readme_limit)
+        self.max_workers = max_workers or Config.GITHUB_MAX_WORKERS
+    
+    def fetch_user(self, username: str) -> Dict[str, Any]:
+        user = self.client.get_json(f"/users/{username}")
+        return {
+            "name": user.get("name"),
+            "bio": user.get("bio"),
+            "location": user.get("location"),
+            "public_repos": user.get("public_repos", 0),
+            "followers": user.get("followers", 0),
+            "following": user.get("following", 0),
+        }
+    
+    def list_repos(self, username: str) -> List[Dict[str, Any]]:
+        """Repository summaries from the owner listing (no per-repo calls)"""
+        return [
+            {
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo.get("description"),
+                "language": repo.get("language"),
+                "stars": repo.get("stargazers_count", 0),
+                "forks": repo.get("forks_count", 0),
+                "url": repo.get("html_url"),
+                "pushed_at": repo.get("pushed_at"),
+                "updated_at": repo.get("updated_at"),
+            }
+            for repo in self.client.get_paginated(f"/users/{username}/repos", {"type": "owner"})
+        ]
+    
+    def fetch_commit_count(self, full_name: str) -> Optional[int]:
+        # Empty repositories answer 409
+        try:
+            return self.client.count_paginated(f"/repos/{full_name}/commits")
+        except Exception:
+            return None
+    
+    def fetch_repo_details(self, repo: Dict[str, Any], include_readme: bool) -> Dict[str, Any]:
+        """Add languages, commit count and README to a repository summary"""
+        return dict(
+            repo,
+            languages=self.fetch_languages(repo["full_name"]),
+            commits=self.fetch_commit_count(repo["full_name"]),
+            readme=self.fetch_readme(repo["full_name"]) if include_readme else None,
+        )
+    
+    def fetch_details(self, repos: List[Tuple[Dict[str, Any], bool]]) -> List[Dict[str, Any]]:
+        if not repos:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            return list(pool.map(lambda item: self.fetch_repo_details(*item), repos))
+    
+    def list_profile(self, username: str) -> Dict[str, Any]:
+        return {"user": self.fetch_user(username), "repos": self.list_repos(username)}
+    
+    def fetch_profile(self, username: str) -> Dict[str, Any]:
+        listing = self.list_profile(username)
+        repos = listing["repos"]
+        detailed = self.fetch_details([
+            (repo, i < self.readme_limit) for i, repo in enumerate(repos)
+        ])
+        return {"user": listing["user"], "repos": detailed}
+
+
+class GraphQLBackend(GitHubBackend):
+    """GraphQL v4 backend: the whole profile in a few paginated queries"""
+    
+    name = "graphql"
+    
+    # README blob is looked up under the common spellings at the repo root;
+    # repos where none matches fall back to REST /readme, which also finds
+    # other spellings and READMEs in docs/ or .github/. Likewise repos with
+    # more languages than one page of languages(first: 100) get them over REST
+    README_PATHS = {
+        "readmeMd": "HEAD:README.md",
+        "readmeLowerMd": "HEAD:readme.md",
+        "readmeTitleMd": "HEAD:Readme.md",
+        "readmeRst": "HEAD:README.rst",
+        "readmeTxt": "HEAD:README.txt",
+        "readmePlain": "HEAD:README",
+    }
+    
+    SUMMARY_FIELDS = """
+            name
+            nameWithOwner
+            description
+            url
+            pushedAt
+            updatedAt
+            stargazerCount
+            forkCount
+            primaryLanguage { name }"""
+    
+    DETAIL_FIELDS = """
+            languages(first: 100) { totalCount edges { size node { name } } }
+            defaultBranchRef { target { ... on Commit { history { totalCount } } } }"""
+    
+    README_FIELDS = "".join(
+        f'\n            {alias}: object(expression: "{expression}") {{ ... on Blob {{ text }} }}'
+        for alias, expression in README_PATHS.items()
+    )
+    
+    PROFILE_QUERY = """
+    query($login: String!, $first: Int!, $cursor: String) {
+      user(login: $login) {
+        name
+        bio
+        location
+        followers { totalCount }
+        following { totalCount }
+        repositories(first: $first, after: $cursor, ownerAffiliations: [OWNER],
+                     privacy: PUBLIC, orderBy: {field: NAME, direction: ASC}) {
+          totalCount
+          pageInfo { hasNextPage endCursor }
+          nodes {%s
+          }
+        }
+      }
+    }
+    """
+    
+    # Full profile, and the listing alone for incremental refreshes
+    QUERY = PROFILE_QUERY % (SUMMARY_FIELDS + DETAIL_FIELDS + README_FIELDS)
+    LIST_QUERY = PROFILE_QUERY % SUMMARY_FIELDS
+    
+    def __init__(self, client: GitHubClient, readme_limit: int = 10, page_size: int = None):
+        super().__init__(client, readme_limit)
+        self.page_size = page_size or Config.GITHUB_GRAPHQL_PAGE_SIZE
+    
+    def is_not_found(self, error: GitHubAPIError) -> bool:
+        # A 404 from the /graphql endpoint itself means GraphQL is unavailable
+        # (e.g. turned off on GitHub Enterprise), not that the user is missing
+        return error.status == 404 and error.url != self.client.graphql_url()
+    
+    def _repo_from_node(self, node: Dict[str, Any], include_readme: bool) -> Dict[str, Any]:
+        history = ((node.get("defaultBranchRef") or {}).get("target") or {}).get("history")
+        
+        readme = None
+        if include_readme:
+            for alias in self.README_PATHS:
+                blob = node.get(alias)
+                if blob and blob.get("text") is not None:
+                    readme = blob["text"]
+                    break
+        
+        return {
+            "name": node["name"],
+            "full_name": node["nameWithOwner"],
+            "description": node.get("description"),
+            "language": (node.get("primaryLanguage") or {}).get("name"),
+            "stars": node.get("stargazerCount", 0),
+            "forks": node.get("forkCount", 0),
+            "url": node.get("url"),
+            "pushed_at": node.get("pushedAt"),
+            "updated_at": node.get("updatedAt"),
+            "languages": {
+                edge["node"]["name"]: edge["size"]
+                for edge in (node.get("languages") or {}).get("edges", [])
+            },
+            "commits": history["totalCount"] if history else None,
+            "readme": readme,
+        }
+    
+    @staticmethod
+    def _languages_truncated(node: Dict[str, Any]) -> bool:
+        languages = node.get("languages") or {}
+        return languages.get("totalCount", 0) > len(languages.get("edges", []))
+    
+    def _complete_over_rest(self, repos: List[Dict[str, Any]], include_readme: List[bool],
+                            truncated: List[bool]):
+        """Fetch over REST the READMEs no README_PATHS matched and the languages past the first page"""
+        calls = [(repo, "readme", self.fetch_readme)
+                 for repo, include in zip(repos, include_readme) if include and repo["readme"] is None]
+        calls += [(repo, "languages", self.fetch_languages)
+                  for repo, cut in zip(repos, truncated) if cut]
+        if not calls:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(Config.GITHUB_MAX_WORKERS, len(calls)))) as pool:
+            results = pool.map(lambda call: call[2](call[0]["full_name"]), calls)
+            for (repo, field, _), value in zip(calls, results):
+                repo[field] = value
+    
+    def _paginate_profile(self, username: str, query: str, details: bool) -> Dict[str, Any]:
+        user: Dict[str, Any] = {}
+        repos: List[Dict[str, Any]] = []
+        include_readme: List[bool] = []
+        truncated: List[bool] = []
+        cursor = None
+        
+        while True:
+            data = self.client.graphql(query, {
+                "login": username, "first": self.page_size, "cursor": cursor,
+            })
+            node = data.get("user")
+            if node is None:
+                raise GitHubAPIError(404, f"User {username} not found")
+            
+            repositories = node["repositories"]
+            if not user:
+                user = {
+                    "name": node.get("name"),
+                    "bio": node.get("bio"),
+                    "location": node.get("location"),
+                    "public_repos": repositories["totalCount"],
+                    "followers": node["followers"]["totalCount"],
+                    "following": node["following"]["totalCount"],
+                }
+            
+            for repo_node in repositories["nodes"]:
+                include_readme.append(details and len(repos) < self.readme_limit)
+                repo = self._repo_from_node(repo_node, include_readme[-1])
+                truncated.append(details and self._languages_truncated(repo_node))
+                if not details:
+                    for field in ("languages", "commits", "readme"):
+                        del repo[field]
+                repos.append(repo)
+            
+            if not repositories["pageInfo"]["hasNextPage"]:
+                break
+            cursor = repositories["pageInfo"]["endCursor"]
+        
+        self._complete_over_rest(repos, include_readme, truncated)
+        return {"user": user, "repos": repos}
+    
+    def fetch_profile(self, username: str) -> Dict[str, Any]:
+        return self._paginate_profile(username, self.QUERY, details=True)
+    
+    def list_profile(self, username: str) -> Dict[str, Any]:
+        return self._paginate_profile(username, self.LIST_QUERY, details=False)
+    
+    def fetch_details(self, repos: List[Tuple[Dict[str, Any], bool]]) -> List[Dict[str, Any]]:
+        """Look up several repositories per query through aliased repository() fields"""
+        detailed = []
+        truncated = []
+        for start in range(0, len(repos), self.page_size):
+            chunk = repos[start:start + self.page_size]
+            
+            params, fields, variables = [], [], {}
+            for i, (repo, include_readme) in enumerate(chunk):
+                owner, name = repo["full_name"].split("/", 1)
+                params.append(f"$owner{i}: String!, $name{i}: String!")
+                selection = self.SUMMARY_FIELDS + self.DETAIL_FIELDS
+                if include_readme:
+                    selection += self.README_FIELDS
+                fields.append(f"r{i}: repository(owner: $owner{i}, name: $name{i}) {{{selection}\n          }}")
+                variables[f"owner{i}"] = owner
+                variables[f"name{i}"] = name
+            
+            query = "query(%s) {\n          %s\n        }" % (", ".join(params), "\n          ".join(fields))
+            data = self.client.graphql(query, variables)
+            
+            for i, (repo, include_readme) in enumerate(chunk):
+                node = data.get(f"r{i}")
+                if node is None:
+                    raise GitHubAPIError(404, f"Repository {repo['full_name']} not found")
+                detailed.append(self._repo_from_node(node, include_readme))
+                truncated.append(self._languages_truncated(node))
+        self._complete_over_rest(detailed, [include_readme for _, include_readme in repos], truncated)
+        return detailed
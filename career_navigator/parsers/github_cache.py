@@ -0,0 +1,175 @@
+"""
+GitHub Response Cache - On-disk HTTP cache with ETag / Last-Modified revalidation
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Any
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+from parsers.disk_lru import DiskLRU
+
+
+class GitHubResponseCache:
+    """Store GitHub API responses on disk and revalidate them conditionally
+    
+    Entries younger than ttl seconds are served without touching the network.
+    Older entries are revalidated with If-None-Match / If-Modified-Since; a
+    304 answer does not count against the GitHub rate limit, so a repeat
+    analysis of an unchanged profile costs round trips but no quota.
+    
+    One JSON file per entry, least recently used entries are evicted once the
+    directory grows past max_bytes (see DiskLRU).
+    """
+    
+    # Response headers kept with each entry
+    STORED_HEADERS = ("ETag", "Last-Modified", "Link", "Content-Type")
+    
+    def __init__(self, cache_dir: Path = None, ttl: int = None, max_bytes: int = None):
+        self.cache_dir = Path(cache_dir or Config.GITHUB_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = Config.GITHUB_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = max_bytes or Config.GITHUB_CACHE_MAX_BYTES
+        
+        self.hits = 0           # served fresh, no request sent
+        self.revalidated = 0    # 304 Not Modified
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._lru = DiskLRU(self.cache_dir, "*.json", self.max_bytes)
+    
+    @staticmethod
+    def make_key(method: str, url: str, headers: Dict[str, str], body: Any = None,
+                 identity: str = "") -> str:
+        """Key on everything that changes the response body"""
+        parts = [
+            method.upper(),
+            url,
+            headers.get("Accept", ""),
+            # Hash of the credentials, not the credentials themselves
+            hashlib.sha256(identity.encode()).hexdigest(),
+            json.dumps(body, sort_keys=True) if body is not None else "",
+        ]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for key, or None"""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return entry
+    
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["stored_at"] < self.ttl
+    
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Validators to send when revalidating an entry"""
+        headers = {}
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+    
+    def put(self, key: str, response: requests.Response):
+        """Store a successful response"""
+        entry = {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in self.STORED_HEADERS if name in response.headers
+            },
+            "body": response.content.decode('utf-8', errors='surrogateescape'),
+            "stored_at": time.time(),
+        }
+        self._write(key, entry)
+    
+    def refresh(self, key: str, entry: Dict[str, Any], response: requests.Response):
+        """Restart the TTL of an entry after a 304, taking any new validators"""
+        for name in ("ETag", "Last-Modified"):
+            if name in response.headers:
+                entry["headers"][name] = response.headers[name]
+        entry["stored_at"] = time.time()
+        self._write(key, entry)
+    
+    def _write(self, key: str, entry: Dict[str, Any]):
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        old_size = DiskLRU.size_of(path)
+        try:
+            tmp_path.write_text(json.dumps(entry), encoding='utf-8')
+            new_size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  GitHub cache write failed: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        
+        # Refreshed entries can grow too (new validators), so every write counts
+        evicted = self._lru.record_write(old_size, new_size)
+        if evicted:
+            with self._lock:
+                self.evictions += evicted
+    
+    @staticmethod
+    def to_response(entry: Dict[str, Any]) -> requests.Response:
+        """Rebuild a requests.Response from a stored entry"""
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"].encode('utf-8', errors='surrogateescape')
+        response.encoding = 'utf-8'
+        return response
+    
+    def record(self, outcome: str):
+        """Count a lookup outcome: "hit", "revalidated" or "miss" """
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidated":
+                self.revalidated += 1
+            else:
+                self.misses += 1
+    
+    def stats(self) -> Dict[str, float]:
+        """Lookup counters and current size"""
+        lookups = self.hits + self.revalidated + self.misses
+        sizes = []
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                sizes.append(entry.stat().st_size)
+            except OSError:
+                continue
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.revalidated) / lookups, 4) if lookups else 0.0,
+            "entries": len(sizes),
+            "size_bytes": sum(sizes),
+        }
+    
+    def clear(self):
+        """Delete every cached entry"""
+        for entry in self.cache_dir.glob("*.json"):
+            entry.unlink(missing_ok=True)
+        self._lru.forget()
@@ -0,0 +1,226 @@
+"""
+GitHub Client - Thin REST/GraphQL client over a pooled keep-alive session
+"""
+
+import json
+import re
+import threading
+from typing import Dict, List, Any
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+from parsers.github_cache import GitHubResponseCache
+from parsers.github_scheduler import RateLimitScheduler, RateLimitExhausted
+
+
+class GitHubAPIError(Exception):
+    """Raised when the GitHub API answers with an error status"""
+    
+    def __init__(self, status: int, message: str, url: str = ""):
+        super().__init__(f"{status} {message} ({url})" if url else f"{status} {message}")
+        self.status = status
+        self.message = message
+        self.url = url
+
+
+class GitHubClient:
+    """Minimal GitHub API client shared by the REST and GraphQL backends
+    
+    One requests.Session with a connection pool sized for the worker pool,
+    so concurrent calls reuse keep-alive connections. The session is safe to
+    share between threads for plain GET/POST calls.
+    
+    With a GitHubResponseCache, GET responses are served from disk while
+    fresh and revalidated with ETag / Last-Modified afterwards. GraphQL
+    results are cached for the TTL only (GitHub does not support
+    conditional GraphQL requests).
+    
+    Every request gets its token from a RateLimitScheduler, which spreads
+    load over all configured tokens and paces requests as quota runs low.
+    Rate-limited responses are retried on another token.
+    """
+    
+    def __init__(self, token: str = None, base_url: str = None, pool_size: int = None,
+                 timeout: int = 15, cache: GitHubResponseCache = None,
+                 tokens: List[str] = None, scheduler: RateLimitScheduler = None):
+        self.base_url = (base_url or Config.GITHUB_API_URL).rstrip('/')
+        self.timeout = timeout
+        self.cache = cache
+        self.max_retries = Config.GITHUB_RATE_LIMIT_RETRIES
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+        
+        pool_size = pool_size or Config.GITHUB_MAX_WORKERS
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'career-navigator',
+        })
+        
+        # Token pool: explicit list, else the single token
+        self.tokens = [t for t in (tokens or [token]) if t]
+        self.token = self.tokens[0] if self.tokens else None
+        self.scheduler = scheduler or RateLimitScheduler(self.tokens)
+        
+        # Responses are the same whichever pool token fetched them, so the
+        # cache is keyed on the pool rather than on the token used
+        self.identity = ",".join(sorted(self.tokens))
+    
+    def _url(self, path: str) -> str:
+        return path if path.startswith('http') else f"{self.base_url}{path}"
+    
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request and raise GitHubAPIError on an error status"""
+        url = self._url(path)
+        prepared = self.session.prepare_request(requests.Request(method, url, **kwargs))
+        resource = 'graphql' if url == self.graphql_url() else 'core'
+        
+        cache_key = entry = None
+        if self.cache is not None and method == 'GET' and not url.endswith('/rate_limit'):
+            cache_key = self.cache.make_key(method, prepared.url, prepared.headers,
+                                            identity=self.identity)
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                if self.cache.is_fresh(entry):
+                    self.cache.record("hit")
+                    return self.cache.to_response(entry)
+                prepared.headers.update(self.cache.conditional_headers(entry))
+        
+        response = self._send(prepared, resource)
+        
+        if cache_key is not None:
+            if entry is not None and response.status_code == 304:
+                self.cache.record("revalidated")
+                self.cache.refresh(cache_key, entry, response)
+                return self.cache.to_response(entry)
+            self.cache.record("miss")
+            if response.status_code == 200:
+                self.cache.put(cache_key, response)
+        
+        if response.status_code >= 400:
+            try:
+                message = response.json().get('message', response.reason)
+            except ValueError:
+                message = response.reason
+            raise GitHubAPIError(response.status_code, message, url)
+        return response
+    
+    def _send(self, prepared: requests.PreparedRequest, resource: str) -> requests.Response:
+        """Send with a scheduler-chosen token, retrying rate-limited responses"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                token = self.scheduler.acquire(resource)
+            except RateLimitExhausted as e:
+                raise GitHubAPIError(403, str(e), prepared.url)
+            
+            if token:
+                prepared.headers['Authorization'] = f'Bearer {token}'
+            else:
+                prepared.headers.pop('Authorization', None)
+            
+            response = self.session.send(prepared, timeout=self.timeout)
+            with self._count_lock:
+                self.request_count += 1
+            
+            self.scheduler.update(token, response.headers, resource)
+            if not self._is_rate_limited(response) or attempt == self.max_retries:
+                return response
+            self.scheduler.penalize(token, response.headers, resource)
+        return response
+    
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        if response.status_code not in (403, 429):
+            return False
+        return (response.headers.get('X-RateLimit-Remaining') == '0'
+                or 'Retry-After' in response.headers)
+    
+    def rate_limit_budget(self) -> Dict[str, Any]:
+        """Current quota across the token pool"""
+        return self.scheduler.budget()
+    
+    def get(self, path: str, params: Dict = None, headers: Dict = None) -> requests.Response:
+        return self.request('GET', path, params=params, headers=headers)
+    
+    def get_json(self, path: str, params: Dict = None) -> Any:
+        return self.get(path, params=params).json()
+    
+    def get_paginated(self, path: str, params: Dict = None) -> List[Any]:
+        """Follow rel="next" links and return all items"""
+        params = dict(params or {})
+        params.setdefault('per_page', 100)
+        
+        items = []
+        response = self.get(path, params=params)
+        items.extend(response.json())
+        while 'next' in response.links:
+            response = self.get(response.links['next']['url'])
+            items.extend(response.json())
+        return items
+    
+    def count_paginated(self, path: str, params: Dict = None) -> int:
+        """Count the items of a listing with a single per_page=1 request"""
+        params = dict(params or {})
+        params['per_page'] = 1
+        
+        response = self.get(path, params=params)
+        last = response.links.get('last')
+        if last:
+            match = re.search(r'[?&]page=(\d+)', last['url'])
+            if match:
+                return int(match.group(1))
+        return len(response.json())
+    
+    def graphql(self, query: str, variables: Dict = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data"""
+        if not self.token:
+            raise GitHubAPIError(401, "GraphQL API requires a token")
+        
+        body = {'query': query, 'variables': variables or {}}
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key('POST', self.graphql_url(), self.session.headers, body,
+                                            identity=self.identity)
+            entry = self.cache.get(cache_key)
+            if entry is not None and self.cache.is_fresh(entry):
+                self.cache.record("hit")
+                return json.loads(entry["body"]).get('data') or {}
+            self.cache.record("miss")
+        
+        response = self.request('POST', self.graphql_url(), json=body)
+        payload = response.json()
+        if payload.get('errors'):
+            error = payload['errors'][0]
+            # A user or repository that does not resolve is a 404, as over REST
+            status = 404 if error.get('type') == 'NOT_FOUND' else response.status_code
+            raise GitHubAPIError(status, error.get('message', 'GraphQL error'))
+        
+        # Only complete, error-free results are cached
+        if cache_key is not None:
+            self.cache.put(cache_key, response)
+        return payload.get('data') or {}
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """Response cache statistics (empty when caching is off)"""
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def graphql_url(self) -> str:
+        """GraphQL endpoint for the configured API host"""
+        # github.com serves /graphql next to the REST API; GitHub Enterprise
+        # serves REST under /api/v3 and GraphQL under /api/graphql
+        if self.base_url.endswith('/api/v3'):
+            return self.base_url[:-len('/v3')] + '/graphql'
+        return f"{self.base_url}/graphql"
+    
+    def close(self):
+        self.session.close()
@@ -0,0 +1,186 @@
+"""
+GitHub Rate Limit Scheduler - Spread requests over a pool of tokens and pace them
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+
+
+class RateLimitExhausted(Exception):
+    """Raised when every token is spent and the next reset is too far away"""
+
+
+class TokenBudget:
+    """Remaining quota of one token for one rate limit resource (core, graphql)"""
+    
+    def __init__(self, token: Optional[str], resource: str):
+        self.token = token
+        self.resource = resource
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None   # None until the first response
+        self.reset_at = 0.0
+        self.next_slot = 0.0                   # earliest start of the next paced request
+
+
+class RateLimitScheduler:
+    """Pick a token for every GitHub request and slow down before quota runs out
+    
+    Every response's X-RateLimit-* headers update the budget of the token that
+    sent it. Requests go to the token with the most quota left among those
+    free to send now; a token backing off after a Retry-After (or pacing) is
+    only waited for when no other token is free. Once a token
+    drops below slowdown_threshold, its remaining requests are spaced evenly
+    until its reset time, so a burst degrades into slower analyses rather than
+    403s. Tokens are never used below reserve; if every token is there, the
+    scheduler waits for the earliest reset (up to max_wait seconds).
+    """
+    
+    def __init__(self, tokens: List[Optional[str]], slowdown_threshold: int = None,
+                 reserve: int = None, max_wait: int = None):
+        self.tokens = list(tokens) or [None]
+        self.slowdown_threshold = (Config.GITHUB_RATE_LIMIT_SLOWDOWN
+                                   if slowdown_threshold is None else slowdown_threshold)
+        self.reserve = Config.GITHUB_RATE_LIMIT_RESERVE if reserve is None else reserve
+        self.max_wait = Config.GITHUB_RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        
+        self._budgets: Dict[Tuple[Optional[str], str], TokenBudget] = {}
+        self._lock = threading.Lock()
+        
+        # Metrics: throttled_seconds is wall-clock time during which at least
+        # one request was held back; thread_wait_seconds sums every thread's waits
+        self.requests = 0
+        self.throttled_seconds = 0.0
+        self.thread_wait_seconds = 0.0
+        self.rate_limited_responses = 0
+        self._waiting = 0
+        self._waiting_since = 0.0
+    
+    def _budget(self, token: Optional[str], resource: str) -> TokenBudget:
+        key = (token, resource)
+        if key not in self._budgets:
+            self._budgets[key] = TokenBudget(token, resource)
+        return self._budgets[key]
+    
+    def _reserve_slot(self, resource: str) -> Tuple[Optional[TokenBudget], float]:
+        """Choose a token and return (budget, seconds to wait); budget is None if all are spent"""
+        with self._lock:
+            now = time.time()
+            budgets = [self._budget(token, resource) for token in self.tokens]
+            
+            for budget in budgets:
+                if budget.remaining is not None and budget.reset_at and budget.reset_at <= now:
+                    budget.remaining = budget.limit
+            
+            usable = [b for b in budgets if b.remaining is None or b.remaining > self.reserve]
+            if not usable:
+                return None, max(min(b.reset_at for b in budgets) - now, 1.0)
+            
+            # Among tokens free to send now: unknown budgets first (learn
+            # them), then the fullest token. If none is free, the one free soonest
+            free = [b for b in usable if b.next_slot <= now]
+            if free:
+                budget = max(free, key=lambda b: (b.remaining is None, b.remaining or 0))
+            else:
+                budget = min(usable, key=lambda b: b.next_slot)
+            
+            start = max(now, budget.next_slot)
+            if budget.remaining is not None and budget.remaining < self.slowdown_threshold:
+                spendable = max(budget.remaining - self.reserve, 1)
+                interval = max(budget.reset_at - now, 0) / spendable
+                budget.next_slot = start + interval
+            
+            # Count the request against the budget before it is sent, so
+            # concurrent callers see each other's in-flight requests
+            if budget.remaining is not None:
+                budget.remaining -= 1
+            self.requests += 1
+            return budget, start - now
+    
+    def acquire(self, resource: str = "core") -> Optional[str]:
+        """Block until a request may be sent and return the token to send it with"""
+        waited = 0.0
+        while True:
+            budget, delay = self._reserve_slot(resource)
+            if budget is not None and delay <= 0:
+                return budget.token
+            
+            if waited + delay > self.max_wait:
+                raise RateLimitExhausted(f"GitHub {resource} rate limit exhausted for all tokens")
+            
+            self._sleep(delay)
+            waited += delay
+            if budget is not None:
+                return budget.token
+    
+    def _sleep(self, delay: float):
+        """Sleep, tracking the wall-clock time during which any thread is held back"""
+        with self._lock:
+            if self._waiting == 0:
+                self._waiting_since = time.time()
+            self._waiting += 1
+        try:
+            time.sleep(delay)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                self.thread_wait_seconds += delay
+                if self._waiting == 0:
+                    self.throttled_seconds += time.time() - self._waiting_since
+    
+    def update(self, token: Optional[str], headers: Any, resource: str = "core"):
+        """Record the quota reported in a response's X-RateLimit-* headers"""
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        resource = headers.get('X-RateLimit-Resource', resource)
+        with self._lock:
+            budget = self._budget(token, resource)
+            budget.remaining = int(headers['X-RateLimit-Remaining'])
+            if 'X-RateLimit-Limit' in headers:
+                budget.limit = int(headers['X-RateLimit-Limit'])
+            if 'X-RateLimit-Reset' in headers:
+                budget.reset_at = float(headers['X-RateLimit-Reset'])
+    
+    def penalize(self, token: Optional[str], headers: Any, resource: str = "core"):
+        """Take a token out of rotation after a rate-limited (403/429) response"""
+        with self._lock:
+            self.rate_limited_responses += 1
+            budget = self._budget(token, headers.get('X-RateLimit-Resource', resource))
+            retry_after = headers.get('Retry-After')
+            if retry_after is not None:
+                # Secondary rate limit: back off this token for the given time
+                budget.next_slot = max(budget.next_slot, time.time() + float(retry_after))
+            else:
+                budget.remaining = 0
+    
+    def budget(self) -> Dict[str, Any]:
+        """Current quota per resource, summed over the token pool"""
+        with self._lock:
+            resources: Dict[str, Dict[str, Any]] = {}
+            for budget in self._budgets.values():
+                summary = resources.setdefault(budget.resource, {
+                    "remaining": 0, "limit": 0, "known_tokens": 0, "next_reset_at": None,
+                })
+                if budget.remaining is None:
+                    continue
+                summary["remaining"] += budget.remaining
+                summary["limit"] += budget.limit or 0
+                summary["known_tokens"] += 1
+                if budget.reset_at and (summary["next_reset_at"] is None
+                                        or budget.reset_at < summary["next_reset_at"]):
+                    summary["next_reset_at"] = budget.reset_at
+            
+            return {
+                "tokens": len(self.tokens),
+                "resources": resources,
+                "requests": self.requests,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "thread_wait_seconds": round(self.thread_wait_seconds, 3),
+                "rate_limited_responses": self.rate_limited_responses,
+            }
@@ -0,0 +1,161 @@
+"""
+GitHub Profile Snapshots - Per-repo results kept between runs for incremental refreshes
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+
+
+class ProfileSnapshot:
+    """Per-repo results of the last analysis plus the aggregates built from them
+    
+    Each repository record holds the listing fields (name, stars, pushed_at,
+    updated_at, ...) and the expensive per-repo results: "languages",
+    "commits" and "readme_skills" (None when the README was never scanned).
+    
+    The expensive results only change when a repository is pushed to, so a
+    refresh re-fetches repos whose pushed_at moved (or that are new) and
+    reuses the rest. Listing fields, including stars and forks, come from
+    the listing on every refresh. Aggregates are updated by subtracting the
+    previous contribution of re-fetched and removed repos and adding the new
+    one; unchanged repos only shift the star and fork totals, so a refresh
+    costs O(changed repos) aggregate work instead of O(all repos).
+    """
+    
+    VERSION = 1
+    
+    # Listing fields, refreshed for every repo on every run
+    SUMMARY_FIELDS = ("name", "full_name", "description", "language", "stars", "forks",
+                      "url", "pushed_at", "updated_at")
+    
+    def __init__(self, data: Dict[str, Any] = None):
+        data = data or {}
+        self.user: Dict[str, Any] = data.get("user", {})
+        self.repos: Dict[str, Dict[str, Any]] = data.get("repos", {})
+        self.language_bytes = Counter(data.get("language_bytes", {}))
+        self.activity: Dict[str, int] = data.get("activity", {
+            "total_commits": 0, "total_stars": 0, "total_forks": 0,
+        })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.VERSION,
+            "user": self.user,
+            "repos": self.repos,
+            "language_bytes": dict(self.language_bytes),
+            "activity": self.activity,
+        }
+    
+    def needs_details(self, listing: List[Dict[str, Any]],
+                      readme_limit: int) -> List[Tuple[Dict[str, Any], bool]]:
+        """(repo summary, include_readme) pairs that have to be fetched again"""
+        stale = []
+        for i, repo in enumerate(listing):
+            include_readme = i < readme_limit
+            previous = self.repos.get(repo["full_name"])
+            if (previous is None
+                    or previous["pushed_at"] != repo["pushed_at"]
+                    or (include_readme and previous.get("readme_skills") is None)):
+                stale.append((repo, include_readme))
+        return stale
+    
+    def _add(self, record: Dict[str, Any], sign: int):
+        """Add (sign=1) or remove (sign=-1) one repository's contribution"""
+        languages = Counter(record.get("languages") or {})
+        if sign > 0:
+            self.language_bytes.update(languages)
+        else:
+            self.language_bytes.subtract(languages)
+            self.language_bytes = +self.language_bytes  # drop zeroed languages
+        
+        # Repos whose commits cannot be counted (empty repos) are skipped
+        if record.get("commits") is None:
+            return
+        self.activity["total_commits"] += sign * record["commits"]
+        self.activity["total_stars"] += sign * record["stars"]
+        self.activity["total_forks"] += sign * record["forks"]
+    
+    def merge(self, user: Dict[str, Any], listing: List[Dict[str, Any]],
+              details: List[Dict[str, Any]]):
+        """Apply a fresh listing and the re-fetched repositories
+        
+        details are records for the repos returned by needs_details, each with
+        "languages", "commits" and "readme_skills". Repos missing from the
+        listing were deleted (or made private) and are removed.
+        """
+        fetched = {record["full_name"]: record for record in details}
+        listed = {repo["full_name"] for repo in listing}
+        
+        for full_name in list(self.repos):
+            if full_name not in listed:
+                self._add(self.repos.pop(full_name), -1)
+        
+        repos = {}
+        for repo in listing:
+            full_name = repo["full_name"]
+            previous = self.repos.get(full_name)
+            summary = {field: repo.get(field) for field in self.SUMMARY_FIELDS}
+            if full_name in fetched:
+                record = dict(fetched[full_name], **summary)
+                if previous is not None:
+                    self._add(previous, -1)
+                self._add(record, 1)
+            else:
+                # Unchanged repo: only its listed stars and forks can move the aggregates
+                record = dict(previous, **summary)
+                if record.get("commits") is not None:
+                    self.activity["total_stars"] += record["stars"] - previous["stars"]
+                    self.activity["total_forks"] += record["forks"] - previous["forks"]
+            repos[full_name] = record
+        
+        # Keep listing order, which decides the README and top-repo selection
+        self.user = user
+        self.repos = repos
+    
+    def ordered_repos(self) -> List[Dict[str, Any]]:
+        return list(self.repos.values())
+
+
+class GitHubSnapshotStore:
+    """One JSON snapshot per (API host, username), written atomically"""
+    
+    def __init__(self, snapshot_dir: Path = None):
+        self.snapshot_dir = Path(snapshot_dir or Config.GITHUB_SNAPSHOT_DIR)
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, base_url: str, username: str) -> Path:
+        key = hashlib.sha256(f"{base_url}\n{username.lower()}".encode()).hexdigest()
+        return self.snapshot_dir / f"{key}.json"
+    
+    def load(self, base_url: str, username: str) -> Optional[ProfileSnapshot]:
+        """Return the stored snapshot, or None if missing or from another version"""
+        try:
+            data = json.loads(self._path(base_url, username).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != ProfileSnapshot.VERSION:
+            return None
+        return ProfileSnapshot(data)
+    
+    def save(self, base_url: str, username: str, snapshot: ProfileSnapshot):
+        path = self._path(base_url, username)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(snapshot.to_dict()), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  GitHub snapshot write failed: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def delete(self, base_url: str, username: str):
+        self._path(base_url, username).unlink(missing_ok=True)
@@ -3,17 +3,16 @@ LinkedIn Parser - Extract information from LinkedIn PDF exports
 """
 
 import re
-import PyPDF2
-import pdfplumber
 from typing import Dict, List, Set, Any
 from pathlib import Path
 
-import spacy
-
 # Import config
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from config import Config
+from nlp.model_registry import NLPModelRegistry
+from skills.skill_index import SkillIndex
+from parsers.pdf_extractor import PDFTextExtractor
 
 
 class LinkedInParser:
@@ -22,40 +21,19 @@ class LinkedInParser:
     def __init__(self):
         print("🔧 Initializing LinkedIn Parser...")
         
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_lg")
-            print("✅ LinkedIn Parser initialized\n")
-        except Exception as e:
-            print(f"❌ Error loading spaCy: {e}")
-            raise
-        
-        self.tech_skills_lower = {skill.lower() for skill in Config.TECH_SKILLS}
+        self.tech_index = SkillIndex.for_tech_skills()
+        self.pdf_extractor = PDFTextExtractor.shared()
+        print("✅ LinkedIn Parser initialized\n")
+    
+    @property
+    def nlp(self):
+        """Shared NER pipeline, loaded on first use"""
+        return NLPModelRegistry.get(Config.SPACY_MODEL, ner_only=True)
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from LinkedIn PDF"""
-        text = ""
-        
-        # Use pdfplumber (works better with LinkedIn PDFs)
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            print(f"⚠️  pdfplumber failed: {e}")
-            
-            # Fallback to PyPDF2
-            try:
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-            except Exception as e2:
-                print(f"❌ PyPDF2 also failed: {e2}")
-        
-        return text.strip()
+        # pdfplumber works better with LinkedIn PDFs; PyPDF2 only if it fails
+        return self.pdf_extractor.extract(pdf_path, min_chars=0)
     
     def extract_profile_section(self, text: str, section_name: str) -> str:
         """Extract specific section from LinkedIn PDF"""
@@ -155,48 +133,9 @@ class LinkedInParser:
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills from entire LinkedIn PDF"""
-        extracted_skills = set()
-        text_lower = text.lower()
-        
-        # Method 1: Skills section
-        skills_section = self.extract_profile_section(text, "Skills")
-        if not skills_section:
-            skills_section = self.extract_profile_section(text, "Top Skills")
-        
-        if skills_section:
-            for skill in self.tech_skills_lower:
-                if skill in skills_section.lower():
-                    original_skill = next(s for s in Config.TECH_SKILLS if s.lower() == skill)
-                    extracted_skills.add(original_skill)
-        
-        # Method 2: Certifications section (often contains technology names)
-        cert_section = self.extract_profile_section(text, "Certifications")
-        if not cert_section:
-            cert_section = self.extract_profile_section(text, "Licenses & Certifications")
-        
-        if cert_section:
-            for skill in self.tech_skills_lower:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, cert_section.lower()):
-                    original_skill = next(s for s in Config.TECH_SKILLS if s.lower() == skill)
-                    extracted_skills.add(original_skill)
-        
-        # Method 3: Summary section
-        summary = self.extract_profile_section(text, "Summary")
-        if summary:
-            for skill in self.tech_skills_lower:
-                if skill in summary.lower():
-                    original_skill = next(s for s in Config.TECH_SKILLS if s.lower() == skill)
-                    extracted_skills.add(original_skill)
-        
-        # Method 4: Search entire document
-        for skill in self.tech_skills_lower:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                original_skill = next(s for s in Config.TECH_SKILLS if s.lower() == skill)
-                extracted_skills.add(original_skill)
-        
-        return sorted(list(extracted_skills))
+        # The Skills, Certifications and Summary sections are all part of the
+        # document, so one word-bounded scan of the full text covers them
+        return sorted(self.tech_index.extract(text))
     
     def extract_certifications(self, text: str) -> List[str]:
         """Extract certifications"""
@@ -0,0 +1,232 @@
+"""
+PDF Text Extractor - Shared PDF text extraction with a content-addressed cache
+"""
+
+import hashlib
+import os
+import threading
+import PyPDF2
+import pdfplumber
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+from parsers.disk_lru import DiskLRU
+
+
+# pdfplumber document opened once per pool worker (see _init_page_worker)
+_worker_pdf = None
+
+
+def _init_page_worker(pdf_path: str):
+    """Pool initializer: open the PDF once for all chunks this worker handles"""
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _extract_page_range(page_range: Tuple[int, int]) -> List[str]:
+    """Extract the text of pages [start, end) in the worker's open PDF"""
+    start, end = page_range
+    return [page.extract_text() or "" for page in _worker_pdf.pages[start:end]]
+
+
+class PDFTextCache:
+    """On-disk cache of extracted PDF text with LRU eviction
+
+    Entries are stored as one text file per key. File modification time is
+    refreshed on every hit and used as the recency order, so the oldest
+    entries are evicted first once the directory grows past max_bytes
+    (see DiskLRU).
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._lru = DiskLRU(self.cache_dir, "*.txt", max_bytes)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached text for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding='utf-8')
+            os.utime(path)  # mark as recently used
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key: str, text: str):
+        """Store text for key and evict least recently used entries"""
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        old_size = DiskLRU.size_of(path)
+        try:
+            tmp_path.write_text(text, encoding='utf-8')
+            new_size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)  # atomic, readers never see partial text
+        except OSError as e:
+            print(f"⚠️  PDF cache write failed: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        evicted = self._lru.record_write(old_size, new_size)
+        if evicted:
+            with self._lock:
+                self.evictions += evicted
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current size"""
+        entries = list(self.cache_dir.glob("*.txt"))
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(entries),
+            "size_bytes": sum(e.stat().st_size for e in entries if e.exists()),
+        }
+
+    def clear(self):
+        """Delete every cached entry"""
+        for entry in self.cache_dir.glob("*.txt"):
+            entry.unlink(missing_ok=True)
+        self._lru.forget()
+
+
+class PDFTextExtractor:
+    """Extract text from PDFs with pdfplumber, falling back to PyPDF2
+
+    Results are cached under the SHA-256 of the file bytes plus the extractor
+    version and options, so re-analysing the same file skips PDF parsing.
+    Bump VERSION whenever the extraction logic changes output.
+
+    Documents with at least parallel_min_pages pages are split into chunks of
+    pages and extracted in a process pool; shorter ones stay serial, where
+    pool startup would cost more than it saves.
+    """
+
+    VERSION = "1"
+
+    _shared: Optional['PDFTextExtractor'] = None
+
+    def __init__(self, cache: Optional[PDFTextCache] = None,
+                 parallel_min_pages: int = None, chunk_pages: int = None,
+                 workers: int = None):
+        self.cache = cache
+        self.parallel_min_pages = parallel_min_pages or Config.PDF_PARALLEL_MIN_PAGES
+        self.chunk_pages = chunk_pages or Config.PDF_PARALLEL_CHUNK_PAGES
+        self.workers = workers or Config.PDF_PARALLEL_WORKERS
+
+    @classmethod
+    def shared(cls) -> 'PDFTextExtractor':
+        """Process-wide extractor backed by the Config cache directory"""
+        if cls._shared is None:
+            cls._shared = cls(PDFTextCache(Config.PDF_CACHE_DIR, Config.PDF_CACHE_MAX_BYTES))
+        return cls._shared
+
+    @staticmethod
+    def file_digest(pdf_path: str) -> str:
+        """SHA-256 of the file contents"""
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def cache_key(self, pdf_path: str, min_chars: int) -> str:
+        """Cache key for a file under the current extractor version and options"""
+        return f"{self.file_digest(pdf_path)}-v{self.VERSION}-m{min_chars}"
+
+    def extract(self, pdf_path: str, min_chars: int = 0) -> str:
+        """Extract text from a PDF, using the cache when possible
+
+        Args:
+            pdf_path: Path to the PDF file
+            min_chars: Also run PyPDF2 when pdfplumber yields fewer characters
+                than this. PyPDF2 always runs if pdfplumber raises.
+        """
+        key = None
+        if self.cache is not None:
+            try:
+                key = self.cache_key(pdf_path, min_chars)
+            except OSError as e:
+                print(f"⚠️  Could not read PDF: {e}")
+                return ""
+
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        text = self._extract_uncached(pdf_path, min_chars)
+
+        if key is not None and text:
+            self.cache.put(key, text)
+        return text
+
+    def _extract_uncached(self, pdf_path: str, min_chars: int) -> str:
+        """Run the PDF parsers"""
+        pages: List[str] = []
+        plumber_failed = False
+
+        # Method 1: pdfplumber (better for complex layouts)
+        try:
+            pages = self._extract_pages_pdfplumber(pdf_path)
+        except Exception as e:
+            print(f"⚠️  pdfplumber extraction failed: {e}")
+            plumber_failed = True
+
+        pages = [page_text for page_text in pages if page_text]
+
+        # Method 2: PyPDF2 (fallback)
+        if plumber_failed or len("\n".join(pages).strip()) < min_chars:
+            try:
+                with open(pdf_path, 'rb') as file:
+                    pdf_reader = PyPDF2.PdfReader(file)
+                    pages.extend(page.extract_text() for page in pdf_reader.pages)
+            except Exception as e:
+                print(f"⚠️  PyPDF2 extraction failed: {e}")
+
+        # Single join in page order
+        return "".join(page_text + "\n" for page_text in pages).strip()
+
+    def _extract_pages_pdfplumber(self, pdf_path: str) -> List[str]:
+        """Per-page pdfplumber text, farmed out to a process pool for long PDFs"""
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+            if page_count < self.parallel_min_pages or self.workers < 2:
+                return [page.extract_text() for page in pdf.pages]
+
+        ranges = [
+            (start, min(start + self.chunk_pages, page_count))
+            for start in range(0, page_count, self.chunk_pages)
+        ]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(ranges)),
+                initializer=_init_page_worker,
+                initargs=(str(pdf_path),),
+            ) as pool:
+                # map() yields chunks in submission order, i.e. page order
+                return [page_text for chunk in pool.map(_extract_page_range, ranges)
+                        for page_text in chunk]
+        except Exception as e:
+            print(f"⚠️  Parallel PDF extraction failed, retrying serially: {e}")
+            with pdfplumber.open(pdf_path) as pdf:
+                return [page.extract_text() for page in pdf.pages]
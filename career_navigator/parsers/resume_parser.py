@@ -3,18 +3,18 @@ Resume Parser - Extract skills and information from resume PDFs
 """
 
 import re
-import PyPDF2
-import pdfplumber
 from typing import Dict, List, Set, Any
 from pathlib import Path
 
-import spacy
 from nltk.corpus import stopwords
 
 # Import config
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from config import Config
+from nlp.model_registry import NLPModelRegistry
+from skills.skill_index import SkillIndex
+from parsers.pdf_extractor import PDFTextExtractor
 
 
 class ResumeParser:
@@ -23,49 +23,27 @@ class ResumeParser:
     def __init__(self):
         print("🔧 Initializing Resume Parser...")
         
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_lg")
-            print("✅ spaCy model loaded successfully")
-        except Exception as e:
-            print(f"❌ Error loading spaCy: {e}")
-            print("Run: python -m spacy download en_core_web_lg")
-            raise
-        
         # Load stopwords
         self.stop_words = set(stopwords.words('english'))
         
-        # Skill patterns (lowercase for matching)
-        self.tech_skills_lower = {skill.lower() for skill in Config.TECH_SKILLS}
-        self.soft_skills_lower = {skill.lower() for skill in Config.SOFT_SKILLS}
+        # Shared single-pass skill matchers
+        self.tech_index = SkillIndex.for_tech_skills()
+        self.soft_index = SkillIndex.for_soft_skills()
+        
+        # Shared PDF text extraction (cached by file contents)
+        self.pdf_extractor = PDFTextExtractor.shared()
         
         print("✅ Resume Parser initialized\n")
     
+    @property
+    def nlp(self):
+        """Shared NER pipeline, loaded on first use"""
+        return NLPModelRegistry.get(Config.SPACY_MODEL, ner_only=True)
+    
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text content from PDF file using multiple methods"""
-        text = ""
-        
-        # Method 1: pdfplumber (better for complex layouts)
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            print(f"⚠️  pdfplumber extraction failed: {e}")
-        
-        # Method 2: PyPDF2 (fallback)
-        if len(text.strip()) < 100:
-            try:
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-            except Exception as e:
-                print(f"⚠️  PyPDF2 extraction failed: {e}")
-        
-        return text.strip()
+        # pdfplumber first, PyPDF2 added when it yields under 100 characters
+        return self.pdf_extractor.extract(pdf_path, min_chars=100)
     
     def extract_email(self, text: str) -> str:
         """Extract email address using regex"""
@@ -232,32 +210,12 @@ class ResumeParser:
     
     def extract_skills_nlp(self, text: str) -> Set[str]:
         """Extract technical skills using pattern matching"""
-        text_lower = text.lower()
-        extracted_skills = set()
-        
-        # Direct substring matching with word boundaries
-        for skill in self.tech_skills_lower:
-            # Use word boundaries for accurate matching
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                # Find original case from Config
-                original_skill = next(s for s in Config.TECH_SKILLS if s.lower() == skill)
-                extracted_skills.add(original_skill)
-        
-        return extracted_skills
+        # Single scan with word boundaries, hits come back in canonical case
+        return self.tech_index.extract(text)
     
     def extract_soft_skills(self, text: str) -> Set[str]:
         """Extract soft skills"""
-        text_lower = text.lower()
-        extracted_soft_skills = set()
-        
-        for skill in self.soft_skills_lower:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                original_skill = next(s for s in Config.SOFT_SKILLS if s.lower() == skill)
-                extracted_soft_skills.add(original_skill)
-        
-        return extracted_soft_skills
+        return self.soft_index.extract(text)
     
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
         """Main function to parse resume and extract all information"""
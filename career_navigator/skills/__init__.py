@@ -0,0 +1,9 @@
+"""
+Skills package for Career Navigator
+"""
+
+from .registry import SkillRegistry
+from .skill_index import SkillIndex
+from .skill_vectors import SkillVectorIndex
+
+__all__ = ['SkillRegistry', 'SkillIndex', 'SkillVectorIndex']
@@ -0,0 +1,121 @@
+"""
+Skill Registry - Interned skill names with integer IDs and bitset skill sets
+"""
+
+import threading
+from typing import Dict, List, Optional, Iterable
+from pathlib import Path
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+
+
+class SkillRegistry:
+    """Give every canonical skill a stable integer ID
+
+    Dictionary skills are numbered in sorted order of their canonical
+    spelling, so IDs only depend on the skill dictionary. Lowercase spellings
+    and aliases resolve to the same ID through precomputed dicts. Names that
+    are not in the dictionary (skills typed into a profile by hand) are
+    interned on first sight and get the next free ID.
+
+    Skill sets are plain Python ints with bit ``i`` set for skill ID ``i``,
+    so union / intersection / difference are single bit operations.
+    """
+
+    # Shared registries built from Config, one per dictionary
+    _shared: Dict[str, 'SkillRegistry'] = {}
+
+    def __init__(self, skills: Iterable[str], aliases: Dict[str, str] = None):
+        self.names: List[str] = []
+        self.lookup: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        # Canonical spelling is the first in sorted order, so
+        # "Scikit-learn" wins over "scikit-learn" deterministically
+        for skill in sorted(skills):
+            if skill.lower() not in self.lookup:
+                self.lookup[skill.lower()] = len(self.names)
+                self.names.append(skill)
+
+        self.dictionary_size = len(self.names)
+
+        for alias, skill in (aliases or {}).items():
+            skill_id = self.lookup.get(skill.lower())
+            if skill_id is not None:
+                self.lookup.setdefault(alias.lower(), skill_id)
+
+    @classmethod
+    def for_tech_skills(cls) -> 'SkillRegistry':
+        """Shared registry over Config.TECH_SKILLS and Config.SKILL_ALIASES"""
+        if 'tech' not in cls._shared:
+            cls._shared['tech'] = cls(Config.TECH_SKILLS, Config.SKILL_ALIASES)
+        return cls._shared['tech']
+
+    @classmethod
+    def for_soft_skills(cls) -> 'SkillRegistry':
+        """Shared registry over Config.SOFT_SKILLS"""
+        if 'soft' not in cls._shared:
+            cls._shared['soft'] = cls(Config.SOFT_SKILLS)
+        return cls._shared['soft']
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def terms(self) -> Dict[str, int]:
+        """Lowercase spellings and aliases of the dictionary skills"""
+        return {
+            term: skill_id for term, skill_id in self.lookup.items()
+            if skill_id < self.dictionary_size
+        }
+
+    def id_of(self, name: str) -> Optional[int]:
+        """Return the ID of a skill or alias, or None if it is unknown"""
+        return self.lookup.get(name.lower())
+
+    def intern(self, name: str) -> int:
+        """Return the ID of a skill, assigning a new one if it is unknown"""
+        key = name.lower()
+        skill_id = self.lookup.get(key)
+        if skill_id is not None:
+            return skill_id
+
+        with self._lock:
+            skill_id = self.lookup.get(key)
+            if skill_id is None:
+                skill_id = len(self.names)
+                self.names.append(name)
+                self.lookup[key] = skill_id
+        return skill_id
+
+    def canonical(self, name: str) -> str:
+        """Return the canonical spelling of a skill or alias"""
+        skill_id = self.lookup.get(name.lower())
+        return self.names[skill_id] if skill_id is not None else name
+
+    def to_bits(self, skills: Iterable[str]) -> int:
+        """Encode skill names as a bitset"""
+        bits = 0
+        for skill in skills:
+            bits |= 1 << self.intern(skill)
+        return bits
+
+    def ids_of(self, bits: int) -> List[int]:
+        """Decode a bitset into ascending skill IDs"""
+        ids = []
+        while bits:
+            lowest = bits & -bits
+            ids.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return ids
+
+    def from_bits(self, bits: int) -> List[str]:
+        """Decode a bitset into sorted canonical skill names"""
+        return sorted(self.names[skill_id] for skill_id in self.ids_of(bits))
+
+    @staticmethod
+    def count(bits: int) -> int:
+        """Number of skills in a bitset"""
+        return bin(bits).count('1')
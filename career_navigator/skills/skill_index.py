@@ -0,0 +1,148 @@
+"""
+Skill Index - Single-pass skill matching over the Config skill dictionaries
+"""
+
+import re
+from typing import Dict, List, Set, Any, Iterable, Tuple
+from pathlib import Path
+
+# Import skill registry
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from skills.registry import SkillRegistry
+
+
+def _is_word_char(char: str) -> bool:
+    """Mirror the regex definition of a word character"""
+    return char.isalnum() or char == '_'
+
+
+class SkillIndex:
+    """Find every dictionary skill in a text with one compiled regex scan
+
+    The skill dictionary is folded into a character trie and compiled into a
+    single regex, so each position of the text is tested against the trie
+    rather than against every skill. Matching cost depends on the text length
+    and the longest skill, not on the number of skills in the dictionary.
+
+    Terms come from a SkillRegistry, so aliases resolve to the same skill and
+    hits can be returned as registry bitsets.
+    """
+
+    # Shared indexes built from Config, one per dictionary
+    _shared: Dict[str, 'SkillIndex'] = {}
+
+    def __init__(self, registry: SkillRegistry):
+        self.registry = registry
+
+        # Map lowercase term / alias -> skill ID
+        self.term_ids: Dict[str, int] = registry.terms()
+
+        # Shorter terms that share a start with a longer term, e.g.
+        # "oracle" inside "oracle sql". The regex only reports the longest
+        # term per start position, so these are added back from this table.
+        self.nested_prefixes: Dict[str, List[str]] = {}
+        for term in self.term_ids:
+            self.nested_prefixes[term] = [
+                term[:i] for i in range(1, len(term))
+                if term[:i] in self.term_ids and not _is_word_char(term[i])
+            ]
+
+        self.pattern = self._compile(self.term_ids.keys())
+
+    @classmethod
+    def for_tech_skills(cls) -> 'SkillIndex':
+        """Shared index over Config.TECH_SKILLS"""
+        if 'tech' not in cls._shared:
+            cls._shared['tech'] = cls(SkillRegistry.for_tech_skills())
+        return cls._shared['tech']
+
+    @classmethod
+    def for_soft_skills(cls) -> 'SkillIndex':
+        """Shared index over Config.SOFT_SKILLS"""
+        if 'soft' not in cls._shared:
+            cls._shared['soft'] = cls(SkillRegistry.for_soft_skills())
+        return cls._shared['soft']
+
+    @staticmethod
+    def _trie_pattern(node: Dict) -> str:
+        """Render a trie node as a regex that prefers the longest term"""
+        branches = [
+            re.escape(char) + SkillIndex._trie_pattern(child)
+            for char, child in sorted(node.items()) if char != ''
+        ]
+        if not branches:
+            return ''
+
+        terminal = '' in node
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if terminal else group
+
+    def _compile(self, terms: Iterable[str]):
+        """Compile all terms into one trie-shaped alternation"""
+        trie: Dict = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        if not trie:
+            return None
+
+        # Zero-width lookahead so overlapping terms at later positions are
+        # still reported ("sql" inside "oracle sql")
+        body = self._trie_pattern(trie)
+        return re.compile(r'(?<!\w)(?=(' + body + r')(?!\w))', re.IGNORECASE)
+
+    def scan_ids(self, text: str) -> Dict[int, Dict[str, Any]]:
+        """Return every skill hit as {skill_id: {"count": n, "spans": [(start, end)]}}"""
+        hits: Dict[int, Dict[str, Any]] = {}
+        if not text or self.pattern is None:
+            return hits
+
+        for match in self.pattern.finditer(text):
+            start, end = match.span(1)
+            term = match.group(1).lower()
+            if term not in self.term_ids:
+                continue
+            spans: List[Tuple[str, int, int]] = [(term, start, end)]
+            spans.extend(
+                (prefix, start, start + len(prefix))
+                for prefix in self.nested_prefixes.get(term, [])
+            )
+
+            for hit_term, hit_start, hit_end in spans:
+                skill_id = self.term_ids[hit_term]
+                hit = hits.setdefault(skill_id, {"count": 0, "spans": []})
+                # An alias inside a longer spelling of the same skill
+                # ("spark" in "apache spark") is one mention, not two
+                if hit["spans"] and hit_start < hit["spans"][-1][1]:
+                    continue
+                hit["count"] += 1
+                hit["spans"].append((hit_start, hit_end))
+
+        return hits
+
+    def scan(self, text: str) -> Dict[str, Dict[str, Any]]:
+        """Return every skill hit as {skill: {"count": n, "spans": [(start, end)]}}"""
+        names = self.registry.names
+        return {names[skill_id]: hit for skill_id, hit in self.scan_ids(text).items()}
+
+    def extract_bits(self, text: str) -> int:
+        """Return the skills mentioned in text as a registry bitset"""
+        bits = 0
+        for skill_id in self.scan_ids(text):
+            bits |= 1 << skill_id
+        return bits
+
+    def extract(self, text: str) -> Set[str]:
+        """Return the set of canonical skills mentioned in text"""
+        return set(self.scan(text))
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Return how many times each canonical skill is mentioned in text"""
+        return {skill: hit["count"] for skill, hit in self.scan(text).items()}
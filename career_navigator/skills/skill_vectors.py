@@ -0,0 +1,254 @@
+"""
+Skill Vectors - Normalized word-vector embeddings of the skill dictionary for soft matching
+
+Build the vectors once (run from the career_navigator directory):
+    python skills/skill_vectors.py
+"""
+
+import json
+import os
+import shutil
+import time
+from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+from skills.registry import SkillRegistry
+
+
+class SkillVectorIndex:
+    """Unit-length embedding of every dictionary skill plus its nearest skills
+
+    Row i of vectors.npy is the spaCy word vector of registry skill i (the
+    mean over its tokens, so "Machine Learning" works), scaled to unit length;
+    skills without a vector get a zero row. The matrix is memory-mapped, so
+    opening the index costs nothing until rows are read.
+
+    knn_ids / knn_sims hold, per skill, its k most similar other skills
+    with cosine similarity of at least min_similarity (-1 pads shorter
+    lists). Soft matching only gives partial credit along these edges:
+    a required skill the user lacks earns the best similarity among the
+    user's skills that list it as a neighbour. Exact matches earn 1.
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_dir: Path = None, registry: SkillRegistry = None):
+        self.index_dir = Path(index_dir or Config.SKILL_VECTORS_DIR)
+        self.registry = registry or SkillRegistry.for_tech_skills()
+        meta = json.loads((self.index_dir / "meta.json").read_text(encoding='utf-8'))
+        if meta.get("version") != self.VERSION:
+            raise ValueError(f"Skill vector index version {meta.get('version')} is not supported, rebuild it")
+
+        # Vectors are numbered by registry ID, so they go stale when the skill
+        # dictionary changes
+        if meta["skills"] != self.registry.names[:self.registry.dictionary_size]:
+            raise ValueError("Skill vector index was built for a different skill dictionary, rebuild it")
+
+        self.meta = meta
+        self.size = len(meta["skills"])
+        self.min_similarity = meta["min_similarity"]
+        load = lambda name: np.load(self.index_dir / f"{name}.npy", mmap_mode='r')
+        self.vectors = load("vectors")
+        self.knn_ids, self.knn_sims = load("knn_ids"), load("knn_sims")
+        self._links: Optional[List[Dict[int, float]]] = None
+        self._reverse: Optional[Tuple[List[int], List[Dict[int, float]]]] = None
+
+    @classmethod
+    def load(cls, index_dir: Path = None,
+             registry: SkillRegistry = None) -> Optional['SkillVectorIndex']:
+        """Open the built vectors, or return None if there are none"""
+        index_dir = Path(index_dir or Config.SKILL_VECTORS_DIR)
+        if not (index_dir / "meta.json").exists():
+            return None
+        return cls(index_dir, registry)
+
+    @classmethod
+    def build(cls, registry: SkillRegistry = None, index_dir: Path = None, nlp=None,
+              k: int = None, min_similarity: float = None) -> 'SkillVectorIndex':
+        """Embed the dictionary skills with the spaCy model and write the index"""
+        registry = registry or SkillRegistry.for_tech_skills()
+        index_dir = Path(index_dir or Config.SKILL_VECTORS_DIR)
+        k = Config.SKILL_KNN_K if k is None else k
+        min_similarity = Config.SKILL_SOFT_MIN_SIMILARITY if min_similarity is None else min_similarity
+
+        if nlp is None:
+            from nlp.model_registry import NLPModelRegistry
+            nlp = NLPModelRegistry.get(Config.SPACY_MODEL, ner_only=True)
+        if len(nlp.vocab.vectors) == 0:
+            print(f"⚠️  {nlp.meta.get('name', 'spaCy model')} has no word vectors, "
+                  f"soft matching needs en_core_web_md or en_core_web_lg")
+
+        print("🔧 Embedding skill dictionary...")
+        start = time.perf_counter()
+
+        skills = registry.names[:registry.dictionary_size]
+        vectors = np.zeros((len(skills), nlp.vocab.vectors_length), dtype=np.float32)
+        for skill_id, skill in enumerate(skills):
+            # Tokenizer only: Doc.vector averages the token vectors
+            doc = nlp.make_doc(skill)
+            if doc.has_vector:
+                vectors[skill_id] = doc.vector
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+        knn_ids, knn_sims = cls._neighbours(vectors, k, min_similarity)
+
+        build_dir = index_dir.with_name(f"{index_dir.name}.build-{os.getpid()}")
+        shutil.rmtree(build_dir, ignore_errors=True)
+        build_dir.mkdir(parents=True)
+        for name, values in (("vectors", vectors), ("knn_ids", knn_ids), ("knn_sims", knn_sims)):
+            np.save(build_dir / f"{name}.npy", values)
+        (build_dir / "meta.json").write_text(json.dumps({
+            "version": cls.VERSION,
+            "skills": skills,
+            "k": k,
+            "min_similarity": min_similarity,
+            "built_at": time.time(),
+        }), encoding='utf-8')
+
+        old_dir = index_dir.with_name(f"{index_dir.name}.old-{os.getpid()}")
+        if index_dir.exists():
+            os.replace(index_dir, old_dir)
+        os.replace(build_dir, index_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+        embedded = int((norms > 0).sum())
+        print(f"✅ Embedded {embedded}/{len(skills)} skills, "
+              f"{int((knn_ids >= 0).sum())} neighbour links in {time.perf_counter() - start:.1f}s\n")
+        return cls(index_dir, registry)
+
+    @staticmethod
+    def _neighbours(vectors: np.ndarray, k: int,
+                    min_similarity: float) -> Tuple[np.ndarray, np.ndarray]:
+        """k most similar other skills per skill, above min_similarity"""
+        size = len(vectors)
+        knn_ids = np.full((size, k), -1, dtype=np.int32)
+        knn_sims = np.zeros((size, k), dtype=np.float32)
+        if size < 2 or k == 0:
+            return knn_ids, knn_sims
+
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, -np.inf)
+        take = min(k, size - 1)
+        top = np.argpartition(-similarity, take - 1, axis=1)[:, :take]
+        for row in range(size):
+            # Best first, ties by skill ID
+            candidates = top[row]
+            order = np.lexsort((candidates, -similarity[row, candidates]))
+            keep = [c for c in candidates[order] if similarity[row, c] >= min_similarity]
+            knn_ids[row, :len(keep)] = keep
+            knn_sims[row, :len(keep)] = similarity[row, keep]
+        return knn_ids, knn_sims
+
+    @property
+    def links(self) -> List[Dict[int, float]]:
+        """kNN table as one {neighbour ID: similarity} dict per skill, built on first use"""
+        if self._links is None:
+            self._links = [
+                {int(neighbour): float(sim) for neighbour, sim in zip(ids, sims) if neighbour >= 0}
+                for ids, sims in zip(self.knn_ids.tolist(), self.knn_sims.tolist())
+            ]
+        return self._links
+
+    @property
+    def reverse_links(self) -> Tuple[List[int], List[Dict[int, float]]]:
+        """Per skill, the skills listing it as a neighbour: as a bitset and as {ID: similarity}"""
+        if self._reverse is None:
+            bits = [0] * self.size
+            sims: List[Dict[int, float]] = [{} for _ in range(self.size)]
+            for skill_id, neighbours in enumerate(self.links):
+                for neighbour, sim in neighbours.items():
+                    bits[neighbour] |= 1 << skill_id
+                    sims[neighbour][skill_id] = sim
+            self._reverse = (bits, sims)
+        return self._reverse
+
+    def credits(self, user_ids: List[int], skill_ids: List[int]) -> Tuple[List[float], List[int]]:
+        """Credit of each skill in skill_ids for a user with user_ids
+
+        Returns (credit, via): 1.0 for skills the user has, else the best
+        neighbour similarity (0.0 without one), and the user skill ID that
+        earned it (-1 if none; ties go to the lowest ID). One profile against
+        one job only touches a few dozen table entries, so this stays in
+        plain Python: the user's skills as a bitset ANDed with each missing
+        skill's reverse links leave only the user skills that can give it
+        credit, usually none.
+        """
+        owned = set(user_ids)
+        user_bits = 0
+        for user_id in user_ids:
+            user_bits |= 1 << user_id
+        reverse_bits, reverse_sims = self.reverse_links
+
+        credit, via = [], []
+        for skill_id in skill_ids:
+            best, best_via = (1.0, skill_id) if skill_id in owned else (0.0, -1)
+            linked = reverse_bits[skill_id] & user_bits if best < 1.0 and skill_id < self.size else 0
+            while linked:
+                low = linked & -linked
+                user_id = low.bit_length() - 1
+                linked ^= low
+                sim = reverse_sims[skill_id][user_id]
+                if sim > best:
+                    best, best_via = sim, user_id
+            credit.append(best)
+            via.append(best_via)
+        return credit, via
+
+    def expand(self, user_skills: sparse.csr_matrix) -> sparse.csr_matrix:
+        """Per-user credit for every skill: 1 where owned, best neighbour similarity elsewhere
+
+        user_skills is a binary users x skills matrix over registry IDs. The
+        result has the same shape, so soft matched counts against a
+        required-skill matrix R are one product, expand(U) @ R.T.
+        """
+        user_skills = user_skills.tocsr()
+        num_users, num_skills = user_skills.shape
+        rows = np.repeat(np.arange(num_users), np.diff(user_skills.indptr))
+        owned = user_skills.indices
+
+        embedded = owned < self.size
+        neighbours = np.asarray(self.knn_ids[owned[embedded]])
+        sims = np.asarray(self.knn_sims[owned[embedded]], dtype=np.float64)
+        linked = neighbours >= 0
+
+        all_rows = np.concatenate([rows, np.repeat(rows[embedded], linked.sum(axis=1))])
+        all_cols = np.concatenate([owned, neighbours[linked]])
+        all_vals = np.concatenate([np.ones(len(owned)), sims[linked]])
+
+        # Keep the largest credit of each (user, skill)
+        order = np.lexsort((-all_vals, all_cols, all_rows))
+        all_rows, all_cols, all_vals = all_rows[order], all_cols[order], all_vals[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (all_rows[1:] != all_rows[:-1]) | (all_cols[1:] != all_cols[:-1])
+
+        return sparse.csr_matrix(
+            (all_vals[first], (all_rows[first], all_cols[first])),
+            shape=(num_users, num_skills),
+        )
+
+    def nearest(self, name: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Most similar dictionary skills to a skill name (for explanations)"""
+        skill_id = self.registry.id_of(name)
+        if skill_id is None or skill_id >= self.size:
+            return []
+        return [
+            {"skill": self.registry.names[neighbour], "similarity": round(float(sim), 3)}
+            for neighbour, sim in zip(self.knn_ids[skill_id][:k], self.knn_sims[skill_id][:k])
+            if neighbour >= 0
+        ]
+
+
+def main():
+    SkillVectorIndex.build()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Result storage for Career Navigator
+"""
+
+from .result_store import ResultStore, write_json_atomic
+
+__all__ = ['ResultStore', 'write_json_atomic']
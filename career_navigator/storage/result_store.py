@@ -0,0 +1,230 @@
+"""
+Result Store - Append-only, segmented JSONL log of analysis runs with an offset index
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: every process writes segments of its own
+    fcntl = None
+
+# Import config
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import Config
+
+
+def write_json_atomic(path: Path, data: Any, indent: int = 2):
+    """Write JSON to a temp file and rename it over path, so readers never see half a file"""
+    path = Path(path)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class ResultStore:
+    """Keep every analysis run instead of overwriting the previous one
+    
+    Runs are appended as compact one-line JSON records to segment files.
+    A writing process holds an exclusive flock on the segment it appends to,
+    so concurrent workers never write to the same file. On its first write a
+    process takes over an existing segment that is not full and not locked
+    by another writer, so short-lived processes (one CLI run each) keep
+    filling the same segment instead of leaving one tiny segment each. A
+    segment is closed and another one used once it grows past
+    segment_max_bytes.
+    
+    Next to every segment, an .idx file lists (run_id, candidate, offset,
+    length) for each record. The index line is written only after the
+    record itself is on disk, so a crash can leave at most an unindexed tail
+    that readers ignore. Loading the .idx files gives O(1) lookups by run id
+    and by candidate without scanning the segments; .idx files whose size
+    has not changed since they were last read are not opened again.
+    """
+    
+    def __init__(self, root: Path = None, segment_max_bytes: int = None):
+        self.root = Path(root or Config.RESULT_STORE_DIR)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes or Config.RESULT_SEGMENT_MAX_BYTES
+        
+        # Writer state (one open segment per process)
+        self._lock = threading.Lock()
+        self._writer_pid: Optional[int] = None
+        self._segment: Optional[Path] = None
+        self._segment_fd: Optional[int] = None
+        self._index_fd: Optional[int] = None
+        self._segment_size = 0
+        
+        # Reader state: run_id -> (segment name, offset, length)
+        self._offsets: Dict[str, Tuple[str, int, int]] = {}
+        self._by_candidate: Dict[str, List[str]] = {}
+        self._index_read: Dict[str, int] = {}   # bytes of each .idx file already loaded
+    
+    def _open_segment(self, need_bytes: int):
+        """Take over a non-full segment no other process is writing, or start a new one"""
+        self._close_segment()
+        # Read access too, to check for a half-written last line
+        flags = os.O_RDWR | os.O_CREAT | os.O_APPEND
+        
+        candidates = []
+        if fcntl is not None:
+            candidates = [path for path in sorted(self.root.glob("seg-*.jsonl"))
+                          if path.stat().st_size + need_bytes <= self.segment_max_bytes]
+        for path in candidates:
+            fd = os.open(path, flags, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+            size = os.fstat(fd).st_size
+            if size + need_bytes > self.segment_max_bytes:
+                os.close(fd)
+                continue
+            self._segment, self._segment_fd = path, fd
+            break
+        else:
+            name = f"seg-{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            self._segment = self.root / f"{name}.jsonl"
+            self._segment_fd = os.open(self._segment, flags, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._segment_fd, fcntl.LOCK_EX)
+        
+        self._index_fd = os.open(self._segment.with_suffix(".idx"), flags, 0o644)
+        # A crashed writer may have left half a line; start ours on a fresh one
+        for fd in (self._segment_fd, self._index_fd):
+            self._end_line(fd)
+        self._segment_size = os.fstat(self._segment_fd).st_size
+        self._writer_pid = os.getpid()
+    
+    @staticmethod
+    def _end_line(fd: int):
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            os.write(fd, b"\n")
+    
+    def _close_segment(self):
+        # Descriptors inherited from a parent process are not ours to close
+        # (closing the segment also releases its lock)
+        if self._writer_pid == os.getpid():
+            for fd in (self._segment_fd, self._index_fd):
+                if fd is not None:
+                    os.close(fd)
+        self._segment = self._segment_fd = self._index_fd = None
+    
+    def append(self, record: Dict[str, Any], candidate: str = None) -> str:
+        """Append one run and return its run id"""
+        run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:12]}"
+        line = json.dumps(
+            {"run_id": run_id, "candidate": candidate, "created_at": time.time(), **record},
+            ensure_ascii=False, separators=(',', ':'),
+        ).encode('utf-8') + b"\n"
+        
+        with self._lock:
+            if (self._writer_pid != os.getpid() or self._segment_fd is None
+                    or self._segment_size + len(line) > self.segment_max_bytes):
+                self._open_segment(len(line))
+            
+            offset = self._segment_size
+            os.write(self._segment_fd, line)
+            os.fsync(self._segment_fd)
+            self._segment_size += len(line)
+            
+            entry = json.dumps({
+                "run_id": run_id, "candidate": candidate, "offset": offset, "length": len(line),
+            }, separators=(',', ':')).encode('utf-8') + b"\n"
+            os.write(self._index_fd, entry)
+            os.fsync(self._index_fd)
+            
+            self._add_to_index(run_id, candidate, self._segment.name, offset, len(line))
+        return run_id
+    
+    def close(self):
+        with self._lock:
+            self._close_segment()
+    
+    def _add_to_index(self, run_id: str, candidate: Optional[str], segment: str,
+                      offset: int, length: int):
+        if run_id in self._offsets:
+            return
+        self._offsets[run_id] = (segment, offset, length)
+        if candidate is not None:
+            self._by_candidate.setdefault(candidate, []).append(run_id)
+    
+    def refresh_index(self):
+        """Load index entries written since the last call (by any process)"""
+        with self._lock:
+            for index_path in sorted(self.root.glob("seg-*.idx")):
+                segment = index_path.with_suffix(".jsonl").name
+                already = self._index_read.get(index_path.name, 0)
+                try:
+                    if index_path.stat().st_size == already:
+                        continue
+                except OSError:
+                    continue
+                with open(index_path, 'rb') as f:
+                    f.seek(already)
+                    for line in f:
+                        # A line without its newline is still being written
+                        if not line.endswith(b"\n"):
+                            break
+                        already += len(line)
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        self._add_to_index(entry["run_id"], entry.get("candidate"), segment,
+                                           entry["offset"], entry["length"])
+                self._index_read[index_path.name] = already
+    
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return one run by id, or None"""
+        if run_id not in self._offsets:
+            self.refresh_index()
+        location = self._offsets.get(run_id)
+        if location is None:
+            return None
+        
+        segment, offset, length = location
+        with open(self.root / segment, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+    
+    def runs_for(self, candidate: str) -> List[str]:
+        """Run ids recorded for a candidate"""
+        self.refresh_index()
+        return list(self._by_candidate.get(candidate, []))
+    
+    def latest(self, candidate: str) -> Optional[Dict[str, Any]]:
+        """Most recent run for a candidate"""
+        run_ids = self.runs_for(candidate)
+        if not run_ids:
+            return None
+        return max((self.get(run_id) for run_id in run_ids), key=lambda r: r["created_at"])
+    
+    def iter_runs(self) -> Iterator[Dict[str, Any]]:
+        """Every indexed run, segment by segment"""
+        self.refresh_index()
+        for run_id in list(self._offsets):
+            yield self.get(run_id)
+    
+    def stats(self) -> Dict[str, Any]:
+        self.refresh_index()
+        segments = list(self.root.glob("seg-*.jsonl"))
+        return {
+            "runs": len(self._offsets),
+            "candidates": len(self._by_candidate),
+            "segments": len(segments),
+            "size_bytes": sum(path.stat().st_size for path in segments),
+        }